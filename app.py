@@ -1,133 +1,183 @@
-from flask import Flask, render_template, request, jsonify, session
+from flask import Flask, render_template, request, jsonify, session, Response, stream_with_context
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
 import random
+import secrets
 import time
 from connect4.game import (
     create_board, drop_piece, is_valid_location,
-    get_next_open_row, winning_move, get_valid_locations,
+    get_next_open_row, winning_move, get_valid_locations, get_valid_locations_mask,
+    board_to_masks, board_from_masks, BOARD_MASK, BOTTOM_BIT, has_win,
     PLAYER_HUMAN, PLAYER_AI, COLS, ROWS
 )
-from connect4.agent import get_best_move
+from connect4.agent import get_best_move, get_best_move_root_parallel
 from connect4.agent_bitboard import get_best_move_bitboard  # Bitboard-optimized Minimax
-from connect4.mcts_agent import get_best_move_mcts, MCTS_ITERATIONS
 from connect4.mcts_agent_v2 import get_best_move_mcts_v2, MCTS_ITERATIONS as MCTS_ITERATIONS_V2  # Production MCTS
+from connect4.opening_book import load_opening_book, opening_move
 
 app = Flask(__name__)
 app.secret_key = 'connect4-secret-key'  # Session için gerekli
 
 # AI Configuration
-USE_BITBOARD_MINIMAX = False  # Set to True to use bitboard-optimized minimax
-
-# AI derinliği - Dinamik Yönetim
-AI_DEPTH_MIN = 4   # Minimum depth
-AI_DEPTH_MAX = 12  # Maximum depth
-AI_DEPTH_DEFAULT = 6  # Başlangıç depth'i
-TARGET_THINKING_TIME = 4.0  # Hedef düşünme süresi (saniye)
-DEPTH_ADJUSTMENT_THRESHOLD = 2.5  # Depth değiştirmek için eşik (saniye)
-MIN_ROUNDS_FOR_INCREASE = 4  # Depth artırmak için minimum tur sayısı
-MAX_RUNTIME_THRESHOLD = 6.0  # Depth azaltmak için maksimum süre (saniye)
-
-def adjust_depth_by_runtime(current_depth, actual_time, round_count, target_time=TARGET_THINKING_TIME):
+USE_BITBOARD_MINIMAX = True  # Bitboard-optimized minimax is the default hot path
+
+# AI derinliği - Iteratif Derinleşme
+AI_DEPTH_MAX = 12  # Maksimum arama derinliği
+TARGET_THINKING_TIME = 4.0  # Hamle başına zaman bütçesi (saniye)
+
+# Açılış kitabı: ilk ~8 ply için aramayı tamamen atlar
+# (dosya yoksa boş dict gelir ve sadece boş-tahta merkez kuralı çalışır)
+OPENING_BOOK = load_opening_book()
+
+
+def _search_best_move(board, depth, developer_mode=False):
+    """Aktif minimax implementasyonuyla tek bir sabit-derinlik arama."""
+    if USE_BITBOARD_MINIMAX:
+        return get_best_move_bitboard(board, PLAYER_AI, depth, developer_mode=developer_mode)
+    # 2D agent: kök çocukları ayrı process'lerde paralel aranır
+    return get_best_move_root_parallel(board, PLAYER_AI, depth, developer_mode=developer_mode)
+
+
+def iterative_deepening_best_move(board, developer_mode=False,
+                                  time_budget=TARGET_THINKING_TIME,
+                                  max_depth=AI_DEPTH_MAX):
     """
-    Gerçek çalışma süresine göre depth'i dinamik olarak ayarla.
-    
-    Kurallar:
-    1. DEPTH ARTIRMA:
-       - runtime < (target_time - 2.5) VE
-       - En az 4 tur oynandı
-       → Depth +1
-    
-    2. DEPTH AZALTMA:
-       - runtime > (target_time + 2.5) VE
-       - runtime > 6 saniye
-       → Depth -1
-    
-    3. Aksi halde depth sabit kalır
-    
-    Args:
-        current_depth: Mevcut search depth
-        actual_time: Gerçekleşen düşünme süresi (saniye)
-        round_count: Oynanan toplam tur sayısı
-        target_time: Hedef düşünme süresi (saniye)
-    
+    Iteratif derinleşme: depth 1, 2, 3, ... diye ara; bütçe dolunca
+    tamamlanan son derinliğin sonucunu döndür.
+
+    Sığ aramaların TT girdileri derin aramalara hamle sıralaması olarak
+    geri döner, bu yüzden sığ turların maliyeti pratikte geri kazanılır.
+    Reaktif depth ayarı yerine her hamle bütçeyi kendisi doldurur.
+
     Returns:
-        (yeni_depth, değişim_mesajı) tuple
+        (best_col, column_scores, reached_depth)
     """
-    lower_threshold = target_time - DEPTH_ADJUSTMENT_THRESHOLD  # 4.0 - 2.5 = 1.5s
-    upper_threshold = target_time + DEPTH_ADJUSTMENT_THRESHOLD  # 4.0 + 2.5 = 6.5s
-    
-    change_msg = None
-    
-    # KURAL 1: DEPTH ARTIRMA
-    if actual_time < lower_threshold and round_count >= MIN_ROUNDS_FOR_INCREASE:
-        new_depth = min(current_depth + 1, AI_DEPTH_MAX)
-        change_msg = f"⚡ Fast ({actual_time:.2f}s < {lower_threshold:.1f}s, Round≥{MIN_ROUNDS_FOR_INCREASE}) → +1 depth"
-        print(f"{change_msg}: {current_depth} → {new_depth}")
-        return new_depth, change_msg
-    
-    # KURAL 2: DEPTH AZALTMA (ama 6'nın altına düşmez)
-    elif actual_time > upper_threshold and actual_time > MAX_RUNTIME_THRESHOLD:
-        new_depth = max(current_depth - 1, AI_DEPTH_DEFAULT)  # AI_DEPTH_DEFAULT = 6
-        change_msg = f"🐌 Slow ({actual_time:.2f}s > {upper_threshold:.1f}s AND > {MAX_RUNTIME_THRESHOLD:.1f}s) → -1 depth"
-        print(f"{change_msg}: {current_depth} → {new_depth}")
-        return new_depth, change_msg
-    
-    # KURAL 3: DEPTH SABİT
-    else:
-        reason = ""
-        if actual_time < lower_threshold:
-            reason = f"but only {round_count} rounds (need ≥{MIN_ROUNDS_FOR_INCREASE})"
-        elif actual_time > upper_threshold:
-            reason = f"but runtime {actual_time:.2f}s ≤ {MAX_RUNTIME_THRESHOLD:.1f}s"
-        else:
-            reason = f"within acceptable range ({lower_threshold:.1f}s - {upper_threshold:.1f}s)"
-        
-        change_msg = f"✅ Keep depth={current_depth} ({reason})"
-        print(f"✅ AI runtime {actual_time:.2f}s → Keeping depth: {current_depth} ({reason})")
-        return current_depth, change_msg
+    start = time.time()
+    best_col = None
+    column_scores = None
+    reached_depth = 0
+
+    for d in range(1, max_depth + 1):
+        col, scores = _search_best_move(board, d, developer_mode=developer_mode)
+        if col is not None:
+            best_col = col
+            column_scores = scores
+            reached_depth = d
+        if time.time() - start >= time_budget:
+            break
+
+    return best_col, column_scores, reached_depth
+
+
+# CPU-bound arama Flask worker'ını bloklamasın diye ayrı process'lerde
+# koşar; process'ler ilk submit'te başlar ve istekler arasında hayatta
+# kalır (her worker kendi TT'sini turlar boyunca biriktirir).
+EXECUTOR = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+
+def _search_job(board, developer_mode, use_bitboard, fixed_depth=None):
+    """Worker process'te çalışan arama işi (picklable top-level fonksiyon).
+
+    use_bitboard bayrağı parametre olarak taşınır; toggle-bitboard ana
+    process'teki global'i değiştirir, worker'lar bunu submit anında alır.
+    """
+    global USE_BITBOARD_MINIMAX
+    USE_BITBOARD_MINIMAX = use_bitboard
+    if fixed_depth is not None:
+        col, scores = _search_best_move(board, fixed_depth, developer_mode=developer_mode)
+        return col, scores, fixed_depth
+    return iterative_deepening_best_move(board, developer_mode=developer_mode)
 
 def create_game_session(first_player=None):
-    """Yeni bir oyun oturumu oluşturur"""
-    board = create_board()
+    """Yeni bir oyun oturumu oluşturur.
+
+    Board, session cookie'sinde iki bitmask olarak tutulur ({'p','o'}):
+    42 hücrelik JSON listesi yerine 16 byte'lık iki int — daha küçük
+    cookie, daha ucuz imzalama/serialize.
+    """
     if first_player is None:
-        turn = random.choice([PLAYER_HUMAN, PLAYER_AI])
+        # Tek rastgele bit yeter; liste + random.choice'a gerek yok
+        turn = PLAYER_HUMAN if random.getrandbits(1) else PLAYER_AI
     else:
         turn = first_player
     return {
-        'board': board,
+        'board': board_to_masks(create_board()),
         'turn': turn,
         'game_over': False,
         'winner': None,
         'last_move': None,
-        'move_count': 0,  # Hamle sayacı
-        'current_depth': AI_DEPTH_DEFAULT  # Başlangıç depth'i
+        'move_count': 0  # Hamle sayacı
     }
 
+# Server-side oyun deposu: cookie artık tüm oyun durumunu değil, sadece
+# kısa bir oyun ID'si taşıyor. Böylece her request'te yüzlerce byte'lık
+# payload'un imzalanması/serialize edilmesi ortadan kalkıyor. (Harici bir
+# Flask-Session/redis bağımlılığı eklemeden, tek process'lik dev server
+# için process içi dict yeterli.)
+GAME_STORE = {}
+
+# Oyun ID'si -> devam eden AI araması (Future). İnsan hamlesi işlenir
+# işlenmez arama worker'a verilir; client animasyonu oynatırken arama
+# çoktan koşuyor olur. Sonucu /api/ai-move veya /api/ai-stream tüketir.
+PENDING_AI = {}
+
+
+def get_game(create_if_missing=True, first_player=None):
+    """Cookie'deki oyun ID'sine karşılık gelen oyun durumunu getirir.
+
+    Oyun yoksa (ve create_if_missing ise) yeni bir oturum yaratır ve
+    cookie'ye sadece ID yazar.
+    """
+    gid = session.get('game_id')
+    game = GAME_STORE.get(gid)
+    if game is None and create_if_missing:
+        gid = secrets.token_urlsafe(16)
+        session['game_id'] = gid
+        session.modified = True
+        game = create_game_session(first_player)
+        GAME_STORE[gid] = game
+    return game
+
+
+def set_game(game):
+    """Mevcut oturumun oyun durumunu server-side depoda günceller."""
+    gid = session.get('game_id')
+    if gid is None:
+        gid = secrets.token_urlsafe(16)
+        session['game_id'] = gid
+        session.modified = True
+    GAME_STORE[gid] = game
+    return game
+
+
 def board_to_json(board):
-    """Board'u JSON formatına çevirir"""
-    return [[cell for cell in row] for row in board]
+    """Board'u JSON formatına çevirir.
+
+    Session'daki board zaten düz int listelerinden oluşuyor ve jsonify
+    hemen serialize ediyor; her response'ta 6x7'lik yeni bir kopya
+    üretmeye gerek yok.
+    """
+    return board
 
 @app.route('/')
 def index():
     """Ana sayfa - oyun arayüzü"""
-    if 'game' not in session:
-        session['game'] = create_game_session()
-        session.modified = True
+    get_game()
     return render_template('index.html')
 
 @app.route('/api/game', methods=['GET'])
 def get_game_state():
     """Mevcut oyun durumunu döndürür"""
-    if 'game' not in session:
-        session['game'] = create_game_session()
-    
-    game = session['game']
+    game = get_game()
+    board = board_from_masks(game['board'])
     return jsonify({
-        'board': board_to_json(game['board']),
+        'board': board_to_json(board),
         'turn': game['turn'],
         'game_over': game['game_over'],
         'winner': game['winner'],
         'last_move': game['last_move'],
-        'valid_columns': get_valid_locations(game['board'])
+        'valid_columns': get_valid_locations(board)
     })
 
 @app.route('/api/move', methods=['POST'])
@@ -135,13 +185,10 @@ def make_move():
     """Oyuncu hamlesi yapar"""
     data = request.get_json()
     col = int(data['column'])
-    
-    if 'game' not in session:
-        session['game'] = create_game_session()
-    
-    game = session['game']
-    board = game['board']
-    
+
+    game = get_game()
+    board = board_from_masks(game['board'])
+
     # move_count yoksa ekle
     if 'move_count' not in game:
         game['move_count'] = 0
@@ -159,135 +206,219 @@ def make_move():
         row = get_next_open_row(board, col)
         drop_piece(board, row, col, PLAYER_HUMAN)
         game['last_move'] = {'player': PLAYER_HUMAN, 'row': row, 'col': col}
-        game['move_count'] = game['move_count'] + 1  # Hamle sayacını artır
-        
-        # Kazanma kontrolü
-        if winning_move(board, PLAYER_HUMAN):
+
+        # Kazanma kontrolü (tek tarama: sonuçları lokallerde tut ve tekrar kullan)
+        masks = board_to_masks(board)
+        won = winning_move(board, PLAYER_HUMAN)
+        if won:
             game['game_over'] = True
             game['winner'] = PLAYER_HUMAN
-        elif len(get_valid_locations(board)) == 0:
+        elif masks['o'] == BOARD_MASK:
+            # Tahta dolu: tek int karşılaştırması, sütun taraması yok
             game['game_over'] = True
             game['winner'] = None  # Beraberlik
         else:
             game['turn'] = PLAYER_AI
-    
-    session['game'] = game
-    session.modified = True
-    
+
+        # Hamle sayacı = doluluk mask'inin popcount'u (donanım POPCNT)
+        game['move_count'] = masks['o'].bit_count()
+        game['board'] = masks
+        valid_cols = list(get_valid_locations_mask(masks['o']))
+
+        # Sıra AI'ye geçtiyse aramayı HEMEN başlat: response dönerken ve
+        # client taş animasyonunu oynatırken arama arka planda koşar.
+        # (Açılış kitabı kapsamındaysa aramaya gerek yok.)
+        if not game['game_over'] and game['turn'] == PLAYER_AI:
+            gid = session.get('game_id')
+            if gid is not None and opening_move(OPENING_BOOK, board, game['move_count']) is None:
+                old = PENDING_AI.pop(gid, None)
+                if old is not None:
+                    old.cancel()
+                PENDING_AI[gid] = EXECUTOR.submit(
+                    _search_job, board, False, USE_BITBOARD_MINIMAX, None
+                )
+    else:
+        valid_cols = get_valid_locations(board)
+        game['board'] = board_to_masks(board)
+
     # SADECE kullanıcı hamlesini döndür - AI hamlesi ayrı endpoint'ten gelecek
     response_data = {
-        'board': board_to_json(game['board']),
+        'board': board_to_json(board),
         'turn': game['turn'],
         'game_over': game['game_over'],
         'winner': game['winner'],
         'last_move': game['last_move'],
-        'valid_columns': get_valid_locations(game['board']),
+        'valid_columns': valid_cols,
         'move_count': game.get('move_count', 0)
     }
     
     return jsonify(response_data)
 
-@app.route('/api/ai-move', methods=['POST'])
-def make_ai_move():
-    """AI hamlesini yapar - DİNAMİK DEPTH ile"""
-    import time
-    
-    if 'game' not in session:
-        return jsonify({'error': 'Oyun oturumu bulunamadı'}), 400
-    
-    data = request.get_json() or {}
-    developer_mode = data.get('developer_mode', False)  # Developer mode kontrolü
-    
-    game = session['game']
-    board = game['board']
-    
-    if game['game_over'] or game['turn'] != PLAYER_AI:
-        return jsonify({'error': 'AI hamle yapamaz'}), 400
-    
-    # Mevcut depth'i al veya başlangıç değerini kullan
-    current_depth = game.get('current_depth', AI_DEPTH_DEFAULT)
-    
-    # Toplam tur sayısını hesapla (move_count / 2 = tur sayısı)
-    move_count = game.get('move_count', 0)
-    round_count = (move_count + 1) // 2  # Her tur 2 hamle (insan + AI)
-    
-    # Kullanıcıdan gelen depth varsa kullan (eski davranış - artık yok)
-    if 'depth' in data:
-        depth = int(data['depth'])
-    else:
-        depth = current_depth  # Session'dan gelen depth'i kullan
-    
-    # AI hamlesini yap (developer mode ile veya olmadan)
-    column_scores = None
+def _forced_move(board):
+    """Aramasız karar verilebilen pozisyonlar için ucuz ön filtre.
+
+    (a) Tek geçerli sütun varsa onu oyna; (b) AI'nin anında kazandıran
+    hamlesi varsa oyna; (c) insanın anında kazanacağı hamle varsa blokla.
+    En kötü durumda ~14 adet bitmask testi — depth-12 ağaca karşı bedava.
+    Döndürdüğü None "zorunlu hamle yok, arama çalışsın" demektir.
+    """
+    valid = get_valid_locations(board)
+    if len(valid) == 1:
+        return valid[0]
+
+    masks = board_to_masks(board)
+    occ = masks['o']
+    ai_mask = masks['p']
+    human_mask = occ ^ ai_mask
+
+    # occ + kolonun taban biti = o kolondaki en alttaki boş hücrenin biti
+    # (dolu hücreler boyunca carry yukarı taşar)
+    for player_mask in (ai_mask, human_mask):  # önce kazan, sonra blokla
+        for col in valid:
+            drop_bit = (occ + (1 << BOTTOM_BIT[col])) & ~occ
+            if has_win(player_mask | drop_bit):
+                return col
+    return None
+
+
+def _run_ai_turn(game, developer_mode=False, fixed_depth=None):
+    """AI hamlesini hesaplar, oyuna uygular ve response dict'ini döndürür.
+
+    /api/ai-move (POST) ve /api/ai-stream (SSE) ortak kullanır. İnsan
+    hamlesi sırasında başlatılmış bir arama (PENDING_AI) varsa yeniden
+    aramak yerine onun sonucu beklenir.
+    """
+    board = board_from_masks(game['board'])
+
+    # AI hamlesini yap: iteratif derinleşme, zaman bütçesiyle
     start_time = time.time()
-    
+
     # Debug: Bitboard kullanımını logla
     algo_name = "BITBOARD" if USE_BITBOARD_MINIMAX else "2D_ARRAY"
-    print(f"[AI Move] Using {algo_name} at depth {depth}")
-    
-    if developer_mode:
-        if USE_BITBOARD_MINIMAX:
-            ai_col, column_scores = get_best_move_bitboard(board, PLAYER_AI, depth, developer_mode=True)
-        else:
-            ai_col, column_scores = get_best_move(board, PLAYER_AI, depth, developer_mode=True)
+    print(f"[AI Move] Using {algo_name} with iterative deepening")
+
+    pending = PENDING_AI.pop(session.get('game_id'), None)
+
+    instant_col = None
+    if not developer_mode:
+        # Zorunlu hamle (tek sütun / anında kazanç / zorunlu blok)
+        if fixed_depth is None:
+            instant_col = _forced_move(board)
+        # Açılış kitabı: arama maliyeti sıfır
+        if instant_col is None:
+            instant_col = opening_move(OPENING_BOOK, board, game.get('move_count', 0))
+
+    if instant_col is not None:
+        if pending is not None:
+            pending.cancel()
+        ai_col, column_scores, reached_depth = instant_col, None, 0
     else:
-        if USE_BITBOARD_MINIMAX:
-            ai_col, _ = get_best_move_bitboard(board, PLAYER_AI, depth, developer_mode=False)
+        if pending is not None and not developer_mode and fixed_depth is None:
+            # İnsan hamlesinde başlatılan arama: sonuç muhtemelen hazır
+            future = pending
         else:
-            ai_col = get_best_move(board, PLAYER_AI, depth, developer_mode=False)
+            # Parametreler uyuşmuyor (dev mode / sabit depth): taze arama
+            if pending is not None:
+                pending.cancel()
+            # Aramayı worker process'e ver: Flask worker'ı bloklanmaz,
+            # birden çok oyun gerçekten paralel koşabilir
+            future = EXECUTOR.submit(
+                _search_job, board, developer_mode, USE_BITBOARD_MINIMAX, fixed_depth
+            )
+        ai_col, column_scores, reached_depth = future.result()
     thinking_time = time.time() - start_time
-    
-    print(f"[AI Move] Completed in {thinking_time:.3f}s, chose column {ai_col}")
-    
-    # ⚡ RUNTIME-BASED DYNAMIC DEPTH ADJUSTMENT (YENİ KURALLAR)
-    new_depth, depth_change_msg = adjust_depth_by_runtime(depth, thinking_time, round_count, TARGET_THINKING_TIME)
-    
+
+    print(f"[AI Move] Completed in {thinking_time:.3f}s at depth {reached_depth}, chose column {ai_col}")
+
     ai_row = get_next_open_row(board, ai_col)
     drop_piece(board, ai_row, ai_col, PLAYER_AI)
     game['last_move'] = {'player': PLAYER_AI, 'row': ai_row, 'col': ai_col}
-    game['move_count'] = game.get('move_count', 0) + 1  # Hamle sayacını artır
-    
-    # Update depth AFTER move count increment to avoid double counting
-    game['current_depth'] = new_depth
-    
-    # Kazanma kontrolü
-    if winning_move(board, PLAYER_AI):
+
+    # Kazanma kontrolü (tek tarama yeterli: sonucu lokalde tut)
+    masks = board_to_masks(board)
+    won = winning_move(board, PLAYER_AI)
+    if won:
         game['game_over'] = True
         game['winner'] = PLAYER_AI
-    elif len(get_valid_locations(board)) == 0:
+    elif masks['o'] == BOARD_MASK:
         game['game_over'] = True
         game['winner'] = None
     else:
         game['turn'] = PLAYER_HUMAN
-    
-    session['game'] = game
-    session.modified = True
-    
+
+    # Hamle sayacı = doluluk mask'inin popcount'u
+    game['move_count'] = masks['o'].bit_count()
+    game['board'] = masks
+    valid_cols = list(get_valid_locations_mask(masks['o']))
+
     response = {
-        'board': board_to_json(game['board']),
+        'board': board_to_json(board),
         'turn': game['turn'],
         'game_over': game['game_over'],
         'winner': game['winner'],
         'last_move': game['last_move'],
-        'valid_columns': get_valid_locations(game['board']),
+        'valid_columns': valid_cols,
         'move_count': game.get('move_count', 0),
         'ai_move': {
-            'row': ai_row, 
+            'row': ai_row,
             'col': ai_col,
             'thinking_time': round(thinking_time, 3),
-            'depth': new_depth,  # YENİ depth'i frontend'e gönder
-            'previous_depth': depth,  # Önceki depth
-            'depth_changed': (new_depth != depth),  # Depth değişti mi?
-            'depth_change_msg': depth_change_msg,  # Değişim mesajı
-            'round_count': round_count  # Kaç tur oynandı (debug için)
+            'depth': reached_depth  # Bu hamlede ulaşılan derinlik
         }
     }
     
     # Developer mode ise sütun skorlarını da ekle
     if developer_mode and column_scores:
         response['ai_move']['column_scores'] = {str(k): float(v) if v is not None else None for k, v in column_scores.items()}
-    
-    return jsonify(response)
+
+    return response
+
+
+@app.route('/api/ai-move', methods=['POST'])
+def make_ai_move():
+    """AI hamlesini yapar - DİNAMİK DEPTH ile"""
+    game = get_game(create_if_missing=False)
+    if game is None:
+        return jsonify({'error': 'Oyun oturumu bulunamadı'}), 400
+
+    data = request.get_json() or {}
+    developer_mode = data.get('developer_mode', False)  # Developer mode kontrolü
+
+    if game['game_over'] or game['turn'] != PLAYER_AI:
+        return jsonify({'error': 'AI hamle yapamaz'}), 400
+
+    fixed_depth = int(data['depth']) if 'depth' in data else None
+    return jsonify(_run_ai_turn(game, developer_mode=developer_mode,
+                                fixed_depth=fixed_depth))
+
+
+@app.route('/api/ai-stream')
+def ai_stream():
+    """AI hamlesini SSE olarak döndürür.
+
+    /api/move insan hamlesinden hemen sonra dönerken aramayı worker'a
+    vermiş olur; buradaki stream sadece hazır sonucu bekleyip tek bir
+    event olarak basar. Client tarafı:
+        const es = new EventSource('/api/ai-stream');
+        es.onmessage = (e) => { render(JSON.parse(e.data)); es.close(); };
+    """
+    game = get_game(create_if_missing=False)
+    if game is None:
+        return jsonify({'error': 'Oyun oturumu bulunamadı'}), 400
+
+    developer_mode = request.args.get('developer_mode') == 'true'
+
+    if game['game_over'] or game['turn'] != PLAYER_AI:
+        return jsonify({'error': 'AI hamle yapamaz'}), 400
+
+    def event_stream():
+        # Header'lar hemen gider; hamle hazır olduğunda event olarak akar
+        payload = _run_ai_turn(game, developer_mode=developer_mode)
+        yield f"data: {json.dumps(payload)}\n\n"
+
+    return Response(stream_with_context(event_stream()),
+                    mimetype='text/event-stream')
+
 
 @app.route('/api/reset', methods=['POST'])
 def reset_game():
@@ -301,19 +432,21 @@ def reset_game():
     else:
         first_player = None
     
-    # Yeni oyun başlarken depth'i default değere sıfırla
-    session['game'] = create_game_session(first_player)
-    session['game']['current_depth'] = AI_DEPTH_DEFAULT  # 6'ya resetle
-    session.modified = True
-    
-    game = session['game']
+    # Eski oyundan kalan bir AI araması varsa artık kimse tüketmeyecek
+    stale = PENDING_AI.pop(session.get('game_id'), None)
+    if stale is not None:
+        stale.cancel()
+
+    game = set_game(create_game_session(first_player))
+
+    board = board_from_masks(game['board'])
     return jsonify({
-        'board': board_to_json(game['board']),
+        'board': board_to_json(board),
         'turn': game['turn'],
         'game_over': game['game_over'],
         'winner': game['winner'],
         'last_move': game['last_move'],
-        'valid_columns': get_valid_locations(game['board']),
+        'valid_columns': get_valid_locations(board),
         'move_count': game.get('move_count', 0)
     })
 
@@ -323,41 +456,22 @@ def ai_vs_ai_minimax():
     """
     AI vs AI: Minimax hamlesini yapar
     """
-    if 'game' not in session:
-        session['game'] = create_game_session(PLAYER_AI)
-    
-    game = session['game']
-    board = game['board']
+    game = get_game(first_player=PLAYER_AI)
+    board = board_from_masks(game['board'])
     
     if 'move_count' not in game:
         game['move_count'] = 0
-    if 'current_depth' not in game:
-        game['current_depth'] = AI_DEPTH_DEFAULT
-    
+
     # Oyun bitmiş mi?
     if game['game_over']:
         return jsonify({'error': 'Game is already over'}), 400
     
     # Minimax hamlesi
     minimax_start = time.time()
-    depth = game['current_depth']
-    round_count = game['move_count']
-    
-    if USE_BITBOARD_MINIMAX:
-        minimax_col, column_scores = get_best_move_bitboard(
-            board, 
-            PLAYER_AI, 
-            depth=depth,
-            developer_mode=True
-        )
-    else:
-        minimax_col, column_scores = get_best_move(
-            board, 
-            PLAYER_AI, 
-            depth=depth,
-            developer_mode=True
-        )
-    
+    # Iteratif derinleşme: bütçe dolana kadar derinleş, ulaşılan depth'i raporla
+    minimax_col, column_scores, depth = iterative_deepening_best_move(
+        board, developer_mode=True
+    )
     minimax_time = time.time() - minimax_start
     
     # Minimax hamlesini uygula
@@ -368,65 +482,31 @@ def ai_vs_ai_minimax():
     drop_piece(board, minimax_row, minimax_col, PLAYER_AI)
     game['move_count'] += 1
     
-    # Kazandı mı?
-    if winning_move(board, PLAYER_AI):
+    # Kazandı mı? / Tahta doldu mu? (tek tarama, sonuçlar lokalde)
+    minimax_won = winning_move(board, PLAYER_AI)
+    valid_cols = get_valid_locations(board)
+
+    if minimax_won:
         game['game_over'] = True
         game['winner'] = 'minimax'
-        session.modified = True
-        
-        return jsonify({
-            'game_over': True,
-            'winner': 'minimax',
-            'board': board_to_json(board),
-            'move': {
-                'row': minimax_row,
-                'col': minimax_col,
-                'thinking_time': round(minimax_time, 3),
-                'depth': depth,
-                'heuristic': column_scores.get(minimax_col, 0) if column_scores else 0,
-                'algorithm': 'Alpha-Beta Pruning'
-            }
-        })
-    
-    # Tahta doldu mu?
-    if not get_valid_locations(board):
+    elif not valid_cols:
         game['game_over'] = True
         game['winner'] = 'draw'
-        session.modified = True
-        
-        return jsonify({
-            'game_over': True,
-            'winner': 'draw',
-            'board': board_to_json(board),
-            'move': {
-                'row': minimax_row,
-                'col': minimax_col,
-                'thinking_time': round(minimax_time, 3),
-                'depth': depth,
-                'heuristic': column_scores.get(minimax_col, 0) if column_scores else 0,
-                'algorithm': 'Alpha-Beta Pruning'
-            }
-        })
-    
-    # Depth ayarlama
-    new_depth, depth_change_msg = adjust_depth_by_runtime(
-        depth, minimax_time, round_count
-    )
-    game['current_depth'] = new_depth
-    session.modified = True
-    
+
+    game['board'] = board_to_masks(board)
+
+    # Response TEK yerde kurulur; terminal/normal çıkışlar aynı şemayı paylaşır
     return jsonify({
-        'game_over': False,
+        'game_over': game['game_over'],
+        'winner': game.get('winner'),
         'board': board_to_json(board),
         'move': {
             'row': minimax_row,
             'col': minimax_col,
             'thinking_time': round(minimax_time, 3),
             'depth': depth,
-            'new_depth': new_depth,
             'heuristic': column_scores.get(minimax_col, 0) if column_scores else 0,
-            'algorithm': 'Alpha-Beta Pruning',
-            'depth_change_msg': depth_change_msg
+            'algorithm': 'Alpha-Beta Pruning'
         }
     })
 
@@ -436,11 +516,11 @@ def ai_vs_ai_mcts():
     """
     AI vs AI: MCTS hamlesini yapar
     """
-    if 'game' not in session:
+    game = get_game(create_if_missing=False)
+    if game is None:
         return jsonify({'error': 'No active game'}), 400
-    
-    game = session['game']
-    board = game['board']
+
+    board = board_from_masks(game['board'])
     
     # Oyun bitmiş mi?
     if game['game_over']:
@@ -467,34 +547,20 @@ def ai_vs_ai_mcts():
     drop_piece(board, mcts_row, mcts_col, PLAYER_HUMAN)
     game['move_count'] += 1
     
-    # Kazandı mı?
-    if winning_move(board, PLAYER_HUMAN):
+    # Kazandı mı? / Tahta doldu mu? (tek tarama, sonuçlar lokalde)
+    mcts_won = winning_move(board, PLAYER_HUMAN)
+    valid_cols = get_valid_locations(board)
+
+    if mcts_won:
         game['game_over'] = True
         game['winner'] = 'mcts'
-        session.modified = True
-        
-        return jsonify({
-            'game_over': True,
-            'winner': 'mcts',
-            'board': board_to_json(board),
-            'move': {
-                'row': mcts_row,
-                'col': mcts_col,
-                'thinking_time': round(mcts_time, 3),
-                'iterations': mcts_stats.get('iterations', MCTS_ITERATIONS),
-                'exploration_constant': mcts_stats.get('exploration_constant', 0.9),
-                'algorithm': 'Monte Carlo Tree Search'
-            }
-        })
-    
-    # Tahta doldu mu?
-    if not get_valid_locations(board):
+    elif not valid_cols:
         game['game_over'] = True
         game['winner'] = 'draw'
-        session.modified = True
-    
-    session.modified = True
-    
+
+    game['board'] = board_to_masks(board)
+
+    # Response TEK yerde kurulur
     return jsonify({
         'game_over': game['game_over'],
         'winner': game.get('winner'),
@@ -503,7 +569,7 @@ def ai_vs_ai_mcts():
             'row': mcts_row,
             'col': mcts_col,
             'thinking_time': round(mcts_time, 3),
-            'iterations': mcts_stats.get('iterations', MCTS_ITERATIONS),
+            'iterations': mcts_stats.get('iterations', MCTS_ITERATIONS_V2),
             'exploration_constant': mcts_stats.get('exploration_constant', 0.9),
             'algorithm': 'Monte Carlo Tree Search'
         }
@@ -518,41 +584,22 @@ def ai_vs_ai_move():
     - MCTS (configured iterations) hamlesini yapar
     - Her iki hamlede de stats döndürür
     """
-    if 'game' not in session:
-        session['game'] = create_game_session(PLAYER_AI)
-    
-    game = session['game']
-    board = game['board']
+    game = get_game(first_player=PLAYER_AI)
+    board = board_from_masks(game['board'])
     
     if 'move_count' not in game:
         game['move_count'] = 0
-    if 'current_depth' not in game:
-        game['current_depth'] = AI_DEPTH_DEFAULT
-    
+
     # Oyun bitmiş mi?
     if game['game_over']:
         return jsonify({'error': 'Game is already over'}), 400
     
     # HAMLE 1: Minimax (Alpha-Beta)
     minimax_start = time.time()
-    depth = game['current_depth']
-    round_count = game['move_count']
-    
-    if USE_BITBOARD_MINIMAX:
-        minimax_col, column_scores = get_best_move_bitboard(
-            board, 
-            PLAYER_AI, 
-            depth=depth,
-            developer_mode=True
-        )
-    else:
-        minimax_col, column_scores = get_best_move(
-            board, 
-            PLAYER_AI, 
-            depth=depth,
-            developer_mode=True
-        )
-    
+    # Iteratif derinleşme: bütçe dolana kadar derinleş, ulaşılan depth'i raporla
+    minimax_col, column_scores, depth = iterative_deepening_best_move(
+        board, developer_mode=True
+    )
     minimax_time = time.time() - minimax_start
     
     # Minimax hamlesini uygula
@@ -563,55 +610,40 @@ def ai_vs_ai_move():
     drop_piece(board, minimax_row, minimax_col, PLAYER_AI)
     game['move_count'] += 1
     
-    # Kazandı mı?
-    if winning_move(board, PLAYER_AI):
-        game['game_over'] = True
-        game['winner'] = 'minimax'
-        session.modified = True
-        
-        return jsonify({
-            'game_over': True,
-            'winner': 'minimax',
-            'board': board_to_json(board),
-            'minimax_move': {
-                'row': minimax_row,
-                'col': minimax_col,
-                'thinking_time': round(minimax_time, 3),
-                'depth': depth,
-                'heuristic': column_scores.get(minimax_col, 0) if column_scores else 0,
-                'algorithm': 'Alpha-Beta Pruning'
-            },
-            'mcts_move': None
-        })
-    
-    # Tahta doldu mu?
-    if not get_valid_locations(board):
+    # Kazandı mı? / Tahta doldu mu? (tek tarama, sonuçlar lokalde)
+    minimax_won = winning_move(board, PLAYER_AI)
+    valid_cols = get_valid_locations(board)
+
+    # Minimax hamlesinin payload'u bir kere kurulur, tüm çıkışlar paylaşır
+    minimax_move = {
+        'row': minimax_row,
+        'col': minimax_col,
+        'thinking_time': round(minimax_time, 3),
+        'depth': depth,
+        'heuristic': column_scores.get(minimax_col, 0) if column_scores else 0,
+        'algorithm': 'Alpha-Beta Pruning'
+    }
+
+    if minimax_won or not valid_cols:
         game['game_over'] = True
-        game['winner'] = 'draw'
-        session.modified = True
-        
+        game['winner'] = 'minimax' if minimax_won else 'draw'
+        game['board'] = board_to_masks(board)
+
         return jsonify({
             'game_over': True,
-            'winner': 'draw',
+            'winner': game['winner'],
             'board': board_to_json(board),
-            'minimax_move': {
-                'row': minimax_row,
-                'col': minimax_col,
-                'thinking_time': round(minimax_time, 3),
-                'depth': depth,
-                'heuristic': column_scores.get(minimax_col, 0) if column_scores else 0,
-                'algorithm': 'Alpha-Beta Pruning'
-            },
+            'minimax_move': minimax_move,
             'mcts_move': None
         })
-    
+
     # HAMLE 2: MCTS
     mcts_start = time.time()
     
-    mcts_col, mcts_stats = get_best_move_mcts(
+    mcts_col, mcts_stats = get_best_move_mcts_v2(
         board,
         PLAYER_HUMAN,  # MCTS plays as PLAYER_HUMAN
-        iterations=MCTS_ITERATIONS,
+        iterations=MCTS_ITERATIONS_V2,
         time_limit=5.0,
         developer_mode=True
     )
@@ -626,66 +658,30 @@ def ai_vs_ai_move():
     drop_piece(board, mcts_row, mcts_col, PLAYER_HUMAN)
     game['move_count'] += 1
     
-    # Kazandı mı?
-    if winning_move(board, PLAYER_HUMAN):
+    # Kazandı mı? / Tahta doldu mu? (tek tarama, sonuçlar lokalde)
+    mcts_won = winning_move(board, PLAYER_HUMAN)
+    valid_cols = get_valid_locations(board)
+
+    if mcts_won:
         game['game_over'] = True
         game['winner'] = 'mcts'
-        session.modified = True
-        
-        return jsonify({
-            'game_over': True,
-            'winner': 'mcts',
-            'board': board_to_json(board),
-            'minimax_move': {
-                'row': minimax_row,
-                'col': minimax_col,
-                'thinking_time': round(minimax_time, 3),
-                'depth': depth,
-                'heuristic': column_scores.get(minimax_col, 0) if column_scores else 0,
-                'algorithm': 'Alpha-Beta Pruning'
-            },
-            'mcts_move': {
-                'row': mcts_row,
-                'col': mcts_col,
-                'thinking_time': round(mcts_time, 3),
-                'iterations': mcts_stats.get('iterations', MCTS_ITERATIONS),
-                'exploration_constant': mcts_stats.get('exploration_constant', 0.9),
-                'algorithm': 'Monte Carlo Tree Search'
-            }
-        })
-    
-    # Depth ayarlama (Minimax için)
-    new_depth, depth_change_msg = adjust_depth_by_runtime(
-        depth, minimax_time, round_count
-    )
-    game['current_depth'] = new_depth
-    
-    # Tahta tekrar doldu mu?
-    if not get_valid_locations(board):
+    elif not valid_cols:
         game['game_over'] = True
         game['winner'] = 'draw'
-    
-    session.modified = True
-    
+
+    game['board'] = board_to_masks(board)
+
+    # Response TEK yerde kurulur
     return jsonify({
         'game_over': game['game_over'],
         'winner': game.get('winner'),
         'board': board_to_json(board),
-        'minimax_move': {
-            'row': minimax_row,
-            'col': minimax_col,
-            'thinking_time': round(minimax_time, 3),
-            'depth': depth,
-            'new_depth': new_depth,
-            'heuristic': column_scores.get(minimax_col, 0) if column_scores else 0,
-            'algorithm': 'Alpha-Beta Pruning',
-            'depth_change_msg': depth_change_msg
-        },
+        'minimax_move': minimax_move,
         'mcts_move': {
             'row': mcts_row,
             'col': mcts_col,
             'thinking_time': round(mcts_time, 3),
-            'iterations': mcts_stats.get('iterations', MCTS_ITERATIONS),
+            'iterations': mcts_stats.get('iterations', MCTS_ITERATIONS_V2),
             'exploration_constant': mcts_stats.get('exploration_constant', 0.9),
             'algorithm': 'Monte Carlo Tree Search'
         }
@@ -709,5 +705,12 @@ def toggle_bitboard():
     })
 
 
+# Agent'ı startup'ta ısıt: ilk gerçek /api/ai-move isteği soğuk cache'le
+# karşılaşmasın. Kısa bir boş-tahta araması TT'yi ve tüm arama yolundaki
+# kod/cache'leri doldurur; maliyet process başlangıcına kayar, kullanıcıya
+# görünmez. (gunicorn --preload altında master'da bir kere çalışır.)
+_ = get_best_move_bitboard(create_board(), PLAYER_AI, depth=4)
+
+
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
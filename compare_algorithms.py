@@ -11,8 +11,10 @@ Metrics:
 - Algorithm Efficiency
 """
 
+import os
 import time
 import json
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from connect4.game import (
     create_board, print_board, drop_piece,
@@ -75,6 +77,47 @@ def play_single_game(ai1_func, ai1_params, ai2_func, ai2_params, verbose=False):
     return 'draw', move_count, ai1_total_time, ai2_total_time
 
 
+def run_matchup(ai1, ai2, games):
+    """
+    Bir eşleşmenin tüm oyunlarını paralel oynatır.
+
+    Oyunlar birbirinden tamamen bağımsız (paylaşılan durum yok), yani
+    utanç verecek kadar paralel: her oyun ayrı bir process'te koşar ve
+    N çekirdekte duvar-saati süresi ~N'e bölünür. Sonuçlar submit
+    sırasına göre toplanır ki çıktı deterministik kalsın.
+
+    Returns:
+        (ai1_wins, ai2_wins, draws, ai1_time, ai2_time)
+    """
+    ai1_wins = ai2_wins = draws = 0
+    ai1_time = ai2_time = 0.0
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [
+            executor.submit(play_single_game,
+                            ai1['func'], ai1['params'],
+                            ai2['func'], ai2['params'])
+            for _ in range(games)
+        ]
+        for i, future in enumerate(futures):
+            winner, moves, t1, t2 = future.result()
+            ai1_time += t1
+            ai2_time += t2
+
+            print(f"Game {i+1}/{games}...", end=' ')
+            if winner == 'ai1':
+                ai1_wins += 1
+                print(f"✅ Alpha-Beta wins ({moves} moves)")
+            elif winner == 'ai2':
+                ai2_wins += 1
+                print(f"✅ MCTS wins ({moves} moves)")
+            else:
+                draws += 1
+                print(f"🤝 Draw ({moves} moves)")
+
+    return ai1_wins, ai2_wins, draws, ai1_time, ai2_time
+
+
 def run_comparison(games=10):
     """
     Run comprehensive comparison
@@ -122,32 +165,10 @@ def run_comparison(games=10):
     print(f"📊 MATCHUP 1: {alpha_beta_d6['name']} vs {mcts_1k['name']}")
     print(f"{'='*80}\n")
     
-    ab_d6_wins = 0
-    mcts_1k_wins = 0
-    draws = 0
-    ab_d6_time = 0
-    mcts_1k_time = 0
-    
-    for i in range(games):
-        print(f"Game {i+1}/{games}...", end=' ')
-        winner, moves, t1, t2 = play_single_game(
-            alpha_beta_d6['func'], alpha_beta_d6['params'],
-            mcts_1k['func'], mcts_1k['params']
-        )
-        
-        ab_d6_time += t1
-        mcts_1k_time += t2
-        
-        if winner == 'ai1':
-            ab_d6_wins += 1
-            print(f"✅ Alpha-Beta wins ({moves} moves)")
-        elif winner == 'ai2':
-            mcts_1k_wins += 1
-            print(f"✅ MCTS wins ({moves} moves)")
-        else:
-            draws += 1
-            print(f"🤝 Draw ({moves} moves)")
-    
+    ab_d6_wins, mcts_1k_wins, draws, ab_d6_time, mcts_1k_time = run_matchup(
+        alpha_beta_d6, mcts_1k, games
+    )
+
     results['matchup1'] = {
         'config': f"{alpha_beta_d6['name']} vs {mcts_1k['name']}",
         'alpha_beta': {
@@ -168,32 +189,10 @@ def run_comparison(games=10):
     print(f"📊 MATCHUP 2: {alpha_beta_d8['name']} vs {mcts_2k['name']}")
     print(f"{'='*80}\n")
     
-    ab_d8_wins = 0
-    mcts_2k_wins = 0
-    draws2 = 0
-    ab_d8_time = 0
-    mcts_2k_time = 0
-    
-    for i in range(games):
-        print(f"Game {i+1}/{games}...", end=' ')
-        winner, moves, t1, t2 = play_single_game(
-            alpha_beta_d8['func'], alpha_beta_d8['params'],
-            mcts_2k['func'], mcts_2k['params']
-        )
-        
-        ab_d8_time += t1
-        mcts_2k_time += t2
-        
-        if winner == 'ai1':
-            ab_d8_wins += 1
-            print(f"✅ Alpha-Beta wins ({moves} moves)")
-        elif winner == 'ai2':
-            mcts_2k_wins += 1
-            print(f"✅ MCTS wins ({moves} moves)")
-        else:
-            draws2 += 1
-            print(f"🤝 Draw ({moves} moves)")
-    
+    ab_d8_wins, mcts_2k_wins, draws2, ab_d8_time, mcts_2k_time = run_matchup(
+        alpha_beta_d8, mcts_2k, games
+    )
+
     results['matchup2'] = {
         'config': f"{alpha_beta_d8['name']} vs {mcts_2k['name']}",
         'alpha_beta': {
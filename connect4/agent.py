@@ -12,205 +12,342 @@ OPTIMIZATIONS:
 Bu optimizasyonlarla depth 8-12'ye çıkabiliyoruz!
 """
 
-import math
+import multiprocessing
+import os
 import random
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from .game import (
     ROWS, COLS, WINDOW_LENGTH, EMPTY, PLAYER_AI, PLAYER_HUMAN,
     is_terminal_node, winning_move, get_valid_locations,
-    get_next_open_row, drop_piece
+    get_next_open_row, drop_piece,
+    COLUMN_STRIDE, BOARD_MASK, board_to_masks, has_win,
+    get_valid_locations_mask,
 )
 
-# Global transposition table (pozisyon -> skor cache)
-transposition_table = {}
-
 # Killer moves table (depth -> [move1, move2])
 # Bu hamleler önceki aramalarda alpha-beta cutoff'a sebep olmuş
 killer_moves = {}
 
-def hash_board(board):
-    """Tahtayı hash'e çevir (transposition table için)"""
-    return tuple(tuple(row) for row in board)
+# Statik merkez-dışa sütun sırası: merkez sütunlar daha çok kazanç
+# penceresine girdiği için cutoff'ların çoğunu tek başına yakalar
+STATIC_ORDER = (3, 2, 4, 1, 5, 0, 6)
 
-def evaluate_window(window, piece):
-    """
-    Pencere değerlendirme + THREAT DETECTION
-    
-    DÜZELTME: Sadece belirtilen oyuncu (piece) için pozitif skor döndürür.
-    Rakip skorları score_position() içinde ayrı hesaplanacak.
-    """
-    score = 0
-    opponent_piece = PLAYER_HUMAN if piece == PLAYER_AI else PLAYER_AI
-
-    piece_count = window.count(piece)
-    empty_count = window.count(EMPTY)
-    opponent_count = window.count(opponent_piece)
-
-    # BIZIM POZISYONLARIMIZ (Pozitif)
-    if piece_count == 4:
-        score += 10000
-    elif piece_count == 3 and empty_count == 1:
-        score += 10  # 3-in-a-row potansiyeli
-    elif piece_count == 2 and empty_count == 2:
-        score += 3   # 2-in-a-row potansiyeli
-
-    # THREAT DETECTION: Rakibin tehditlerini agresif engelle
-    # NOT: Rakip skorları score_position'da çıkarılacak, burada sadece tehdit tespiti
-    if opponent_count == 3 and empty_count == 1:
-        score -= 80  # ACİL TEHDİT! (daha dengeli değer)
-    elif opponent_count == 2 and empty_count == 2:
-        score -= 5   # Potansiyel tehdit
+# ---------------------------------------------------------------------------
+# ZOBRIST HASHING + KALICI ARAMA TT'Sİ
+#
+# Arama TT'si modül seviyesinde yaşar ve hamleler arasında TEMİZLENMEZ:
+# Flask her hamlede agent'ı yeni bir çağrı yığınıyla çalıştırdığı için,
+# sığ ply'lerdeki transpozisyonlar tur-üstü tekrar kullanılabilir.
+# Girdiler: key -> (depth, flag, score, best_col, age)
+# ---------------------------------------------------------------------------
 
-    return score
+# Sonsuzluk yerine int sentinel: skorlar ±10000000 bandında kaldığı için
+# 10^9 her zaman dışarıda. math.inf float olduğundan her karşılaştırmada
+# int->float promosyonu tetikliyordu; int/int karşılaştırma daha ucuz.
+INF = 10 ** 9
 
-def score_position(board, piece):
-    """
-    Pozisyon değerlendirme (cached + evaluation board)
-    
-    DÜZELTME: AI_skoru - Rakip_skoru hesabı yapılıyor.
-    Bu sayede pozitif skor AI lehine, negatif skor Rakip lehine demek.
-    """
-    # Transposition table check
-    board_hash = hash_board(board)
-    if board_hash in transposition_table:
-        return transposition_table[board_hash]
-    
-    score = 0
-    opponent = PLAYER_HUMAN if piece == PLAYER_AI else PLAYER_AI
-    
-    # EVALUATION BOARD: Stratejik pozisyonlara bonus
-    # Merkez ve alt sıralar daha değerli (daha fazla kazanma kombinasyonu)
-    evaluation_board = [
-        [3, 4, 5, 7, 5, 4, 3],  # Üst sıra (daha az değerli)
-        [4, 6, 8, 10, 8, 6, 4],  # 
-        [5, 8, 11, 13, 11, 8, 5],  # Merkez sıralar (en değerli)
-        [5, 8, 11, 13, 11, 8, 5],  # 
-        [4, 6, 8, 10, 8, 6, 4],  # 
-        [3, 4, 5, 7, 5, 4, 3]   # Alt sıra
-    ]
-    
-    # Pozisyon bonusları ekle (AI - Rakip)
+TT_EXACT = 0
+TT_LOWER = 1  # score bir alt sınır (beta cutoff)
+TT_UPPER = 2  # score bir üst sınır (alpha'yı geçemedi)
+
+_zobrist_rng = random.Random(20240417)  # deterministik tablo
+# ZOBRIST[r][c][0] = PLAYER_AI, ZOBRIST[r][c][1] = PLAYER_HUMAN
+ZOBRIST = [[[_zobrist_rng.getrandbits(64) for _ in range(2)]
+            for _ in range(COLS)] for _ in range(ROWS)]
+
+SEARCH_TT = {}
+SEARCH_TT_MAX = 1 << 20  # bellek emniyeti: dolunca baştan başla
+tt_age = 0  # her kök aramada artar; eski girdiler tercihen ezilir
+
+# Null-move alt ağacını TT'de ayrı isim-uzayına koyan ek rastgele:
+# hamlesiz sıra devri pozisyonu değiştirmez ama sıra paritesini bozar;
+# bu XOR olmadan aynı pozisyon iki farklı "sıradaki oyuncu" ile aynı
+# TT girdisini paylaşıp birbirini zehirlerdi.
+ZOBRIST_NULL = _zobrist_rng.getrandbits(64)
+
+
+def zobrist_hash(board):
+    """Tahtanın 64-bit Zobrist hash'ini hesaplar."""
+    key = 0
     for r in range(ROWS):
         for c in range(COLS):
-            if board[r][c] == piece:
-                score += evaluation_board[r][c]
-            elif board[r][c] == opponent:
-                score -= evaluation_board[r][c]
+            cell = board[r][c]
+            if cell == PLAYER_AI:
+                key ^= ZOBRIST[r][c][0]
+            elif cell == PLAYER_HUMAN:
+                key ^= ZOBRIST[r][c][1]
+    return key
 
-    # Merkez sütun ekstra bonusu
-    center_array = [board[r][COLS//2] for r in range(ROWS)]
-    center_count = center_array.count(piece)
-    opponent_center = center_array.count(opponent)
-    score += (center_count - opponent_center) * 3
 
-    # Yatay kontrol (AI pencerelerini ekle, Rakip pencerelerini çıkar)
+def tt_store(key, depth, flag, score, best_col):
+    """Replace-if-deeper (veya eski age) politikasıyla TT'ye yaz."""
+    entry = SEARCH_TT.get(key)
+    if entry is None:
+        if len(SEARCH_TT) >= SEARCH_TT_MAX:
+            SEARCH_TT.clear()
+    elif entry[0] > depth and entry[4] == tt_age:
+        return  # aynı turda daha derin bir sonuç varsa koru
+    SEARCH_TT[key] = (depth, flag, score, best_col, tt_age)
+
+
+# ---------------------------------------------------------------------------
+# BITBOARD ARAMA ÇEKİRDEĞİ
+#
+# Arama artık 2D liste yerine iki bitmask taşır (ai_mask, human_mask) —
+# game.py'deki 7-stride düzen (bit = col*7 + row, row 6 sentinel). Hamle
+# yapmak tek bir OR, kopyalamak bedava (int'ler immutable), kazanç testi
+# has_win'in 8 bit işlemi. 69 pencerelik heuristik tarama da popcount'lu
+# mask taramasına iner: düğüm başına Python allocator trafiği sıfırlanır.
+# ---------------------------------------------------------------------------
+
+# Bit indeksi -> ZOBRIST[r][c] satırı (mask'ten hash üretirken kullanılır)
+ZOBRIST_BIT = [None] * (COLS * COLUMN_STRIDE)
+# Ayna hash'i için: aynı bit indeksi, sütun-aynalanmış hücrenin rastgeleleri.
+# Pozisyonla birlikte iki hash paralel taşınır; TT min(h, h_ayna) ile
+# anahtarlanır, böylece bir pozisyon ve aynası aynı girdiyi paylaşır.
+ZOBRIST_BIT_MIR = [None] * (COLS * COLUMN_STRIDE)
+for _c in range(COLS):
+    for _r in range(ROWS):
+        ZOBRIST_BIT[_c * COLUMN_STRIDE + _r] = ZOBRIST[_r][_c]
+        ZOBRIST_BIT_MIR[_c * COLUMN_STRIDE + _r] = ZOBRIST[_r][COLS - 1 - _c]
+del _c, _r
+
+
+def zobrist_hash_masks(ai_mask, human_mask):
+    """Mask çiftinden Zobrist hash (2D zobrist_hash ile aynı anahtar uzayı)."""
+    key = 0
+    m = ai_mask
+    while m:
+        b = m & -m
+        key ^= ZOBRIST_BIT[b.bit_length() - 1][0]
+        m ^= b
+    m = human_mask
+    while m:
+        b = m & -m
+        key ^= ZOBRIST_BIT[b.bit_length() - 1][1]
+        m ^= b
+    return key
+
+
+def zobrist_hash_masks_mirror(ai_mask, human_mask):
+    """Pozisyonun sütun-aynalanmış halinin Zobrist hash'i."""
+    key = 0
+    m = ai_mask
+    while m:
+        b = m & -m
+        key ^= ZOBRIST_BIT_MIR[b.bit_length() - 1][0]
+        m ^= b
+    m = human_mask
+    while m:
+        b = m & -m
+        key ^= ZOBRIST_BIT_MIR[b.bit_length() - 1][1]
+        m ^= b
+    return key
+
+
+def _build_win_masks():
+    """69 olası dörtlü çizginin bitmask'lerini üretir."""
+    masks = []
+    # Yatay
     for r in range(ROWS):
-        row_array = board[r]
         for c in range(COLS - 3):
-            window = row_array[c:c+WINDOW_LENGTH]
-            score += evaluate_window(window, piece)
-            # Rakip için aynı pencereyi ters yönde değerlendir
-            score -= evaluate_window(window, opponent)
-
-    # Dikey kontrol
+            masks.append(sum(1 << ((c + i) * COLUMN_STRIDE + r) for i in range(4)))
+    # Dikey
     for c in range(COLS):
-        col_array = [board[r][c] for r in range(ROWS)]
         for r in range(ROWS - 3):
-            window = col_array[r:r+WINDOW_LENGTH]
-            score += evaluate_window(window, piece)
-            score -= evaluate_window(window, opponent)
-
-    # Pozitif eğimli çapraz (/), sol alt -> sağ üst
+            masks.append(sum(1 << (c * COLUMN_STRIDE + r + i) for i in range(4)))
+    # Pozitif eğimli çapraz (/)
     for r in range(ROWS - 3):
         for c in range(COLS - 3):
-            window = [board[r+i][c+i] for i in range(WINDOW_LENGTH)]
-            score += evaluate_window(window, piece)
-            score -= evaluate_window(window, opponent)
-
-    # Negatif eğimli çapraz (\), sol üst -> sağ alt
+            masks.append(sum(1 << ((c + i) * COLUMN_STRIDE + r + i) for i in range(4)))
+    # Negatif eğimli çapraz (\)
     for r in range(3, ROWS):
         for c in range(COLS - 3):
-            window = [board[r-i][c+i] for i in range(WINDOW_LENGTH)]
-            score += evaluate_window(window, piece)
-            score -= evaluate_window(window, opponent)
+            masks.append(sum(1 << ((c + i) * COLUMN_STRIDE + r - i) for i in range(4)))
+    return masks
+
+
+WIN_MASKS = tuple(_build_win_masks())  # 69 çizgi (tuple: salt-okunur + hızlı iterasyon)
+
+# score_position'daki evaluation_board'un mask karşılığı: aynı ağırlığa
+# sahip hücreler tek mask'te toplanır, pozisyon bonusu ağırlık başına
+# bir popcount olur (42 hücre döngüsü yerine ~9 popcount).
+_EVALUATION_BOARD = [
+    [3, 4, 5, 7, 5, 4, 3],
+    [4, 6, 8, 10, 8, 6, 4],
+    [5, 8, 11, 13, 11, 8, 5],
+    [5, 8, 11, 13, 11, 8, 5],
+    [4, 6, 8, 10, 8, 6, 4],
+    [3, 4, 5, 7, 5, 4, 3],
+]
+_buckets = {}
+for _r in range(ROWS):
+    for _c in range(COLS):
+        _w = _EVALUATION_BOARD[_r][_c]
+        _buckets[_w] = _buckets.get(_w, 0) | (1 << (_c * COLUMN_STRIDE + _r))
+WEIGHT_BUCKETS = tuple(sorted(_buckets.items()))
+del _buckets, _r, _c, _w
+
+CENTER_MASK = 0x3F << ((COLS // 2) * COLUMN_STRIDE)  # merkez sütunun 6 hücresi
+
+# Pencere skoru LUT'u: evaluate_window(piece) - evaluate_window(opponent)
+# net'inin (kendi_taş, rakip_taş) sayım çiftine göre tablosu. Geçerli 15
+# kombinasyon 25'lik düz listeye açılır; pencere başına dallanma kaskadı
+# yerine tek index'leme (p*5 + o) kalır.
+NET_WINDOW_SCORE = [0] * 25
+NET_WINDOW_SCORE[4 * 5 + 0] = 10000
+NET_WINDOW_SCORE[3 * 5 + 0] = 90    # +10 (kendi üçlüm) +80 (rakip tehdit cezası)
+NET_WINDOW_SCORE[2 * 5 + 0] = 8     # +3 (ikili) +5 (potansiyel tehdit)
+NET_WINDOW_SCORE[0 * 5 + 4] = -10000
+NET_WINDOW_SCORE[0 * 5 + 3] = -90
+NET_WINDOW_SCORE[0 * 5 + 2] = -8
+NET_WINDOW_SCORE = tuple(NET_WINDOW_SCORE)
+
+
+def masks_from_board(board):
+    """2D tahtadan (ai_mask, human_mask, heights) üçlüsünü çıkarır.
+
+    heights list yerine array('b'): 7 bayta sığar (list 7 PyObject
+    pointer'ı taşır), index erişimi ve yerinde +=/-= aynı hızda ama
+    arama boyunca tek tahsisli kompakt bir buffer olarak yaşar.
+    """
+    masks = board_to_masks(board)
+    occ = masks['o']
+    ai_mask = masks['p']
+    heights = array('b', (((occ >> (c * COLUMN_STRIDE)) & 0x3F).bit_count()
+                          for c in range(COLS)))
+    return ai_mask, occ ^ ai_mask, heights
+
 
-    # Cache'e kaydet
-    transposition_table[board_hash] = score
+def score_position_bb(ai_mask, human_mask):
+    """
+    Bitboard pozisyon değerlendirme — score_position(board, PLAYER_AI)
+    ile aynı heuristik, mask'ler üzerinden.
+
+    Pozitif skor AI lehine. Pencere başına 2 popcount + dallanma;
+    liste dilimleme / window.count yok.
+    """
+    score = 0
+
+    # Pozisyon bonusları (evaluation_board) — ağırlık başına bir popcount
+    for weight, mask in WEIGHT_BUCKETS:
+        score += weight * ((ai_mask & mask).bit_count()
+                           - (human_mask & mask).bit_count())
+
+    # Merkez sütun ekstra bonusu
+    score += 3 * ((ai_mask & CENTER_MASK).bit_count()
+                  - (human_mask & CENTER_MASK).bit_count())
+
+    # 69 pencere: iki popcount + tek LUT index'i, dallanma yok
+    # (LUT yerel bağlanır: döngü içinde LOAD_GLOBAL yerine LOAD_FAST)
+    _net = NET_WINDOW_SCORE
+    for mask in WIN_MASKS:
+        score += _net[(ai_mask & mask).bit_count() * 5
+                      + (human_mask & mask).bit_count()]
     return score
 
-def detect_immediate_threats(board, piece):
+def score_position(board, piece):
+    """
+    2D tahta için pozisyon değerlendirme (evaluation board + 69 pencere).
+
+    Artık sadece sınırda yaşayan bir sarmalayıcı: tahta bir kere mask
+    çiftine çevrilir ve skor score_position_bb'den gelir. score_position_bb
+    iki argümanında antisimetrik olduğundan (her terim fark ya da işaret
+    simetrik LUT) insan perspektifi mask'leri takas etmekle elde edilir.
+    Hücre hücre 69 pencere tarayan eski Python döngüsü yerine 69 mask
+    üzerinde bit-paralel popcount taraması koşar.
+    """
+    ai_mask, human_mask, _ = masks_from_board(board)
+    if piece == PLAYER_AI:
+        return score_position_bb(ai_mask, human_mask)
+    return score_position_bb(human_mask, ai_mask)
+
+def win_spots(mask):
+    """
+    Bir taş eklendiğinde dörtlüyü tamamlayacak TÜM kareleri tek mask
+    olarak üretir — sütun döngüsü yok, yön başına 8 shift-AND.
+
+    Her s yönü için dört pencere konumu: üç taş arkada (p-s,p-2s,p-3s),
+    üç taş önde, ve iki XX_X / X_XX boşluk deseni. Sentinel satır hiç
+    set olmadığından kaydırmalar kolonlar arasına taşmaz; sonuç
+    BOARD_MASK ile kırpılır. Dolu kareler de dönebilir — çağıran
+    ~occ ile maskelemeli.
+    """
+    spots = 0
+    for s in (1, COLUMN_STRIDE, COLUMN_STRIDE - 1, COLUMN_STRIDE + 1):
+        m2 = (mask << s) & (mask << (2 * s))
+        spots |= m2 & (mask << (3 * s))
+        spots |= m2 & (mask >> s)
+        m2 = (mask >> s) & (mask >> (2 * s))
+        spots |= m2 & (mask >> (3 * s))
+        spots |= m2 & (mask << s)
+    return spots & BOARD_MASK
+
+
+def detect_immediate_threats(my_mask, opp_mask, heights, valid_locations):
     """
-    ACİL TEHDİT ALGILAMA
-    
-    Rakibin bir hamleyle kazanabileceği sütunları tespit eder.
+    ACİL TEHDİT ALGILAMA (bitboard)
+
+    Rakibin bir hamleyle kazanabileceği sütunları tespit eder. Sütun
+    başına has_win denemek yerine tüm kazanç kareleri win_spots ile
+    tek seferde çıkarılır ve düşüş kareleriyle kesiştirilir.
     Returns: [col1, col2, ...] tehdit sütunları
     """
-    opponent = PLAYER_HUMAN if piece == PLAYER_AI else PLAYER_AI
-    threat_columns = []
-    
-    for col in get_valid_locations(board):
-        row = get_next_open_row(board, col)
-        temp_board = [r[:] for r in board]
-        drop_piece(temp_board, row, col, opponent)
-        
-        if winning_move(temp_board, opponent):
-            threat_columns.append(col)
-    
-    return threat_columns
-
-def order_moves(board, valid_locations, piece, depth):
+    spots = win_spots(opp_mask) & ~(my_mask | opp_mask)
+    if not spots:
+        return []
+    return [col for col in valid_locations
+            if spots & (1 << (col * COLUMN_STRIDE + heights[col]))]
+
+def order_moves(my_mask, opp_mask, heights, valid_locations, depth, tt_move=None):
     """
-    MOVE ORDERING: Hamleleri akıllıca sırala
-    
-    Öncelikler:
-    1. Kazanma hamleleri (priority: 10000000+)
-    2. Rakibi bloklama - ACİL TEHDİTLER (priority: 5000000+)
-    3. Killer moves (priority: 1000000+)
-    4. Merkez sütunlar (priority: 50-100)
-    5. Shallow evaluation skoru
+    MOVE ORDERING: Hamleleri katman katman ÜRETEN generator (bitboard)
+
+    Katmanlar: TT hamlesi -> kazanma -> acil blok -> killer -> merkeze
+    yakınlık. Liste kurup sıralamak yerine tembel üretim: beta-cutoff ilk
+    birkaç hamlede gelirse kalan sütunlar için hiç iş yapılmaz — yapılan
+    iş ziyaret edilen çocuk sayısıyla ölçeklenir, sıralanan sayıyla değil.
     """
-    scored_moves = []
-    center_col = COLS // 2
-    opponent = PLAYER_HUMAN if piece == PLAYER_AI else PLAYER_AI
-    
-    # Acil tehditleri tespit et
-    threat_cols = detect_immediate_threats(board, piece)
-    
-    # Killer moves'u al (varsa)
-    killer_cols = killer_moves.get(depth, [])
-    
+    yielded = []
+
+    # 0. TT'den gelen en iyi bilinen hamle
+    if tt_move is not None and tt_move in valid_locations:
+        yielded.append(tt_move)
+        yield tt_move
+
+    # 1. KAZANMA HAMLELERİ (tüm kazanç kareleri tek mask'te)
+    occ = my_mask | opp_mask
+    my_spots = win_spots(my_mask) & ~occ
     for col in valid_locations:
-        priority = 0
-        row = get_next_open_row(board, col)
-        
-        # 1. KAZANMA HAMLESİ? (En yüksek öncelik ama hepsini değerlendir)
-        temp_board = [row[:] for row in board]
-        drop_piece(temp_board, row, col, piece)
-        if winning_move(temp_board, piece):
-            priority += 100000000  # Kazanma hamlesine çok yüksek öncelik (ama tüm kazanmaları değerlendir)
-        
-        # 2. ACİL TEHDİT BLOKLAMA?
-        if col in threat_cols:
-            priority += 5000000  #  ÇUKURUMDAN DÖN!
-        
-        # 3. KILLER MOVE?
-        if col in killer_cols:
-            priority += 1000000  # Bu hamle daha önce cutoff'a sebep oldu
-        
-        # 4. MERKEZE YAKINLIK
-        priority += (100 - abs(col - center_col) * 10)
-        
-        # 5. SHALLOW EVALUATION (depth > 2 ise)
-        if depth > 2:
-            shallow_score = score_position(temp_board, piece)
-            priority += shallow_score
-        
-        scored_moves.append((col, priority))
-    
-    # Sırala (yüksek öncelik -> düşük)
-    scored_moves.sort(key=lambda x: x[1], reverse=True)
-    return [col for col, _ in scored_moves]
-
-def minimax_optimized(board, depth, alpha, beta, maximizing_player):
+        if col not in yielded and my_spots & (
+                1 << (col * COLUMN_STRIDE + heights[col])):
+            yielded.append(col)
+            yield col
+
+    # 2. ACİL TEHDİT BLOKLAMA (rakip buraya oynasa kazanır mı)
+    opp_spots = win_spots(opp_mask) & ~occ
+    for col in valid_locations:
+        if col not in yielded and opp_spots & (
+                1 << (col * COLUMN_STRIDE + heights[col])):
+            yielded.append(col)
+            yield col
+
+    # 3. KILLER MOVES (daha önce cutoff'a sebep olanlar)
+    for col in killer_moves.get(depth, ()):
+        if col is not None and col in valid_locations and col not in yielded:
+            yielded.append(col)
+            yield col
+
+    # 4. KALANLAR: STATİK MERKEZ-DIŞA SIRA (her düğümde sort + lambda
+    # çağrısı yerine import'ta bir kez hesaplanmış sabit sıra)
+    for col in STATIC_ORDER:
+        if col in valid_locations and col not in yielded:
+            yield col
+
+def _minimax_value(ai_mask, human_mask, heights, depth, alpha, beta,
+                   maximizing_player, key, mkey):
     """
     OPTIMIZED MINIMAX with:
     - Alpha-Beta Pruning
@@ -218,111 +355,297 @@ def minimax_optimized(board, depth, alpha, beta, maximizing_player):
     - Transposition Table
     - Killer Moves
     - Threat Detection
+
+    Pozisyon iki bitmask + heights listesiyle taşınır; çocuk üretmek
+    tek OR, tahta kopyası yok. key = pozisyonun Zobrist hash'i; her
+    hamlede tek XOR ile güncellenir (düğüm başına 42 hücrelik yeniden
+    hesap yerine), kökte bir kere zobrist_hash_masks ile kurulur.
+
+    Çıplak int skor döndürür: sütunu sadece kök (_root_best /
+    get_best_move_optimized) takip eder; iç düğümlerde (col, value)
+    tuple'ı kurup sökmek düğüm başına iki gereksiz PyObject demekti.
     """
-    valid_locations = get_valid_locations(board)
-    is_terminal = is_terminal_node(board)
-
-    # Terminal veya depth=0
-    if depth == 0 or is_terminal:
-        if is_terminal:
-            if winning_move(board, PLAYER_AI):
-                # Erken kazanma DAHA YÜKSEK skor (depth'i ÇIKAR)
-                return (None, 10000000 - depth)  # depth=8: 9999992, depth=1: 9999999 ✅
-            elif winning_move(board, PLAYER_HUMAN):
-                # Geç kaybetme DAHA YÜKSEK skor (depth'i EKLE)
-                return (None, -10000000 + depth)  # depth=8: -9999992, depth=1: -9999999 ✅
-            else:
-                return (None, 0)
+    # Terminal kontrolü: 8'er bit işlemi + tek int karşılaştırma
+    if has_win(ai_mask):
+        # Erken kazanma DAHA YÜKSEK skor (depth'i ÇIKAR)
+        return 10000000 - depth  # depth=8: 9999992, depth=1: 9999999 ✅
+    if has_win(human_mask):
+        # Geç kaybetme DAHA YÜKSEK skor (depth'i EKLE)
+        return -10000000 + depth  # depth=8: -9999992, depth=1: -9999999 ✅
+    occ = ai_mask | human_mask
+    if occ == BOARD_MASK:
+        return 0
+    if depth == 0:
+        return score_position_bb(ai_mask, human_mask)
+
+    valid_locations = get_valid_locations_mask(occ)
+
+    # TRANSPOSITION TABLE PROBE (kalıcı, Zobrist anahtarlı, simetri katlanmış):
+    # anahtar min(h, h_ayna) — pozisyon ve aynası aynı girdiyi paylaşır,
+    # efektif hit oranı bedavaya ikiye katlanır. Ayna girdisinden gelen
+    # best_move sütunu geri aynalanır.
+    if mkey < key:
+        ckey = mkey
+        mirrored = True
+    else:
+        ckey = key
+        mirrored = False
+    entry = SEARCH_TT.get(ckey)
+    tt_move = None
+    if entry is not None:
+        e_depth, e_flag, e_score, e_move, _ = entry
+        if e_move is not None:
+            tt_move = COLS - 1 - e_move if mirrored else e_move
+        if e_depth >= depth:
+            if e_flag == TT_EXACT:
+                return e_score
+            if e_flag == TT_LOWER and e_score > alpha:
+                alpha = e_score
+            elif e_flag == TT_UPPER and e_score < beta:
+                beta = e_score
+            if alpha >= beta:
+                return e_score
+
+    # NULL-MOVE PRUNING: statik skor zaten belirleyici bir üstünlük
+    # gösteriyorsa sıradaki taraf hamlesini "pas" geçer ve R=2 ile
+    # indirgenmiş derinlikte dar pencereyle aranır; pas geçmesine rağmen
+    # sınır hâlâ aşılıyorsa alt ağaç hiç açılmadan cutoff. Connect4
+    # zugzwang'a açık olduğundan sadece skor kapısı (|skor| >= 100,
+    # yani açık üçlü seviyesinde avantaj) tutunca denenir.
+    if depth >= 3:
+        static = score_position_bb(ai_mask, human_mask)
+        if maximizing_player:
+            if static >= 100 and beta < INF:
+                null_score = _minimax_value(
+                    ai_mask, human_mask, heights, depth - 3,
+                    beta - 1, beta, False,
+                    key ^ ZOBRIST_NULL, mkey ^ ZOBRIST_NULL)
+                if null_score >= beta:
+                    return beta
         else:
-            return (None, score_position(board, PLAYER_AI))
+            if static <= -100 and alpha > -INF:
+                null_score = _minimax_value(
+                    ai_mask, human_mask, heights, depth - 3,
+                    alpha, alpha + 1, True,
+                    key ^ ZOBRIST_NULL, mkey ^ ZOBRIST_NULL)
+                if null_score <= alpha:
+                    return alpha
 
-    # MOVE ORDERING
-    piece = PLAYER_AI if maximizing_player else PLAYER_HUMAN
-    ordered_moves = order_moves(board, valid_locations, piece, depth)
+    alpha_orig = alpha
+    beta_orig = beta
 
+    # LOAD_GLOBAL -> LOAD_FAST: çocuk döngüsünde her iterasyonda okunan
+    # isimleri yerele bağla (CPython'da ~3x daha ucuz erişim)
+    _stride = COLUMN_STRIDE
+    _zbit = ZOBRIST_BIT
+    _zbit_m = ZOBRIST_BIT_MIR
+    _search = _minimax_value
+
+    # MOVE ORDERING (generator: TT hamlesi ilk katman olarak içeride)
     if maximizing_player:
-        value = -math.inf
-        best_col = ordered_moves[0]
-        
+        ordered_moves = order_moves(ai_mask, human_mask, heights,
+                                    valid_locations, depth, tt_move)
+    else:
+        ordered_moves = order_moves(human_mask, ai_mask, heights,
+                                    valid_locations, depth, tt_move)
+
+    if maximizing_player:
+        value = -INF
+        # best_col her zaman value ile aynı çocuktan gelir: ilk iterasyon
+        # koşulsuz atar (None başlangıcı), cutoff'ta bile tutarlı kalır
+        best_col = None
+
+        # PVS: ilk çocuk tam pencereyle aranır (principal variation varsayımı),
+        # sonrakiler önce sıfır pencereyle (alpha, alpha+1) test edilir —
+        # sıralama iyiyse test çoğunlukla "daha iyi değil" der ve ucuza
+        # biter; fail-high olursa gerçek skor için tam pencereyle yeniden
+        # aranır. TT + killer sıralamasıyla re-search oranı düşüktür.
         for col in ordered_moves:
-            row = get_next_open_row(board, col)
-            temp_board = [row[:] for row in board]
-            drop_piece(temp_board, row, col, PLAYER_AI)
-            
-            new_score = minimax_optimized(temp_board, depth - 1, alpha, beta, False)[1]
-            
-            if new_score > value:
+            bit_index = col * _stride + heights[col]
+            drop_bit = 1 << bit_index
+            child_ai = ai_mask | drop_bit
+            ckey_child = key ^ _zbit[bit_index][0]
+            mkey_child = mkey ^ _zbit_m[bit_index][0]
+            heights[col] += 1
+            if best_col is None:
+                new_score = _search(child_ai, human_mask, heights,
+                                    depth - 1, alpha, beta, False,
+                                    ckey_child, mkey_child)
+            else:
+                new_score = _search(child_ai, human_mask, heights,
+                                    depth - 1, alpha, alpha + 1, False,
+                                    ckey_child, mkey_child)
+                if alpha < new_score < beta:
+                    new_score = _search(child_ai, human_mask, heights,
+                                        depth - 1, new_score, beta, False,
+                                        ckey_child, mkey_child)
+            heights[col] -= 1
+
+            if best_col is None or new_score > value:
                 value = new_score
                 best_col = col
             
             alpha = max(alpha, value)
             if alpha >= beta:
                 # KILLER MOVE KAYDET: Bu hamle cutoff'a sebep oldu!
-                if depth not in killer_moves:
-                    killer_moves[depth] = []
-                if col not in killer_moves[depth]:
-                    killer_moves[depth].insert(0, col)  # En başa ekle
-                    if len(killer_moves[depth]) > 2:  # Max 2 killer move tut
-                        killer_moves[depth].pop()
+                # Sabit iki slot: yeni killer öne, eski ikinci slota kayar
+                killers = killer_moves.get(depth)
+                if killers is None:
+                    killer_moves[depth] = [col, None]
+                elif col != killers[0]:
+                    killers[1] = killers[0]
+                    killers[0] = col
                 break  # Beta cutoff
-        
-        return best_col, value
-    
+
+        if value <= alpha_orig:
+            flag = TT_UPPER
+        elif value >= beta_orig:
+            flag = TT_LOWER
+        else:
+            flag = TT_EXACT
+        if mirrored and best_col is not None:
+            tt_store(ckey, depth, flag, value, COLS - 1 - best_col)
+        else:
+            tt_store(ckey, depth, flag, value, best_col)
+        return value
+
     else:  # Minimizing player
-        value = math.inf
-        best_col = ordered_moves[0]
-        
+        value = INF
+        best_col = None
+
+        # PVS (simetrik): sonraki çocuklar sıfır pencereyle (beta-1, beta)
+        # test edilir, fail-low olursa tam pencereyle yeniden aranır
         for col in ordered_moves:
-            row = get_next_open_row(board, col)
-            temp_board = [row[:] for row in board]
-            drop_piece(temp_board, row, col, PLAYER_HUMAN)
-            
-            new_score = minimax_optimized(temp_board, depth - 1, alpha, beta, True)[1]
-            
-            if new_score < value:
+            bit_index = col * _stride + heights[col]
+            drop_bit = 1 << bit_index
+            child_hu = human_mask | drop_bit
+            ckey_child = key ^ _zbit[bit_index][1]
+            mkey_child = mkey ^ _zbit_m[bit_index][1]
+            heights[col] += 1
+            if best_col is None:
+                new_score = _search(ai_mask, child_hu, heights,
+                                    depth - 1, alpha, beta, True,
+                                    ckey_child, mkey_child)
+            else:
+                new_score = _search(ai_mask, child_hu, heights,
+                                    depth - 1, beta - 1, beta, True,
+                                    ckey_child, mkey_child)
+                if alpha < new_score < beta:
+                    new_score = _search(ai_mask, child_hu, heights,
+                                        depth - 1, alpha, new_score, True,
+                                        ckey_child, mkey_child)
+            heights[col] -= 1
+
+            if best_col is None or new_score < value:
                 value = new_score
                 best_col = col
             
             beta = min(beta, value)
             if alpha >= beta:
-                # KILLER MOVE KAYDET
-                if depth not in killer_moves:
-                    killer_moves[depth] = []
-                if col not in killer_moves[depth]:
-                    killer_moves[depth].insert(0, col)
-                    if len(killer_moves[depth]) > 2:
-                        killer_moves[depth].pop()
+                # KILLER MOVE KAYDET (sabit iki slot)
+                killers = killer_moves.get(depth)
+                if killers is None:
+                    killer_moves[depth] = [col, None]
+                elif col != killers[0]:
+                    killers[1] = killers[0]
+                    killers[0] = col
                 break  # Alpha cutoff
-        
-        return best_col, value
 
-def get_best_move_optimized(board, piece, depth, developer_mode=False):
+        if value <= alpha_orig:
+            flag = TT_UPPER
+        elif value >= beta_orig:
+            flag = TT_LOWER
+        else:
+            flag = TT_EXACT
+        if mirrored and best_col is not None:
+            tt_store(ckey, depth, flag, value, COLS - 1 - best_col)
+        else:
+            tt_store(ckey, depth, flag, value, best_col)
+        return value
+
+
+def _root_best(ai_mask, human_mask, heights, depth, key, mkey):
+    """
+    Kök düğüm: çocukları sırayla arar ve sütunu DA takip eder.
+
+    İç düğümlerin aksine (col, value) bilgisine burada gerçekten
+    ihtiyaç var; tek maximizer kopyasıdır, TT'ye EXACT olarak yazar.
+    """
+    occ = ai_mask | human_mask
+    valid_locations = get_valid_locations_mask(occ)
+
+    mirrored = mkey < key
+    ckey = mkey if mirrored else key
+    entry = SEARCH_TT.get(ckey)
+    tt_move = None
+    if entry is not None and entry[3] is not None:
+        tt_move = COLS - 1 - entry[3] if mirrored else entry[3]
+
+    ordered_moves = order_moves(ai_mask, human_mask, heights,
+                                valid_locations, depth, tt_move)
+
+    value = -INF
+    best_col = None
+    alpha = -INF
+
+    for col in ordered_moves:
+        bit_index = col * COLUMN_STRIDE + heights[col]
+        drop_bit = 1 << bit_index
+        heights[col] += 1
+        new_score = _minimax_value(ai_mask | drop_bit, human_mask, heights,
+                                   depth - 1, alpha, INF, False,
+                                   key ^ ZOBRIST_BIT[bit_index][0],
+                                   mkey ^ ZOBRIST_BIT_MIR[bit_index][0])
+        heights[col] -= 1
+
+        if best_col is None or new_score > value:
+            value = new_score
+            best_col = col
+        if value > alpha:
+            alpha = value
+
+    if mirrored and best_col is not None:
+        tt_store(ckey, depth, TT_EXACT, value, COLS - 1 - best_col)
+    else:
+        tt_store(ckey, depth, TT_EXACT, value, best_col)
+    return best_col, value
+
+
+def get_best_move_optimized(board, piece, depth, developer_mode=False,
+                            time_budget=None):
     """
     OPTIMIZED: En iyi hamleyi bul
-    
+
     depth=8-12 ile bile hızlı çalışır!
-    
+
     İyileştirmeler:
     - ÖNCELİKLE ANINDA KAZANMA KONTROLÜ!
     - SONRA ANINDA TEHDİT BLOKLAMA!
     - Transposition table temizleme
     - Killer moves temizleme
     - Developer mode için detaylı skorlar
+
+    time_budget (saniye) verilirse iteratif derinleşme turlar arasında
+    süreyi kontrol eder ve bütçe dolduğunda tamamlanmış en derin turun
+    hamlesini döndürür — yarım kalan tur asla kullanılmaz.
     """
-    # Cache'leri temizle (her hamleden sonra)
-    global transposition_table, killer_moves
-    transposition_table.clear()
+    # Killer'ları temizle; SEARCH_TT KALIR (hamleler arası
+    # transpozisyonlar yeniden kullanılsın diye) — sadece age'i ilerlet.
+    global tt_age
     killer_moves.clear()
-    
-    valid_locations = get_valid_locations(board)
-    opponent = PLAYER_HUMAN if piece == PLAYER_AI else PLAYER_AI
-    
+    tt_age += 1
+
+    # Sınırda bir kere 2D -> bitboard dönüşümü; arama mask'lerle koşar
+    ai_mask, human_mask, heights = masks_from_board(board)
+    my_mask = ai_mask if piece == PLAYER_AI else human_mask
+    opp_mask = human_mask if piece == PLAYER_AI else ai_mask
+
+    valid_locations = list(get_valid_locations_mask(ai_mask | human_mask))
+
     # 1. ÖNCELİKLE: ANINDA KAZANMA HAMLESİ VAR MI?
     for col in valid_locations:
-        row = get_next_open_row(board, col)
-        temp_board = [row[:] for row in board]
-        drop_piece(temp_board, row, col, piece)
-        if winning_move(temp_board, piece):
+        drop_bit = 1 << (col * COLUMN_STRIDE + heights[col])
+        if has_win(my_mask | drop_bit):
             # KAZANMA HAMLESİNİ HEMEN OYNA!
             if developer_mode:
                 column_scores = {c: -999999 for c in valid_locations}
@@ -330,13 +653,11 @@ def get_best_move_optimized(board, piece, depth, developer_mode=False):
                 return col, column_scores
             else:
                 return col
-    
+
     # 2. RAKİP BİR SONRAKI TURDA KAZANACAK MI? BLOKLA!
     for col in valid_locations:
-        row = get_next_open_row(board, col)
-        temp_board = [row[:] for row in board]
-        drop_piece(temp_board, row, col, opponent)
-        if winning_move(temp_board, opponent):
+        drop_bit = 1 << (col * COLUMN_STRIDE + heights[col])
+        if has_win(opp_mask | drop_bit):
             # BLOKLAMA HAMLESİ GEREKLI!
             if developer_mode:
                 column_scores = {c: -999999 for c in valid_locations}
@@ -344,30 +665,143 @@ def get_best_move_optimized(board, piece, depth, developer_mode=False):
                 return col, column_scores
             else:
                 return col
-    
+
     # 3. Ne kazanma ne de acil blok yoksa minimax ile ara
     if developer_mode:
         # Tüm sütunların skorlarını hesapla
         column_scores = {}
-        
+        root_key = zobrist_hash_masks(ai_mask, human_mask)
+        root_mkey = zobrist_hash_masks_mirror(ai_mask, human_mask)
+
         for col in valid_locations:
-            row = get_next_open_row(board, col)
-            temp_board = [row[:] for row in board]
-            drop_piece(temp_board, row, col, piece)
-            
-            score = minimax_optimized(temp_board, depth-1, -math.inf, math.inf, False)[1]
+            bit_index = col * COLUMN_STRIDE + heights[col]
+            drop_bit = 1 << bit_index
+            heights[col] += 1
+            if piece == PLAYER_AI:
+                score = _minimax_value(ai_mask | drop_bit, human_mask, heights,
+                                       depth - 1, -INF, INF, False,
+                                       root_key ^ ZOBRIST_BIT[bit_index][0],
+                                       root_mkey ^ ZOBRIST_BIT_MIR[bit_index][0])
+            else:
+                score = _minimax_value(ai_mask, human_mask | drop_bit, heights,
+                                       depth - 1, -INF, INF, False,
+                                       root_key ^ ZOBRIST_BIT[bit_index][1],
+                                       root_mkey ^ ZOBRIST_BIT_MIR[bit_index][1])
+            heights[col] -= 1
             column_scores[col] = score
-        
+
         # En iyi hamleyi bul
         best_col = max(column_scores.items(), key=lambda x: x[1])[0]
         return best_col, column_scores
-    
+
     else:
-        # Sadece en iyi hamleyi bul
-        col, score = minimax_optimized(board, depth, -math.inf, math.inf, True)
+        # Sadece en iyi hamleyi bul — iteratif derinleşme ile: sığ turların
+        # TT'ye yazdığı best-move'lar derin turlarda hamle sıralaması olarak
+        # geri döner ve alpha-beta'yı teorik optimuma yaklaştırır. Sığ
+        # turların maliyeti son turun yanında ihmal edilebilir (~b^d serisi).
+        root_key = zobrist_hash_masks(ai_mask, human_mask)
+        root_mkey = zobrist_hash_masks_mirror(ai_mask, human_mask)
+        deadline = (None if time_budget is None
+                    else time.perf_counter() + time_budget)
+        col = None
+        for d in range(2, depth, 2):
+            col, _ = _root_best(ai_mask, human_mask, heights, d,
+                                root_key, root_mkey)
+            if deadline is not None and time.perf_counter() >= deadline:
+                return col
+        col, score = _root_best(ai_mask, human_mask, heights, depth,
+                                root_key, root_mkey)
         return col
 
+# ---------------------------------------------------------------------------
+# ROOT-PARALLEL MINIMAX
+#
+# Kökün en fazla 7 çocuğu var; her birini ayrı process'te sıralı alpha-beta
+# ile ara. Workerlar paylaşılan bir alpha sınırı üzerinden birbirlerinin en
+# iyi skoruna karşı budama yapar. 8 çekirdekte ~7 worker'a kadar neredeyse
+# lineer hızlanma = aynı bütçede yaklaşık bir ply daha derinlik.
+# ---------------------------------------------------------------------------
+
+ROOT_ALPHA_INIT = -10000001  # -inf yerine int sentinel (Value('i') için)
+
+_shared_alpha = None  # worker process'lere fork ile miras kalır
+
+
+def _init_root_worker(alpha):
+    global _shared_alpha
+    _shared_alpha = alpha
+
+
+def _root_child_search(ai_mask, human_mask, heights, col, piece, depth):
+    """Tek bir kök çocuğunu ara (worker process içinde çalışır)."""
+    drop_bit = 1 << (col * COLUMN_STRIDE + heights[col])
+    heights = array('b', heights)
+    heights[col] += 1
+    if piece == PLAYER_AI:
+        ai_mask |= drop_bit
+    else:
+        human_mask |= drop_bit
+
+    # Ucuz sınır okuması: diğer workerlar alpha'yı yükselttiyse
+    # bu alt ağaç daha dar pencereyle aranır
+    alpha = _shared_alpha.value
+    score = _minimax_value(ai_mask, human_mask, heights,
+                           depth - 1, alpha, INF, False,
+                           zobrist_hash_masks(ai_mask, human_mask),
+                           zobrist_hash_masks_mirror(ai_mask, human_mask))
+
+    with _shared_alpha.get_lock():
+        if score > _shared_alpha.value:
+            _shared_alpha.value = score
+
+    return col, score
+
+
+def get_best_move_root_parallel(board, piece, depth, developer_mode=False):
+    """
+    Kök seviyesinde paralel minimax.
+
+    Dönüş get_best_move_bitboard ile aynı sözleşmede:
+    (best_col, column_scores) — developer_mode kapalıysa scores None.
+    """
+    ai_mask, human_mask, heights = masks_from_board(board)
+    valid_locations = list(get_valid_locations_mask(ai_mask | human_mask))
+    if len(valid_locations) <= 1:
+        only = valid_locations[0] if valid_locations else None
+        return only, ({only: 0} if developer_mode and only is not None else None)
+
+    # Kökte tüm çocuklar zaten aranacak: generator'ı listeye aç
+    if piece == PLAYER_AI:
+        ordered = list(order_moves(ai_mask, human_mask, heights,
+                                   valid_locations, depth))
+    else:
+        ordered = list(order_moves(human_mask, ai_mask, heights,
+                                   valid_locations, depth))
+    shared_alpha = multiprocessing.Value('i', ROOT_ALPHA_INIT)
+
+    workers = min(len(ordered), os.cpu_count() or 1)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_root_worker,
+        initargs=(shared_alpha,),
+    ) as pool:
+        futures = [
+            pool.submit(_root_child_search, ai_mask, human_mask, heights,
+                        col, piece, depth)
+            for col in ordered
+        ]
+        results = [f.result() for f in futures]
+
+    column_scores = dict(results)
+    best_col = max(ordered, key=lambda c: column_scores[c])
+
+    if developer_mode:
+        return best_col, column_scores
+    return best_col, None
+
+
 # Backward compatibility: app.py'nin get_best_move kullanabilmesi için alias
-def get_best_move(board, piece, depth, developer_mode=False):
+def get_best_move(board, piece, depth, developer_mode=False, time_budget=None):
     """Alias for get_best_move_optimized - backward compatibility"""
-    return get_best_move_optimized(board, piece, depth, developer_mode)
\ No newline at end of file
+    return get_best_move_optimized(board, piece, depth, developer_mode,
+                                   time_budget)
\ No newline at end of file
@@ -20,23 +20,53 @@ OPTIMIZATIONS:
 import time
 from typing import List, Tuple, Dict, Optional
 from .bitboard_engine import Bitboard, ROWS, COLS, PLAYER_AI, PLAYER_HUMAN
-from .agent import score_position  # Use traditional evaluation!
+from .agent import score_position_bb  # Use traditional evaluation (mask form)!
 
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
 
 # Transposition Table - Global cache
-TRANSPOSITION_TABLE_BITBOARD: Dict[int, Tuple[int, int, int]] = {}  # {hash: (depth, score, best_move)}
+# {hash: (depth, flag, score, best_move)} — flag olmadan budanmış (bound)
+# skorlar exact'mış gibi geri dönüyordu; bkz. TT_* bayrakları aşağıda.
+TRANSPOSITION_TABLE_BITBOARD: Dict[int, Tuple[int, int, int, int]] = {}
+
+# TT entry flags: skor tam mı yoksa alpha-beta penceresinden bir sınır mı?
+TT_EXACT = 0
+TT_LOWER = 1  # score bir alt sınır (beta cutoff'tan geldi)
+TT_UPPER = 2  # score bir üst sınır (alpha'yı geçemedi)
+
+# Bellek emniyeti: tablo sınırsız büyüyordu (uzun oturumda yüz binlerce
+# pozisyon). Dolunca baştan başlanır; girdiler zaten hamleler arası
+# yeniden üretilir.
+TT_MAX_SIZE = 1 << 20
 
 # Killer Moves - Heuristic for move ordering
-KILLER_MOVES: Dict[int, List[int]] = {}  # {depth: [move1, move2]}
+# Sabit iki slot, MRU sırada: cutoff'ta yeni killer öne, eski ikinci
+# slota kayar — insert(0)/pop() ile liste kaydırmak yok.
+KILLER_MOVES: Dict[int, List[Optional[int]]] = {}  # {depth: [move1, move2]}
 
 # Constants
 WIN_SCORE = 1_000_000
 DRAW_SCORE = 0
 MAX_DEPTH = 20
 
+# Sonsuzluk yerine int sentinel: tüm skorlar ±WIN_SCORE bandında, float
+# karışınca her alpha-beta karşılaştırması int->float terfisi ödüyordu.
+INF = 10 ** 9
+
+
+def _tt_store(board_hash: int, depth: int, flag: int, score: int,
+              best_move: Optional[int]) -> None:
+    """Replace-if-deeper politikasıyla TT'ye yaz (sığ sonuç derini ezmez)."""
+    entry = TRANSPOSITION_TABLE_BITBOARD.get(board_hash)
+    if entry is None:
+        if len(TRANSPOSITION_TABLE_BITBOARD) >= TT_MAX_SIZE:
+            TRANSPOSITION_TABLE_BITBOARD.clear()
+    elif entry[0] > depth:
+        return
+    TRANSPOSITION_TABLE_BITBOARD[board_hash] = (depth, flag, score, best_move)
+
 
 # ============================================================================
 # BITBOARD HELPERS
@@ -63,93 +93,64 @@ def bitboard_from_2d(board: List[List[int]]) -> Bitboard:
     return bitboard
 
 
-def bitboard_to_2d(bitboard: Bitboard) -> List[List[int]]:
-    """
-    Convert Bitboard to 2D board (game.py format)
-    
-    bitboard: PLAYER_AI=0, PLAYER_HUMAN=1
-    game.py: PLAYER_AI=1, PLAYER_HUMAN=-1, EMPTY=0
-    """
-    board = [[0 for _ in range(COLS)] for _ in range(ROWS)]
-    
-    for row in range(ROWS):
-        for col in range(COLS):
-            cell = bitboard.get_cell(row, col)
-            if cell == 0:  # AI in bitboard
-                board[row][col] = 1  # AI in game.py
-            elif cell == 1:  # Human in bitboard
-                board[row][col] = -1  # Human in game.py
-            # else: EMPTY (2) stays 0
-    
-    return board
-
-
 def bitboard_hash(bitboard: Bitboard) -> int:
     """Fast hash for transposition table"""
     return bitboard.board
 
 
-def bitboard_check_win_fast(bitboard: Bitboard, player_bit: int, last_col: int) -> bool:
+def mirror_board_int(board: int) -> int:
     """
-    Fast win check around last move
-    Only checks 4 directions from last placed piece
+    9-bit kolon şeritlerini soldan sağa çevirir (sütun c <-> 6-c).
+
+    Connect4 sol-sağ simetriktir: P ve ayna(P) aynı minimax değerine
+    sahiptir. TT anahtarı min(board, ayna) olarak kanonikleştirilince
+    bir pozisyon ve aynası tek girdiyi paylaşır — efektif kapasite
+    açılış/orta oyunda ikiye katlanır. Yükseklik yardımcı bitleri de
+    şeritle birlikte taşındığı için ayna tahta geçerli bir kodlamadır.
     """
-    if bitboard.heights[last_col] == 0:
-        return False
-    
-    last_row = bitboard.heights[last_col] - 1
-    
-    # Directions: horizontal, vertical, diagonal/, diagonal\
-    directions = [
-        [(0, 1), (0, -1)],   # Horizontal
-        [(1, 0), (-1, 0)],   # Vertical
-        [(1, 1), (-1, -1)],  # Diagonal /
-        [(1, -1), (-1, 1)]   # Diagonal \
-    ]
-    
-    for direction_pair in directions:
-        count = 1  # Count the piece we just placed
-        
-        for dr, dc in direction_pair:
-            r, c = last_row + dr, last_col + dc
-            
-            while 0 <= r < ROWS and 0 <= c < COLS:
-                if bitboard.get_cell(r, c) == player_bit:
-                    count += 1
-                    r += dr
-                    c += dc
-                else:
-                    break
-        
-        if count >= 4:
+    m = 0
+    for col in range(COLS):
+        m |= ((board >> (col * 9)) & 0x1FF) << ((COLS - 1 - col) * 9)
+    return m
+
+
+def _has_four(mask: int) -> bool:
+    """
+    SWAR-style four-in-a-row test on a raw uint64 player mask.
+
+    Layout: 7 bits per column (6 cells + sentinel), bit = col*7 + row.
+    Shifts: 1=vertical, 7=horizontal, 6 and 8 = the two diagonals.
+    All 69 possible lines are checked with 8 bitwise ops, no branches
+    per line - this is the kernel-friendly form the search should use
+    instead of walking cells in Python.
+    """
+    for s in (1, 7, 6, 8):
+        m = mask & (mask >> s)
+        if m & (m >> (2 * s)):
             return True
-    
     return False
 
 
+def player_mask(bitboard: Bitboard, player_bit: int) -> int:
+    """
+    Extract one player's pieces from a Bitboard as a 7-bits-per-column
+    mask (bit = col*7 + row) suitable for _has_four. O(42), done once
+    per top-level call - not per node.
+    """
+    mask = 0
+    for col in range(COLS):
+        col_bits = (bitboard.board >> (col * 9)) & 0x3F
+        for row in range(bitboard.heights[col]):
+            if ((col_bits >> row) & 1) == player_bit:
+                mask |= 1 << (col * 7 + row)
+    return mask
+
+
 def get_valid_moves_bitboard(bitboard: Bitboard) -> List[int]:
     """Get valid columns"""
     return [col for col in range(COLS) if bitboard.heights[col] < ROWS]
 
 
-def is_terminal_bitboard(bitboard: Bitboard, last_col: Optional[int] = None) -> Tuple[bool, Optional[int]]:
-    """
-    Check if game is over
-    Returns: (is_terminal, winner_bit)
-    winner_bit: 0=AI, 1=Human, None=Draw
-    """
-    if last_col is not None and bitboard.heights[last_col] > 0:
-        if bitboard_check_win_fast(bitboard, PLAYER_AI, last_col):
-            return True, PLAYER_AI
-        if bitboard_check_win_fast(bitboard, PLAYER_HUMAN, last_col):
-            return True, PLAYER_HUMAN
-    
-    if len(get_valid_moves_bitboard(bitboard)) == 0:
-        return True, None  # Draw
-    
-    return False, None
-
-
 # ============================================================================
 # MINIMAX WITH ALPHA-BETA PRUNING (BITBOARD)
 # ============================================================================
@@ -157,15 +158,16 @@ def is_terminal_bitboard(bitboard: Bitboard, last_col: Optional[int] = None) ->
 def minimax_bitboard(
     bitboard: Bitboard,
     depth: int,
-    alpha: float,
-    beta: float,
+    alpha: int,
+    beta: int,
     maximizing_player: bool,
     player_bit: int,
-    last_col: Optional[int] = None
+    ai_mask: int,
+    hu_mask: int
 ) -> Tuple[int, Optional[int]]:
     """
     Minimax with alpha-beta pruning on bitboard
-    
+
     Args:
         bitboard: Current position
         depth: Remaining depth
@@ -173,83 +175,115 @@ def minimax_bitboard(
         beta: Beta value
         maximizing_player: True if maximizing
         player_bit: Current player (0=AI, 1=Human)
-        last_col: Last move column (for win detection)
-    
+        ai_mask: AI taşlarının 7-stride mask'i (bit = col*7 + row)
+        hu_mask: İnsan taşlarının 7-stride mask'i
+
+    Mask çifti recursion boyunca hamle başına tek OR ile taşınır;
+    kazanç testi hücre hücre yürüyen eski walker yerine _has_four'un
+    8 bit işlemidir.
+
     Returns:
         (score, best_column)
     """
-    # Check transposition table
-    board_hash = bitboard_hash(bitboard)
-    if board_hash in TRANSPOSITION_TABLE_BITBOARD:
-        cached_depth, cached_score, cached_move = TRANSPOSITION_TABLE_BITBOARD[board_hash]
+    # Check transposition table: EXACT direkt döner, LOWER/UPPER pencereyi
+    # daraltır; sığ girdilerin best_move'u yine sıralamada kullanılır.
+    # Anahtar simetri-katlanmış: min(board, ayna) — ayna girdisinden
+    # gelen best_move sütunu geri aynalanır.
+    raw = bitboard_hash(bitboard)
+    mirror = mirror_board_int(raw)
+    if mirror < raw:
+        board_hash = mirror
+        mirrored = True
+    else:
+        board_hash = raw
+        mirrored = False
+    tt_move = None
+    entry = TRANSPOSITION_TABLE_BITBOARD.get(board_hash)
+    if entry is not None:
+        cached_depth, cached_flag, cached_score, cached_move = entry
+        if cached_move is not None:
+            tt_move = COLS - 1 - cached_move if mirrored else cached_move
         if cached_depth >= depth:
-            return cached_score, cached_move
-    
-    # Terminal state check
-    is_terminal, winner = is_terminal_bitboard(bitboard, last_col)
-    
-    if is_terminal:
-        if winner == PLAYER_AI:
-            return WIN_SCORE - (20 - depth), None  # Prefer faster wins
-        elif winner == PLAYER_HUMAN:
-            return -WIN_SCORE + (20 - depth), None  # Prefer slower losses
-        else:
-            return DRAW_SCORE, None
-    
+            if cached_flag == TT_EXACT:
+                return cached_score, tt_move
+            if cached_flag == TT_LOWER and cached_score > alpha:
+                alpha = cached_score
+            elif cached_flag == TT_UPPER and cached_score < beta:
+                beta = cached_score
+            if alpha >= beta:
+                return cached_score, tt_move
+
+    # Terminal state check: sadece son hamleyi yapan taraf kazanmış
+    # olabilir ama iki mask'i de test etmek 16 ucuz bit işlemi
+    if _has_four(ai_mask):
+        return WIN_SCORE - (20 - depth), None  # Prefer faster wins
+    if _has_four(hu_mask):
+        return -WIN_SCORE + (20 - depth), None  # Prefer slower losses
+
+    # Get valid moves (beraberlik kontrolü de buradan)
+    valid_moves = get_valid_moves_bitboard(bitboard)
+
+    if not valid_moves:
+        return DRAW_SCORE, None
+
     # Depth limit reached
     if depth == 0:
-        # Convert bitboard to 2D array and use traditional evaluation
-        board_2d = bitboard_to_2d(bitboard)
-        # Evaluate from AI perspective (piece=1 in game.py format)
-        score = score_position(board_2d, 1)  # 1 = PLAYER_AI in game.py
-        
+        # Mask'ler zaten 7-stride formatında: 2D'ye çevirmeden doğrudan
+        # popcount'lu değerlendirme (AI perspektifi, agent.py ile aynı)
+        score = score_position_bb(ai_mask, hu_mask)
+
         # If maximizing_player=False, we're minimizing for AI, so negate
         if not maximizing_player:
             score = -score
-        
+
         return score, None
-    
-    # Get valid moves
-    valid_moves = get_valid_moves_bitboard(bitboard)
-    
-    if not valid_moves:
-        return DRAW_SCORE, None
-    
-    # Move ordering: center first, then killer moves
+
+    # Move ordering: TT best move first, then center, then killer moves
     def move_priority(col):
+        if col == tt_move:
+            return -100  # Önceki aramanın en iyi hamlesi her zaman ilk
+
         priority = abs(col - 3)  # Distance from center (lower is better)
-        
-        # Killer move bonus
-        if depth in KILLER_MOVES and col in KILLER_MOVES[depth]:
+
+        # Killer move bonus (iki int karşılaştırması, liste taraması yok)
+        killers = KILLER_MOVES.get(depth)
+        if killers is not None and (col == killers[0] or col == killers[1]):
             priority -= 10
-        
+
         return priority
-    
+
     valid_moves.sort(key=move_priority)
-    
+
     best_col = valid_moves[0]
-    
+    alpha_orig = alpha
+    beta_orig = beta
+
     if maximizing_player:
-        max_eval = float('-inf')
+        max_eval = -INF
         
         for col in valid_moves:
-            # Make move (bitboard copy is very fast!)
-            new_bitboard = Bitboard()
-            new_bitboard.board = bitboard.board
-            new_bitboard.heights = bitboard.heights.copy()
-            new_bitboard.make_move(col, player_bit)
-            
-            # Recursive call
+            # Make/unmake: kopya yok, hamle yapılır, arama döner, geri alınır.
+            # 7-stride mask'ler int olduğundan çocuk mask'i tek OR.
+            drop_bit = 1 << (col * 7 + bitboard.heights[col])
+            if player_bit == 0:
+                child_ai, child_hu = ai_mask | drop_bit, hu_mask
+            else:
+                child_ai, child_hu = ai_mask, hu_mask | drop_bit
+            bitboard.make_move(col, player_bit)
+
             eval_score, _ = minimax_bitboard(
-                new_bitboard, 
-                depth - 1, 
-                alpha, 
-                beta, 
-                False, 
+                bitboard,
+                depth - 1,
+                alpha,
+                beta,
+                False,
                 1 - player_bit,
-                col
+                child_ai,
+                child_hu
             )
-            
+
+            bitboard.unmake_move(col, player_bit)
+
             if eval_score > max_eval:
                 max_eval = eval_score
                 best_col = col
@@ -257,39 +291,51 @@ def minimax_bitboard(
             alpha = max(alpha, eval_score)
             
             if beta <= alpha:
-                # Killer move heuristic
-                if depth not in KILLER_MOVES:
-                    KILLER_MOVES[depth] = []
-                if col not in KILLER_MOVES[depth]:
-                    KILLER_MOVES[depth].append(col)
-                    if len(KILLER_MOVES[depth]) > 2:
-                        KILLER_MOVES[depth].pop(0)
+                # Killer move heuristic (sabit iki slot)
+                killers = KILLER_MOVES.get(depth)
+                if killers is None:
+                    KILLER_MOVES[depth] = [col, None]
+                elif col != killers[0]:
+                    killers[1] = killers[0]
+                    killers[0] = col
                 break  # Beta cutoff
         
-        # Cache result
-        TRANSPOSITION_TABLE_BITBOARD[board_hash] = (depth, max_eval, best_col)
-        
+        # Cache result (skorun pencereye göre niteliğiyle birlikte)
+        if max_eval <= alpha_orig:
+            flag = TT_UPPER
+        elif max_eval >= beta_orig:
+            flag = TT_LOWER
+        else:
+            flag = TT_EXACT
+        _tt_store(board_hash, depth, flag, max_eval,
+                  COLS - 1 - best_col if mirrored else best_col)
+
         return max_eval, best_col
     
     else:  # Minimizing player
-        min_eval = float('inf')
+        min_eval = INF
         
         for col in valid_moves:
-            new_bitboard = Bitboard()
-            new_bitboard.board = bitboard.board
-            new_bitboard.heights = bitboard.heights.copy()
-            new_bitboard.make_move(col, player_bit)
-            
+            drop_bit = 1 << (col * 7 + bitboard.heights[col])
+            if player_bit == 0:
+                child_ai, child_hu = ai_mask | drop_bit, hu_mask
+            else:
+                child_ai, child_hu = ai_mask, hu_mask | drop_bit
+            bitboard.make_move(col, player_bit)
+
             eval_score, _ = minimax_bitboard(
-                new_bitboard, 
-                depth - 1, 
-                alpha, 
-                beta, 
-                True, 
+                bitboard,
+                depth - 1,
+                alpha,
+                beta,
+                True,
                 1 - player_bit,
-                col
+                child_ai,
+                child_hu
             )
-            
+
+            bitboard.unmake_move(col, player_bit)
+
             if eval_score < min_eval:
                 min_eval = eval_score
                 best_col = col
@@ -297,16 +343,23 @@ def minimax_bitboard(
             beta = min(beta, eval_score)
             
             if beta <= alpha:
-                if depth not in KILLER_MOVES:
-                    KILLER_MOVES[depth] = []
-                if col not in KILLER_MOVES[depth]:
-                    KILLER_MOVES[depth].append(col)
-                    if len(KILLER_MOVES[depth]) > 2:
-                        KILLER_MOVES[depth].pop(0)
+                killers = KILLER_MOVES.get(depth)
+                if killers is None:
+                    KILLER_MOVES[depth] = [col, None]
+                elif col != killers[0]:
+                    killers[1] = killers[0]
+                    killers[0] = col
                 break
         
-        TRANSPOSITION_TABLE_BITBOARD[board_hash] = (depth, min_eval, best_col)
-        
+        if min_eval <= alpha_orig:
+            flag = TT_UPPER
+        elif min_eval >= beta_orig:
+            flag = TT_LOWER
+        else:
+            flag = TT_EXACT
+        _tt_store(board_hash, depth, flag, min_eval,
+                  COLS - 1 - best_col if mirrored else best_col)
+
         return min_eval, best_col
 
 
@@ -338,30 +391,27 @@ def get_best_move_bitboard(
     # Convert player format
     player_bit = 0 if player == 1 else 1
     
-    # Check immediate win
+    # Check immediate win/threat on raw uint64 masks: one OR + _has_four
+    # per column instead of cloning the Bitboard and walking cells
     valid_moves = get_valid_moves_bitboard(bitboard)
-    
+    opponent_bit = 1 - player_bit
+
+    my_mask = player_mask(bitboard, player_bit)
+    opp_mask = player_mask(bitboard, opponent_bit)
+
     for col in valid_moves:
-        test_board = Bitboard()
-        test_board.board = bitboard.board
-        test_board.heights = bitboard.heights.copy()
-        test_board.make_move(col, player_bit)
-        
-        if bitboard_check_win_fast(test_board, player_bit, col):
+        drop_bit = 1 << (col * 7 + bitboard.heights[col])
+
+        if _has_four(my_mask | drop_bit):
             print(f"🎯 Bitboard Minimax: Immediate win at column {col}")
             if developer_mode:
                 return col, {col: WIN_SCORE}
             return col, None
-    
-    # Check immediate threat
-    opponent_bit = 1 - player_bit
+
     for col in valid_moves:
-        test_board = Bitboard()
-        test_board.board = bitboard.board
-        test_board.heights = bitboard.heights.copy()
-        test_board.make_move(col, opponent_bit)
-        
-        if bitboard_check_win_fast(test_board, opponent_bit, col):
+        drop_bit = 1 << (col * 7 + bitboard.heights[col])
+
+        if _has_four(opp_mask | drop_bit):
             print(f"🛡️ Bitboard Minimax: Blocking threat at column {col}")
             if developer_mode:
                 return col, {col: WIN_SCORE - 1}
@@ -371,28 +421,37 @@ def get_best_move_bitboard(
     start_time = time.time()
     
     column_scores = {}
-    best_score = float('-inf')  # Always maximize from current player's perspective
+    best_score = -INF  # Always maximize from current player's perspective
     best_col = valid_moves[0] if valid_moves else 3
     
+    # player_mask zaten AI/insan perspektifine göre hesaplandı
+    ai_mask = my_mask if player_bit == 0 else opp_mask
+    hu_mask = opp_mask if player_bit == 0 else my_mask
+
     for col in valid_moves:
-        # Make move
-        new_bitboard = Bitboard()
-        new_bitboard.board = bitboard.board
-        new_bitboard.heights = bitboard.heights.copy()
-        new_bitboard.make_move(col, player_bit)
-        
+        # Make move (kökte de make/unmake: kopya gerekmez)
+        drop_bit = 1 << (col * 7 + bitboard.heights[col])
+        if player_bit == 0:
+            child_ai, child_hu = ai_mask | drop_bit, hu_mask
+        else:
+            child_ai, child_hu = ai_mask, hu_mask | drop_bit
+        bitboard.make_move(col, player_bit)
+
         # Minimax search (always start maximizing for current player)
         # After we move, it's opponent's turn (minimizing)
         score, _ = minimax_bitboard(
-            new_bitboard,
+            bitboard,
             depth - 1,
-            float('-inf'),
-            float('inf'),
+            -INF,
+            INF,
             False,  # Opponent minimizes
             opponent_bit,
-            col
+            child_ai,
+            child_hu
         )
-        
+
+        bitboard.unmake_move(col, player_bit)
+
         # If playing as PLAYER_HUMAN (-1), flip score to match perspective
         # Evaluation is always from AI perspective, so flip for Human
         if player == -1:
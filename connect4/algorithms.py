@@ -11,8 +11,10 @@ from typing import List, Tuple, Optional, Dict, Any
 from .game import (
     ROWS, COLS, WINDOW_LENGTH, EMPTY, PLAYER_AI, PLAYER_HUMAN,
     is_terminal_node, winning_move, get_valid_locations,
-    get_next_open_row, drop_piece
+    get_next_open_row, drop_piece,
+    COLUMN_STRIDE, BOARD_MASK, board_to_masks, has_win
 )
+from .agent import WIN_MASKS, CENTER_MASK
 
 
 class SearchMetrics:
@@ -39,17 +41,26 @@ class SearchMetrics:
 
 
 def evaluate_window(window, piece):
-    """Heuristic değerlendirme - 4'lü pencere için skor"""
-    score = 0
-    opponent_piece = PLAYER_HUMAN if piece == PLAYER_AI else PLAYER_AI
+    """Heuristic değerlendirme - 4'lü pencere için skor
+
+    Tek geçişte üç sayım: üç ayrı window.count() taraması yerine 4 hücre
+    bir kez gezilir (piece/EMPTY dışındaki her şey rakip taştır, ayrıca
+    opponent_piece hesaplamaya gerek yok).
 
-    piece_count = window.count(piece)
-    empty_count = window.count(EMPTY)
-    opponent_count = window.count(opponent_piece)
+    Tamamlanmış 4'lü burada puanlanmaz: score_position kazanan tahtayı
+    en başta winning_move ile yakalayıp ±10000000 sentineliyle döner.
+    """
+    piece_count = empty_count = opponent_count = 0
+    for cell in window:
+        if cell == piece:
+            piece_count += 1
+        elif cell == EMPTY:
+            empty_count += 1
+        else:
+            opponent_count += 1
 
-    if piece_count == 4:
-        score += 10000
-    elif piece_count == 3 and empty_count == 1:
+    score = 0
+    if piece_count == 3 and empty_count == 1:
         score += 10
     elif piece_count == 2 and empty_count == 2:
         score += 3
@@ -60,41 +71,130 @@ def evaluate_window(window, piece):
     return score
 
 
+# 69 kazanç çizgisinin hücre index'leri, import'ta bir kez üretilir.
+# Her çizgi düzleştirilmiş (r0,c0,r1,c1,r2,c2,r3,c3) 8'lisi: değerlendirme
+# anında dilimleme, range() ve liste comprehension kalmaz — sadece index.
+def _enumerate_win_lines():
+    lines = []
+    for r, c, dr, dc in (
+        [(r, c, 0, 1) for r in range(ROWS)
+         for c in range(COLS - (WINDOW_LENGTH - 1))] +            # yatay
+        [(r, c, 1, 0) for c in range(COLS)
+         for r in range(ROWS - (WINDOW_LENGTH - 1))] +            # dikey
+        [(r, c, 1, 1) for r in range(ROWS - (WINDOW_LENGTH - 1))
+         for c in range(COLS - (WINDOW_LENGTH - 1))] +            # pozitif çapraz
+        [(r + WINDOW_LENGTH - 1, c, -1, 1)
+         for r in range(ROWS - (WINDOW_LENGTH - 1))
+         for c in range(COLS - (WINDOW_LENGTH - 1))]              # negatif çapraz
+    ):
+        line = []
+        for i in range(WINDOW_LENGTH):
+            line += [r + dr * i, c + dc * i]
+        lines.append(tuple(line))
+    return tuple(lines)
+
+
+WIN_LINES = _enumerate_win_lines()  # 69 çizgi
+
+
 def score_position(board, piece):
-    """Heuristic değerlendirme - tüm tahta için skor"""
+    """Heuristic değerlendirme - tüm tahta için skor
+
+    Kazanılmış tahta erken döner: 69 pencereyi toplamaya gerek yok,
+    minimax'ın terminal sentineliyle aynı ±10000000 değeri kullanılır.
+    """
+    if winning_move(board, piece):
+        return 10000000
+    opponent = PLAYER_HUMAN if piece == PLAYER_AI else PLAYER_AI
+    if winning_move(board, opponent):
+        return -10000000
+
     score = 0
 
-    # Merkez sütun bonusu
-    center_array = [board[r][COLS // 2] for r in range(ROWS)]
-    center_count = center_array.count(piece)
-    score += center_count * 5
-
-    # Yatay
-    for r in range(ROWS):
-        row_array = board[r]
-        for c in range(COLS - (WINDOW_LENGTH - 1)):
-            window = row_array[c:c+WINDOW_LENGTH]
-            score += evaluate_window(window, piece)
-
-    # Dikey
-    for c in range(COLS):
-        col_array = [board[r][c] for r in range(ROWS)]
-        for r in range(ROWS - (WINDOW_LENGTH - 1)):
-            window = col_array[r:r+WINDOW_LENGTH]
-            score += evaluate_window(window, piece)
-
-    # Pozitif çapraz
-    for r in range(ROWS - (WINDOW_LENGTH - 1)):
-        for c in range(COLS - (WINDOW_LENGTH - 1)):
-            window = [board[r+i][c+i] for i in range(WINDOW_LENGTH)]
-            score += evaluate_window(window, piece)
-
-    # Negatif çapraz
-    for r in range(ROWS - (WINDOW_LENGTH - 1)):
-        for c in range(COLS - (WINDOW_LENGTH - 1)):
-            window = [board[r+i][c+(WINDOW_LENGTH-1)-i] for i in range(WINDOW_LENGTH)]
-            score += evaluate_window(window, piece)
-            
+    # Merkez sütun bonusu (liste kurup .count ile taramak yerine tek geçiş,
+    # alokasyon yok; mask tarafında aynı iş tek popcount'tur)
+    center = COLS // 2
+    score += 5 * sum(1 for r in range(ROWS) if board[r][center] == piece)
+
+    # 69 pencere: önceden hesaplanmış index tablosu üzerinden tek döngü
+    # (dört ayrı çift-döngü + dilimleme/alokasyon yerine)
+    for r0, c0, r1, c1, r2, c2, r3, c3 in WIN_LINES:
+        window = (board[r0][c0], board[r1][c1], board[r2][c2], board[r3][c3])
+        score += evaluate_window(window, piece)
+
+    return score
+
+
+# ============================================================================
+# BITBOARD ALTYAPISI (minimax fonksiyonları için)
+# ============================================================================
+
+# Pencere skoru LUT'u: (kendi_taş, rakip_taş) sayım çiftinden evaluate_window
+# ile birebir aynı skora gider. Pencerede boş sayısı 4-p-o olduğundan
+# 15 geçerli kombinasyon vardır; 25'lik düz listeye (p*5 + o) açılır.
+_NET_WINDOW = [0] * 25
+for _p in range(5):
+    for _o in range(5 - _p):
+        _e = 4 - _p - _o
+        _s = 0
+        # p == 4 burada puanlanmaz: kazanılmış tahta score_position_masks'in
+        # başındaki has_win kısa devresiyle ±10000000 olarak döner
+        if _p == 3 and _e == 1:
+            _s += 10
+        elif _p == 2 and _e == 2:
+            _s += 3
+        if _o == 3 and _e == 1:
+            _s -= 80
+        _NET_WINDOW[_p * 5 + _o] = _s
+_NET_WINDOW = tuple(_NET_WINDOW)
+del _p, _o, _e, _s
+
+
+def _masks_from_board(board):
+    """2D tahtadan (ai_mask, hu_mask, heights) üçlüsünü çıkarır (bit = col*7+row)."""
+    masks = board_to_masks(board)
+    occ = masks['o']
+    ai = masks['p']
+    heights = [((occ >> (c * COLUMN_STRIDE)) & 0x3F).bit_count()
+               for c in range(COLS)]
+    return ai, occ ^ ai, heights
+
+
+# Değerlendirme cache'i: aynı pozisyona minimax leaf'lerinden ve frontier
+# aramalarının puanlamasından farklı yollarla tekrar tekrar gelinir;
+# 69 pencerelik tarama pozisyon başına bir kez yapılır. Anahtar mask
+# çiftinin kendisi (perspektif dahil). Dolunca baştan başlanır.
+_EVAL_CACHE = {}
+_EVAL_CACHE_MAX = 1 << 15
+
+
+def score_position_masks(my_mask, opp_mask):
+    """
+    score_position'ın bitboard karşılığı — aynı heuristik, mask'ler üzerinden.
+
+    69 kazanç çizgisi WIN_MASKS'te hazır durur; pencere başına iki popcount
+    ve tek LUT index'i kalır, liste dilimleme / window.count yoktur.
+    Kazanılmış pozisyon pencere toplamına girmeden sentinelle döner.
+    """
+    if has_win(my_mask):
+        return 10000000
+    if has_win(opp_mask):
+        return -10000000
+
+    key = (my_mask, opp_mask)
+    cached = _EVAL_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    score = 5 * (my_mask & CENTER_MASK).bit_count()
+    _net = _NET_WINDOW
+    for mask in WIN_MASKS:
+        score += _net[(my_mask & mask).bit_count() * 5
+                      + (opp_mask & mask).bit_count()]
+
+    if len(_EVAL_CACHE) >= _EVAL_CACHE_MAX:
+        _EVAL_CACHE.clear()
+    _EVAL_CACHE[key] = score
     return score
 
 
@@ -109,45 +209,62 @@ def minimax_basic(board, depth, maximizing_player, metrics: SearchMetrics):
     Optimality: Evet (optimal hamleyi bulur)
     Time: O(b^d) - b: branching factor, d: depth
     Space: O(b*d) - recursive stack
+
+    Sınır sarmalayıcı: 2D tahta bir kere mask çiftine çevrilir, recursion
+    bitboard'lar üzerinde koşar (hamle = tek OR, geri alma = yükseklik
+    azaltma; tahta kopyası yok).
     """
+    ai_mask, hu_mask, heights = _masks_from_board(board)
+    return _minimax_basic_bb(ai_mask, hu_mask, heights, depth,
+                             maximizing_player, metrics)
+
+
+def _minimax_basic_bb(ai_mask, hu_mask, heights, depth, maximizing_player,
+                      metrics: SearchMetrics):
+    """minimax_basic'in mask tabanlı recursion gövdesi."""
     metrics.nodes_expanded += 1
     metrics.max_depth_reached = max(metrics.max_depth_reached, depth)
-    
-    valid_locations = get_valid_locations(board)
-    is_terminal = is_terminal_node(board)
-
-    if depth == 0 or is_terminal:
-        if is_terminal:
-            if winning_move(board, PLAYER_AI):
-                return (None, 10000000)
-            elif winning_move(board, PLAYER_HUMAN):
-                return (None, -10000000)
-            else:
-                return (None, 0)
-        else:
-            return (None, score_position(board, PLAYER_AI))
 
+    # Terminal kontrolü: taraf başına 8 bit işlemi (has_win)
+    if has_win(ai_mask):
+        return (None, 10000000)
+    if has_win(hu_mask):
+        return (None, -10000000)
+    occ = ai_mask | hu_mask
+    if occ == BOARD_MASK:
+        return (None, 0)
+    if depth == 0:
+        return (None, score_position_masks(ai_mask, hu_mask))
+
+    # Geçerlilik testi heights üzerinden döngü içinde: düğüm başına
+    # valid_locations listesi kurulmaz
     if maximizing_player:
         value = -math.inf
-        best_col = random.choice(valid_locations)
-        for col in valid_locations:
-            row = get_next_open_row(board, col)
-            temp_board = [row[:] for row in board]
-            drop_piece(temp_board, row, col, PLAYER_AI)
-            new_score = minimax_basic(temp_board, depth - 1, False, metrics)[1]
-            if new_score > value:
+        best_col = None
+        for col in range(COLS):
+            if heights[col] >= ROWS:
+                continue
+            bit = 1 << (col * COLUMN_STRIDE + heights[col])
+            heights[col] += 1
+            new_score = _minimax_basic_bb(ai_mask | bit, hu_mask, heights,
+                                          depth - 1, False, metrics)[1]
+            heights[col] -= 1
+            if best_col is None or new_score > value:
                 value = new_score
                 best_col = col
         return best_col, value
     else:
         value = math.inf
-        best_col = random.choice(valid_locations)
-        for col in valid_locations:
-            row = get_next_open_row(board, col)
-            temp_board = [row[:] for row in board]
-            drop_piece(temp_board, row, col, PLAYER_HUMAN)
-            new_score = minimax_basic(temp_board, depth - 1, True, metrics)[1]
-            if new_score < value:
+        best_col = None
+        for col in range(COLS):
+            if heights[col] >= ROWS:
+                continue
+            bit = 1 << (col * COLUMN_STRIDE + heights[col])
+            heights[col] += 1
+            new_score = _minimax_basic_bb(ai_mask, hu_mask | bit, heights,
+                                          depth - 1, True, metrics)[1]
+            heights[col] -= 1
+            if best_col is None or new_score < value:
                 value = new_score
                 best_col = col
         return best_col, value
@@ -157,6 +274,48 @@ def minimax_basic(board, depth, maximizing_player, metrics: SearchMetrics):
 # 2. MINIMAX with ALPHA-BETA PRUNING (Informed Search)
 # ============================================================================
 
+# Transposition table: farklı hamle sıralarıyla ulaşılan aynı pozisyonun
+# yeniden aranmasını önler. Anahtar mask çiftinin kendisidir (pozisyon
+# zaten iki int; ayrıca Zobrist hash'e gerek yok): (ai << 49) | hu tek
+# 98-bit int'e paketlenir. Girdi: (depth, flag, value, best_col).
+_TT_EXACT = 0
+_TT_LOWER = 1  # value bir alt sınır (beta cutoff'tan geldi)
+_TT_UPPER = 2  # value bir üst sınır (alpha'yı geçemedi)
+ALPHA_BETA_TT = {}
+_TT_MAX = 1 << 20  # dolunca baştan başla (bellek emniyeti)
+
+# Statik merkez-dışa sütun sırası: merkez sütunlar daha çok kazanç
+# çizgisine girdiğinden cutoff'lar erken gelir (0..6 doğal sıra yerine)
+COL_ORDER = (3, 2, 4, 1, 5, 0, 6)
+
+# TT hamlesi öne alınmış 7 sıralamanın tamamı import'ta hazırlanır:
+# düğüm başına liste kurup splice etmek yerine hazır tuple seçilir
+_TT_FIRST_ORDER = tuple(
+    (t,) + tuple(c for c in COL_ORDER if c != t) for t in range(COLS)
+)
+
+# Killer moves: aynı derinlikte kardeş alt ağaçlarda beta cutoff yapmış
+# sessiz hamleler — Connect4 geometrisi tehditleri paylaştığından sıkça
+# yine çürütücüdür. Derinlik başına MRU sıralı iki slot.
+_KILLERS = {}  # {depth: [move1, move2]}
+
+
+def _ordered_cols(tt_move, k0, k1, heights):
+    """Sıralı sütun generator'ı: TT hamlesi -> killer'lar -> merkez-dışa.
+
+    Tembel üretim: cutoff ilk hamlelerde gelirse kalan sütunlar için
+    hiç iş yapılmaz, düğüm başına liste de kurulmaz.
+    """
+    if tt_move is not None and heights[tt_move] < ROWS:
+        yield tt_move
+    if k0 is not None and k0 != tt_move and heights[k0] < ROWS:
+        yield k0
+    if k1 is not None and k1 != tt_move and k1 != k0 and heights[k1] < ROWS:
+        yield k1
+    for col in COL_ORDER:
+        if col != tt_move and col != k0 and col != k1 and heights[col] < ROWS:
+            yield col
+
 def minimax_alpha_beta(board, depth, alpha, beta, maximizing_player, metrics: SearchMetrics):
     """
     Minimax + Alpha-Beta Pruning
@@ -165,56 +324,142 @@ def minimax_alpha_beta(board, depth, alpha, beta, maximizing_player, metrics: Se
     Time: O(b^(d/2)) - best case, O(b^d) - worst case
     Space: O(b*d)
     AVANTAJ: Daha az node expand eder (pruning sayesinde)
+
+    Sınır sarmalayıcı: 2D tahta bir kere mask çiftine çevrilir, recursion
+    bitboard'lar üzerinde koşar.
     """
+    ai_mask, hu_mask, heights = _masks_from_board(board)
+    _KILLERS.clear()  # killer'lar arama içi ipucudur, çağrılar arası taşınmaz
+    return _alpha_beta_bb(ai_mask, hu_mask, heights, depth, alpha, beta,
+                          maximizing_player, metrics)
+
+
+def _alpha_beta_bb(ai_mask, hu_mask, heights, depth, alpha, beta,
+                   maximizing_player, metrics: SearchMetrics):
+    """minimax_alpha_beta'nın mask tabanlı recursion gövdesi."""
     metrics.nodes_expanded += 1
     metrics.max_depth_reached = max(metrics.max_depth_reached, depth)
-    
-    valid_locations = get_valid_locations(board)
-    is_terminal = is_terminal_node(board)
-
-    if depth == 0 or is_terminal:
-        if is_terminal:
-            if winning_move(board, PLAYER_AI):
-                return (None, 10000000)
-            elif winning_move(board, PLAYER_HUMAN):
-                return (None, -10000000)
-            else:
-                return (None, 0)
-        else:
-            return (None, score_position(board, PLAYER_AI))
+
+    if has_win(ai_mask):
+        return (None, 10000000)
+    if has_win(hu_mask):
+        return (None, -10000000)
+    occ = ai_mask | hu_mask
+    if occ == BOARD_MASK:
+        return (None, 0)
+    if depth == 0:
+        return (None, score_position_masks(ai_mask, hu_mask))
+
+    # TT PROBE: yeterince derin bir girdi varsa pencereye göre kullan;
+    # sığ girdinin best_col'u yine de sıralama ipucu olarak değerlidir
+    tt_key = (ai_mask << 49) | hu_mask
+    tt_move = None
+    entry = ALPHA_BETA_TT.get(tt_key)
+    if entry is not None:
+        e_depth, e_flag, e_value, e_col = entry
+        tt_move = e_col
+        if e_depth >= depth:
+            if e_flag == _TT_EXACT:
+                return (e_col, e_value)
+            if e_flag == _TT_LOWER and e_value > alpha:
+                alpha = e_value
+            elif e_flag == _TT_UPPER and e_value < beta:
+                beta = e_value
+            if alpha >= beta:
+                metrics.pruned_branches += 1
+                return (e_col, e_value)
+
+    # MOVE ORDERING: TT hamlesi -> killer'lar -> merkez-dışa (generator)
+    killers = _KILLERS.get(depth)
+    if killers is None:
+        k0 = k1 = None
+    else:
+        k0, k1 = killers
+    move_order = _ordered_cols(tt_move, k0, k1, heights)
+    alpha_orig = alpha
+    beta_orig = beta
 
     if maximizing_player:
         value = -math.inf
-        best_col = random.choice(valid_locations)
-        for col in valid_locations:
-            row = get_next_open_row(board, col)
-            temp_board = [row[:] for row in board]
-            drop_piece(temp_board, row, col, PLAYER_AI)
-            new_score = minimax_alpha_beta(temp_board, depth - 1, alpha, beta, False, metrics)[1]
-            if new_score > value:
+        # İlk aranan çocuk best_col'u koşulsuz doldurur (None başlangıcı);
+        # düğüm non-terminal olduğundan en az bir geçerli sütun vardır
+        best_col = None
+        for col in move_order:
+            bit = 1 << (col * COLUMN_STRIDE + heights[col])
+            heights[col] += 1
+            new_score = _alpha_beta_bb(ai_mask | bit, hu_mask, heights,
+                                       depth - 1, alpha, beta, False,
+                                       metrics)[1]
+            heights[col] -= 1
+            if best_col is None or new_score > value:
                 value = new_score
                 best_col = col
             alpha = max(alpha, value)
             if alpha >= beta:
                 metrics.pruned_branches += 1
+                # KILLER KAYDET: yeni killer öne, eski ikinci slota
+                if killers is None:
+                    _KILLERS[depth] = [col, None]
+                elif col != killers[0]:
+                    killers[1] = killers[0]
+                    killers[0] = col
                 break  # Beta cut-off
-        return best_col, value
     else:
         value = math.inf
-        best_col = random.choice(valid_locations)
-        for col in valid_locations:
-            row = get_next_open_row(board, col)
-            temp_board = [row[:] for row in board]
-            drop_piece(temp_board, row, col, PLAYER_HUMAN)
-            new_score = minimax_alpha_beta(temp_board, depth - 1, alpha, beta, True, metrics)[1]
-            if new_score < value:
+        best_col = None
+        for col in move_order:
+            bit = 1 << (col * COLUMN_STRIDE + heights[col])
+            heights[col] += 1
+            new_score = _alpha_beta_bb(ai_mask, hu_mask | bit, heights,
+                                       depth - 1, alpha, beta, True,
+                                       metrics)[1]
+            heights[col] -= 1
+            if best_col is None or new_score < value:
                 value = new_score
                 best_col = col
             beta = min(beta, value)
             if alpha >= beta:
                 metrics.pruned_branches += 1
+                # KILLER KAYDET (simetrik)
+                if killers is None:
+                    _KILLERS[depth] = [col, None]
+                elif col != killers[0]:
+                    killers[1] = killers[0]
+                    killers[0] = col
                 break  # Alpha cut-off
-        return best_col, value
+
+    # TT STORE: pencereye göre EXACT / sınır bayrağıyla kaydet
+    if value <= alpha_orig:
+        flag = _TT_UPPER
+    elif value >= beta_orig:
+        flag = _TT_LOWER
+    else:
+        flag = _TT_EXACT
+    if len(ALPHA_BETA_TT) >= _TT_MAX:
+        ALPHA_BETA_TT.clear()
+    ALPHA_BETA_TT[tt_key] = (depth, flag, value, best_col)
+    return best_col, value
+
+
+def iterative_deepening(board, max_depth, metrics: SearchMetrics):
+    """
+    Iterative Deepening + Alpha-Beta
+
+    1'den max_depth'e kadar artan derinliklerle arar. Her sığ iterasyon
+    TT'ye best_col yazar; bir sonraki iterasyon o hamleyi ilk dener ve
+    neredeyse optimal sıralamayla budar. Ağaç üstel büyüdüğünden sığ
+    iterasyonların maliyeti son derin iterasyonun yanında ihmal edilir.
+
+    Returns:
+        (best_col, value) — son (en derin) iterasyonun sonucu
+    """
+    ai_mask, hu_mask, heights = _masks_from_board(board)
+    _KILLERS.clear()  # iterasyonlar arası kalır, çağrılar arası kalmaz
+    best = (None, 0)
+    for d in range(1, max_depth + 1):
+        best = _alpha_beta_bb(ai_mask, hu_mask, heights, d,
+                              -math.inf, math.inf, True, metrics)
+    return best
 
 
 # ============================================================================
@@ -233,37 +478,51 @@ def bfs_search(board, max_depth=3):
     """
     metrics = SearchMetrics()
     start_time = time.time()
-    
+
+    ai0, hu0, h0 = _masks_from_board(board)
     queue = deque()
-    queue.append((board, 0, None))  # (board_state, depth, move)
-    
+    # Durum = (ai_mask, hu_mask, heights_tuple, depth, move): iki int +
+    # 7'li tuple, tahta kopyası yok — kuyruktaki her eleman ~8x küçülür
+    queue.append((ai0, hu0, tuple(h0), 0, None))
+
     best_move = None
     best_score = -math.inf
-    
+
+    # Closed set: farklı hamle sıralarıyla ulaşılan aynı pozisyon bir kez
+    # genişletilir; sütun-permütasyonu transpozisyonları elenince 10k
+    # düğümlük bütçe belirgin şekilde daha derine ulaşır
+    closed = set()
+
     while queue and metrics.nodes_expanded < 10000:  # Limit to prevent explosion
-        current_board, depth, move = queue.popleft()
+        ai_mask, hu_mask, heights, depth, move = queue.popleft()
+        state_key = (ai_mask, hu_mask)
+        if state_key in closed:
+            continue
+        closed.add(state_key)
         metrics.nodes_expanded += 1
         metrics.max_depth_reached = max(metrics.max_depth_reached, depth)
-        
+
         if depth >= max_depth:
-            score = score_position(current_board, PLAYER_AI)
+            score = score_position_masks(ai_mask, hu_mask)
             if score > best_score:
                 best_score = score
                 best_move = move
             continue
-            
-        valid_locations = get_valid_locations(current_board)
-        for col in valid_locations:
-            row = get_next_open_row(current_board, col)
-            temp_board = [r[:] for r in current_board]
-            drop_piece(temp_board, row, col, PLAYER_AI)
-            
+
+        for col in range(COLS):
+            if heights[col] >= ROWS:
+                continue
+            bit = 1 << (col * COLUMN_STRIDE + heights[col])
+            new_heights = (heights[:col] + (heights[col] + 1,)
+                           + heights[col + 1:])
+
             first_move = move if move is not None else col
-            queue.append((temp_board, depth + 1, first_move))
-    
+            queue.append((ai_mask | bit, hu_mask, new_heights,
+                          depth + 1, first_move))
+
     metrics.time_taken = time.time() - start_time
-    metrics.memory_used = len(queue) * 0.5  # Rough estimate KB
-    
+    metrics.memory_used = len(queue) * 0.06  # Rough estimate KB (mask durumu)
+
     return best_move if best_move is not None else random.choice(get_valid_locations(board)), metrics
 
 
@@ -284,35 +543,44 @@ def dfs_search(board, max_depth=3):
     """
     metrics = SearchMetrics()
     start_time = time.time()
-    
-    stack = [(board, 0, None)]
+
+    ai0, hu0, h0 = _masks_from_board(board)
+    stack = [(ai0, hu0, tuple(h0), 0, None)]
     best_move = None
     best_score = -math.inf
-    
+
+    closed = set()  # transpozisyon eleme (bkz. bfs_search)
+
     while stack and metrics.nodes_expanded < 10000:
-        current_board, depth, move = stack.pop()
+        ai_mask, hu_mask, heights, depth, move = stack.pop()
+        state_key = (ai_mask, hu_mask)
+        if state_key in closed:
+            continue
+        closed.add(state_key)
         metrics.nodes_expanded += 1
         metrics.max_depth_reached = max(metrics.max_depth_reached, depth)
-        
+
         if depth >= max_depth:
-            score = score_position(current_board, PLAYER_AI)
+            score = score_position_masks(ai_mask, hu_mask)
             if score > best_score:
                 best_score = score
                 best_move = move
             continue
-            
-        valid_locations = get_valid_locations(current_board)
-        for col in reversed(valid_locations):  # Reversed for stack order
-            row = get_next_open_row(current_board, col)
-            temp_board = [r[:] for r in current_board]
-            drop_piece(temp_board, row, col, PLAYER_AI)
-            
+
+        for col in range(COLS - 1, -1, -1):  # Reversed for stack order
+            if heights[col] >= ROWS:
+                continue
+            bit = 1 << (col * COLUMN_STRIDE + heights[col])
+            new_heights = (heights[:col] + (heights[col] + 1,)
+                           + heights[col + 1:])
+
             first_move = move if move is not None else col
-            stack.append((temp_board, depth + 1, first_move))
-    
+            stack.append((ai_mask | bit, hu_mask, new_heights,
+                          depth + 1, first_move))
+
     metrics.time_taken = time.time() - start_time
-    metrics.memory_used = len(stack) * 0.5
-    
+    metrics.memory_used = len(stack) * 0.06
+
     return best_move if best_move is not None else random.choice(get_valid_locations(board)), metrics
 
 
@@ -334,38 +602,54 @@ def ucs_search(board, max_depth=3):
     metrics = SearchMetrics()
     start_time = time.time()
     
+    ai0, hu0, h0 = _masks_from_board(board)
     priority_queue = []
-    heapq.heappush(priority_queue, (0, 0, board, None))  # (cost, counter, board, move)
-    
+    # Heap'te sadece (cost, counter) 2'lisi yaşar; durumun kendisi yan
+    # tablodadır. Sift karşılaştırmaları 6'lı tuple yerine 2 int okur
+    # (counter benzersiz olduğundan eşitlik bozulmadan kırılır).
+    entries = {}
+    heapq.heappush(priority_queue, (0, 0))
+    entries[0] = (ai0, hu0, tuple(h0), None)
+
     best_move = None
     best_score = -math.inf
     counter = 0
-    
+
+    closed = set()  # transpozisyon eleme (bkz. bfs_search)
+
     while priority_queue and metrics.nodes_expanded < 10000:
-        cost, _, current_board, move = heapq.heappop(priority_queue)
+        cost, cnt = heapq.heappop(priority_queue)
+        ai_mask, hu_mask, heights, move = entries.pop(cnt)
+        state_key = (ai_mask, hu_mask)
+        if state_key in closed:
+            continue
+        closed.add(state_key)
         metrics.nodes_expanded += 1
         depth = cost
         metrics.max_depth_reached = max(metrics.max_depth_reached, depth)
-        
+
         if depth >= max_depth:
-            score = score_position(current_board, PLAYER_AI)
+            score = score_position_masks(ai_mask, hu_mask)
             if score > best_score:
                 best_score = score
                 best_move = move
             continue
-            
-        valid_locations = get_valid_locations(current_board)
-        for col in valid_locations:
-            row = get_next_open_row(current_board, col)
-            temp_board = [r[:] for r in current_board]
-            drop_piece(temp_board, row, col, PLAYER_AI)
-            
+
+        for col in range(COLS):
+            if heights[col] >= ROWS:
+                continue
+            bit = 1 << (col * COLUMN_STRIDE + heights[col])
+            new_heights = (heights[:col] + (heights[col] + 1,)
+                           + heights[col + 1:])
+
             first_move = move if move is not None else col
             counter += 1
-            heapq.heappush(priority_queue, (cost + 1, counter, temp_board, first_move))
-    
+            heapq.heappush(priority_queue, (cost + 1, counter))
+            entries[counter] = (ai_mask | bit, hu_mask, new_heights,
+                                first_move)
+
     metrics.time_taken = time.time() - start_time
-    metrics.memory_used = len(priority_queue) * 0.5
+    metrics.memory_used = len(priority_queue) * 0.06
     
     return best_move if best_move is not None else random.choice(get_valid_locations(board)), metrics
 
@@ -392,42 +676,53 @@ def astar_search(board, max_depth=3):
     start_time = time.time()
     
     # f(n) = g(n) + h(n)
-    h_score = -score_position(board, PLAYER_AI)  # Negative for minimization
+    ai0, hu0, h0 = _masks_from_board(board)
+    root_score = score_position_masks(ai0, hu0)
+    h_score = -root_score  # Negative for minimization
     priority_queue = []
-    heapq.heappush(priority_queue, (h_score, 0, 0, board, None))  # (f, counter, g, board, move)
-    
+    # Heap'te sadece (f, counter); durum yan tabloda (bkz. ucs_search).
+    # Push sırasında hesaplanan skor payload'da taşınır: leaf cutoff'ta
+    # aynı pozisyon ikinci kez değerlendirilmez.
+    entries = {}
+    heapq.heappush(priority_queue, (h_score, 0))
+    entries[0] = (0, ai0, hu0, tuple(h0), None, root_score)
+
     best_move = None
     best_score = -math.inf
     counter = 0
-    
+
     while priority_queue and metrics.nodes_expanded < 10000:
-        _, _, g, current_board, move = heapq.heappop(priority_queue)
+        _, cnt = heapq.heappop(priority_queue)
+        g, ai_mask, hu_mask, heights, move, score = entries.pop(cnt)
         metrics.nodes_expanded += 1
         depth = g
         metrics.max_depth_reached = max(metrics.max_depth_reached, depth)
-        
+
         if depth >= max_depth:
-            score = score_position(current_board, PLAYER_AI)
             if score > best_score:
                 best_score = score
                 best_move = move
             continue
-            
-        valid_locations = get_valid_locations(current_board)
-        for col in valid_locations:
-            row = get_next_open_row(current_board, col)
-            temp_board = [r[:] for r in current_board]
-            drop_piece(temp_board, row, col, PLAYER_AI)
-            
+
+        for col in range(COLS):
+            if heights[col] >= ROWS:
+                continue
+            bit = 1 << (col * COLUMN_STRIDE + heights[col])
+            new_ai = ai_mask | bit
+            new_heights = (heights[:col] + (heights[col] + 1,)
+                           + heights[col + 1:])
+
             new_g = g + 1
-            h = -score_position(temp_board, PLAYER_AI)
-            f = new_g + h
-            
+            child_score = score_position_masks(new_ai, hu_mask)
+            f = new_g - child_score
+
             first_move = move if move is not None else col
             counter += 1
-            heapq.heappush(priority_queue, (f, counter, new_g, temp_board, first_move))
-    
+            heapq.heappush(priority_queue, (f, counter))
+            entries[counter] = (new_g, new_ai, hu_mask, new_heights,
+                                first_move, child_score)
+
     metrics.time_taken = time.time() - start_time
-    metrics.memory_used = len(priority_queue) * 0.5
+    metrics.memory_used = len(priority_queue) * 0.06
     
     return best_move if best_move is not None else random.choice(get_valid_locations(board)), metrics
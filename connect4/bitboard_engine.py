@@ -22,8 +22,8 @@ TECHNIQUES:
 - Final score = AI_score - Human_score
 """
 
-import itertools
-from typing import List, Tuple, Dict, Set
+from functools import lru_cache
+from typing import List, Tuple, Dict
 
 # ============================================================================
 # CONSTANTS & CONFIGURATION
@@ -51,6 +51,10 @@ POSITION_WEIGHTS = [
     [300,  400,  500,  700,  500,  400,  300]
 ]
 
+# All playable cells in the 7-stride per-player masks (rows 0-5, bit 6 of
+# each column is a guard row that keeps shifted windows from wrapping)
+BB_CELLS = sum(0x3F << (col * 7) for col in range(COLS))
+
 # ============================================================================
 # BITBOARD OPERATIONS
 # ============================================================================
@@ -67,12 +71,26 @@ class Bitboard:
     Bits [0-5]: actual pieces (0 = AI, 1 = Human)
     Bits [6-8]: height counter (000 to 110 for heights 0-6)
     """
-    
+
+    # Arama/rollout başına milyonlarca örnek yaratılıyor: __slots__ ile
+    # per-instance __dict__ kalkar — daha küçük nesne, daha hızlı erişim.
+    __slots__ = ('board', 'heights', 'ai_bb', 'human_bb', '_ply',
+                 '_arr', '_arr_corrected')
+
     def __init__(self):
         """Initialize empty bitboard"""
         self.board = 0  # 63-bit integer
         self.heights = [0] * COLS  # Track column heights separately for speed
-    
+        # Per-player occupancy masks (7-bit column stride, bit = col*7 + row).
+        # Kept side-by-side with self.board so win detection is a handful of
+        # shift-AND ops instead of a full pattern scan.
+        self.ai_bb = 0
+        self.human_bb = 0
+        self._ply = 0  # Total stones on the board (O(1) draw detection)
+        # Lazily built 2D view caches — invalidated whenever the board changes
+        self._arr = None
+        self._arr_corrected = None
+
     def make_move(self, col: int, player_bit: int) -> bool:
         """
         Drop a piece in column (bitboard optimized)
@@ -89,12 +107,22 @@ class Bitboard:
         
         # Calculate bit position: col * 9 + current_height
         bit_pos = col * 9 + self.heights[col]
-        
+
         # Set bit if player_bit == 1 (Human)
         if player_bit == 1:
             self.board |= (1 << bit_pos)
         # If player_bit == 0 (AI), bit stays 0 (already clear)
-        
+
+        # Mirror the move into the per-player win-detection masks
+        win_bit = 1 << (col * 7 + self.heights[col])
+        if player_bit == 1:
+            self.human_bb |= win_bit
+        else:
+            self.ai_bb |= win_bit
+        self._arr = None
+        self._arr_corrected = None
+        self._ply += 1
+
         # Update height
         self.heights[col] += 1
         
@@ -108,6 +136,36 @@ class Bitboard:
         
         return True
     
+    def unmake_move(self, col: int, player_bit: int) -> None:
+        """
+        make_move'un tam tersi: kolonun en üst taşını kaldırır.
+
+        Hamle tek bit + yükseklik sayacı olduğundan geri almak da öyle;
+        arama her çocukta yeni Bitboard kopyalamak yerine aynı nesne
+        üzerinde make/unmake çifti koşabilir.
+        """
+        self.heights[col] -= 1
+        bit_pos = col * 9 + self.heights[col]
+
+        # Clear the piece bit (AI pieces are already 0)
+        if player_bit == 1:
+            self.board &= ~(1 << bit_pos)
+
+        # Clear the per-player win-detection mask bit
+        win_bit = 1 << (col * 7 + self.heights[col])
+        if player_bit == 1:
+            self.human_bb &= ~win_bit
+        else:
+            self.ai_bb &= ~win_bit
+        self._arr = None
+        self._arr_corrected = None
+        self._ply -= 1
+
+        # Update helper bits (bits 6-8 of column)
+        height_mask = 0b111 << (col * 9 + 6)
+        self.board &= ~height_mask
+        self.board |= (self.heights[col] << (col * 9 + 6))
+
     def get_column_height(self, col: int) -> int:
         """Get current height of column (0-6)"""
         return self.heights[col]
@@ -155,20 +213,60 @@ class Bitboard:
         bit = (col_bits >> row) & 1
         return bit
     
+    def as_array(self) -> List[List[int]]:
+        """
+        Cached read-only 2D view of the board (0=AI, 1=Human, 2=Empty).
+
+        Değerlendirme aynı tahtayı iki oyuncu için de okuduğundan 42
+        get_cell çağrısını her seferinde tekrarlamak yerine görünüm bir
+        kez kurulup hamleye kadar saklanır. Dönen listeyi DEĞİŞTİRMEYİN;
+        kopya gerekiyorsa to_2d_array kullanın.
+        """
+        if self._arr is None:
+            arr = [[EMPTY] * COLS for _ in range(ROWS)]
+            ai = self.ai_bb
+            human = self.human_bb
+            for col in range(COLS):
+                base = col * 7
+                for row in range(self.heights[col]):
+                    if (ai >> (base + row)) & 1:
+                        arr[row][col] = PLAYER_AI
+                    elif (human >> (base + row)) & 1:
+                        arr[row][col] = PLAYER_HUMAN
+            self._arr = arr
+        return self._arr
+
+    def as_corrected_array(self) -> List[List[int]]:
+        """
+        Cached fake-zero corrected 2D view (read-only).
+
+        Dikey örüntü sayımının gördüğü tahta: yüksekliğe göre "yüzen"
+        boş hücreler (row >= ROWS - height) insan taşı sayılır. Düzeltme
+        oyuncudan bağımsız olduğundan iki oyuncu için ayrı ayrı üretmek
+        yerine hamleye kadar bir kez kurulup saklanır.
+        """
+        if self._arr_corrected is None:
+            arr = self.as_array()
+            heights = self.heights
+            corrected = []
+            for row in range(ROWS):
+                src = arr[row]
+                corrected.append([
+                    PLAYER_HUMAN if src[col] == EMPTY and row >= ROWS - heights[col]
+                    else src[col]
+                    for col in range(COLS)
+                ])
+            self._arr_corrected = corrected
+        return self._arr_corrected
+
     def to_2d_array(self) -> List[List[int]]:
         """
         Convert bitboard to 2D array for visualization/compatibility
-        
+
         Returns:
             6x7 array with values: 0=AI, 1=Human, 2=Empty
         """
-        board_2d = [[EMPTY for _ in range(COLS)] for _ in range(ROWS)]
-        
-        for row in range(ROWS):
-            for col in range(COLS):
-                board_2d[row][col] = self.get_cell(row, col)
-        
-        return board_2d
+        return [row[:] for row in self.as_array()]
     
     def from_2d_array(self, board_2d: List[List[int]]):
         """
@@ -180,107 +278,132 @@ class Bitboard:
         """
         self.board = 0
         self.heights = [0] * COLS
-        
+        self.ai_bb = 0
+        self.human_bb = 0
+        self._arr = None
+        self._arr_corrected = None
+
         # Map from traditional representation to bitboard
         # Traditional: AI=1, Human=-1, Empty=0
         # Bitboard: AI=0, Human=1, Empty=2
-        mapping = {1: 0, -1: 1, 0: 2}
-        
+        # Tek geçiş, sözlük eşlemesi yok: hücre değeri doğrudan
+        # karşılaştırılır ve tüm bitler kolon bazında OR'lanır.
         for col in range(COLS):
+            base9 = col * 9
+            base7 = col * 7
+            height = 0
+
             for row in range(ROWS):
-                value = mapping.get(board_2d[row][col], 2)
-                
-                if value != EMPTY:
-                    # Set bit for this position
-                    player_bit = value  # 0 for AI, 1 for Human
-                    bit_pos = col * 9 + row
-                    
-                    if player_bit == 1:
-                        self.board |= (1 << bit_pos)
-                    
-                    self.heights[col] = max(self.heights[col], row + 1)
-            
-            # Update helper bits
-            height_mask = 0b111 << (col * 9 + 6)
-            self.board &= ~height_mask
-            self.board |= (self.heights[col] << (col * 9 + 6))
+                value = board_2d[row][col]
+
+                if value == 1:       # AI piece (bit stays 0 in self.board)
+                    self.ai_bb |= 1 << (base7 + row)
+                    height = row + 1
+                elif value == -1:    # Human piece
+                    self.board |= 1 << (base9 + row)
+                    self.human_bb |= 1 << (base7 + row)
+                    height = row + 1
+
+            # Height + helper bits in one shot (board bits above are fresh)
+            self.heights[col] = height
+            self.board |= height << (base9 + 6)
+
+        self._ply = sum(self.heights)
     
     def get_valid_columns(self) -> List[int]:
-        """Get list of columns that are not full"""
-        return [col for col in range(COLS) if self.heights[col] < ROWS]
+        """Get list of columns that are not full (heights hoisted once)"""
+        heights = self.heights
+        return [col for col in range(COLS) if heights[col] < ROWS]
     
+    def snapshot(self) -> Tuple[int, ...]:
+        """
+        Flat tuple snapshot of the full state (board, masks, heights).
+
+        copy() her çağrıda yeni Bitboard + heights listesi tahsis eder;
+        rollout başına durum aynalamak için snapshot/restore çifti tek
+        tuple ile aynı işi görür.
+        """
+        return (self.board, self.ai_bb, self.human_bb, *self.heights)
+
+    def restore(self, state: Tuple[int, ...]) -> None:
+        """snapshot() çıktısını yerinde geri yükler — yeni liste tahsisi yok."""
+        self.board = state[0]
+        self.ai_bb = state[1]
+        self.human_bb = state[2]
+        self.heights[:] = state[3:]
+        self._ply = sum(self.heights)
+        self._arr = None
+        self._arr_corrected = None
+
     def copy(self) -> 'Bitboard':
         """Create a copy of this bitboard"""
         new_board = Bitboard()
         new_board.board = self.board
         new_board.heights = self.heights.copy()
+        new_board.ai_bb = self.ai_bb
+        new_board.human_bb = self.human_bb
+        new_board._ply = self._ply
         return new_board
 
 # ============================================================================
 # PATTERN RECOGNITION & HEURISTIC
 # ============================================================================
 
+def _build_diagonal_indices() -> Tuple[Tuple[Tuple[Tuple[int, int], ...], ...],
+                                       Tuple[Tuple[Tuple[int, int], ...], ...]]:
+    """
+    Precompute (row, col) index tuples for every diagonal of length >= 4.
+
+    Tahta geometrisi sabit — köşegen hücre adresleri her değerlendirmede
+    iç içe while döngüleriyle yeniden türetilecek bir şey değil. Modül
+    yüklenirken bir kez hesaplanır, get_all_diagonals sadece toplar.
+    """
+    major_indices = []  # ↗
+    minor_indices = []  # ↖
+
+    # MAJOR DIAGONALS (↗): bottom-left starts, then left-edge starts
+    for start_col in range(COLS):
+        diag = [(row, start_col + row) for row in range(min(ROWS, COLS - start_col))]
+        if len(diag) >= 4:
+            major_indices.append(tuple(diag))
+
+    for start_row in range(1, ROWS):
+        diag = [(start_row + col, col) for col in range(min(ROWS - start_row, COLS))]
+        if len(diag) >= 4:
+            major_indices.append(tuple(diag))
+
+    # MINOR DIAGONALS (↖): top-left starts, then top-edge starts
+    for start_col in range(COLS):
+        diag = [(ROWS - 1 - i, start_col + i) for i in range(min(ROWS, COLS - start_col))]
+        if len(diag) >= 4:
+            minor_indices.append(tuple(diag))
+
+    for start_row in range(ROWS - 2, -1, -1):
+        diag = [(start_row - i, i) for i in range(min(start_row + 1, COLS))]
+        if len(diag) >= 4:
+            minor_indices.append(tuple(diag))
+
+    return tuple(major_indices), tuple(minor_indices)
+
+MAJOR_DIAG_IDX, MINOR_DIAG_IDX = _build_diagonal_indices()
+
 def get_all_diagonals(board_2d: List[List[int]]) -> Tuple[List[List[int]], List[List[int]]]:
     """
     Extract all diagonals from board (↗ major, ↖ minor)
-    
+
+    Cell addresses come from the precomputed MAJOR_DIAG_IDX/MINOR_DIAG_IDX
+    tables, so this is a plain gather with no geometry arithmetic.
+
     Args:
         board_2d: 6x7 2D array
-    
+
     Returns:
         (major_diagonals, minor_diagonals)
         - major: ↗ (bottom-left to top-right)
         - minor: ↖ (top-left to bottom-right)
     """
-    major_diagonals = []  # ↗
-    minor_diagonals = []  # ↖
-    
-    # MAJOR DIAGONALS (↗)
-    # Start from bottom-left, move right and up
-    for start_col in range(COLS):
-        diag = []
-        row, col = 0, start_col
-        while row < ROWS and col < COLS:
-            diag.append(board_2d[row][col])
-            row += 1
-            col += 1
-        if len(diag) >= 4:  # Only keep diagonals with 4+ cells
-            major_diagonals.append(diag)
-    
-    # Start from left edge (row 1 onwards)
-    for start_row in range(1, ROWS):
-        diag = []
-        row, col = start_row, 0
-        while row < ROWS and col < COLS:
-            diag.append(board_2d[row][col])
-            row += 1
-            col += 1
-        if len(diag) >= 4:
-            major_diagonals.append(diag)
-    
-    # MINOR DIAGONALS (↖)
-    # Start from top-left, move right and down
-    for start_col in range(COLS):
-        diag = []
-        row, col = ROWS - 1, start_col
-        while row >= 0 and col < COLS:
-            diag.append(board_2d[row][col])
-            row -= 1
-            col += 1
-        if len(diag) >= 4:
-            minor_diagonals.append(diag)
-    
-    # Start from top edge (columns after 0)
-    for start_row in range(ROWS - 2, -1, -1):
-        diag = []
-        row, col = start_row, 0
-        while row >= 0 and col < COLS:
-            diag.append(board_2d[row][col])
-            row -= 1
-            col += 1
-        if len(diag) >= 4:
-            minor_diagonals.append(diag)
-    
+    major_diagonals = [[board_2d[r][c] for r, c in idx] for idx in MAJOR_DIAG_IDX]
+    minor_diagonals = [[board_2d[r][c] for r, c in idx] for idx in MINOR_DIAG_IDX]
     return major_diagonals, minor_diagonals
 
 def apply_fake_zero_handling(column: List[int], col_index: int, heights: List[int]) -> List[int]:
@@ -315,257 +438,307 @@ def apply_fake_zero_handling(column: List[int], col_index: int, heights: List[in
     
     return processed
 
-def generate_pattern_permutations() -> Dict[str, Set[Tuple]]:
-    """
-    Generate all pattern permutations for recognition
-    
-    Patterns:
-    - 4-in-a-row: [AI, AI, AI, AI]
-    - 3-in-a-row open: [AI, AI, AI, EMPTY]
-    - 3-in-a-row closed: [HUMAN, AI, AI, AI, HUMAN] (needs 5-window)
-    - 2-in-a-row: [AI, AI, EMPTY, EMPTY]
-    
-    Returns:
-        Dictionary of pattern sets
+def count_patterns_in_line(line: List[int], player: int) -> Tuple[int, int, int, int]:
     """
-    patterns = {
-        'four_ai': set(),
-        'four_human': set(),
-        'three_open_ai': set(),
-        'three_open_human': set(),
-        'three_closed_ai': set(),
-        'three_closed_human': set(),
-        'two_ai': set(),
-        'two_human': set()
-    }
-    
-    # 4-in-a-row (simple, only one permutation)
-    patterns['four_ai'].add((PLAYER_AI, PLAYER_AI, PLAYER_AI, PLAYER_AI))
-    patterns['four_human'].add((PLAYER_HUMAN, PLAYER_HUMAN, PLAYER_HUMAN, PLAYER_HUMAN))
-    
-    # 3-in-a-row OPEN (3 pieces + 1 empty in any order)
-    base_three_ai = [PLAYER_AI, PLAYER_AI, PLAYER_AI, EMPTY]
-    base_three_human = [PLAYER_HUMAN, PLAYER_HUMAN, PLAYER_HUMAN, EMPTY]
-    
-    for perm in itertools.permutations(base_three_ai):
-        # Exclude illegal patterns (e.g., floating pieces)
-        patterns['three_open_ai'].add(perm)
-    
-    for perm in itertools.permutations(base_three_human):
-        patterns['three_open_human'].add(perm)
-    
-    # 3-in-a-row CLOSED (blocked on both sides) - needs 5-window
-    # Pattern: [HUMAN, AI, AI, AI, HUMAN] and permutations
-    # This is handled separately in count_consecutive_pieces
-    
-    # 2-in-a-row (2 pieces + 2 empty in any order)
-    base_two_ai = [PLAYER_AI, PLAYER_AI, EMPTY, EMPTY]
-    base_two_human = [PLAYER_HUMAN, PLAYER_HUMAN, EMPTY, EMPTY]
-    
-    for perm in itertools.permutations(base_two_ai):
-        patterns['two_ai'].add(perm)
-    
-    for perm in itertools.permutations(base_two_human):
-        patterns['two_human'].add(perm)
-    
-    return patterns
+    Count different patterns in a line (row/col/diagonal)
 
-# Pre-generate patterns (optimization)
-PATTERN_LIBRARY = generate_pattern_permutations()
+    Her pencere doğrudan taş/boş sayımıyla sınıflanır: 4 taş = four,
+    3 taş + 1 boş = three_open, 2 taş + 2 boş = two. Sonuç sabit
+    sıralı bir tuple'dır — satır başına sözlük kurup string anahtarla
+    toplamak yerine dört yerel sayaç döner.
 
-def count_patterns_in_line(line: List[int], player: int) -> Dict[str, int]:
-    """
-    Count different patterns in a line (row/col/diagonal)
-    
     Args:
         line: List of cell values
         player: PLAYER_AI or PLAYER_HUMAN
-    
+
     Returns:
-        Dictionary with counts: {
-            'four': count,
-            'three_open': count,
-            'three_closed': count,
-            'two': count
-        }
+        (four, three_open, three_closed, two)
     """
-    counts = {
-        'four': 0,
-        'three_open': 0,
-        'three_closed': 0,
-        'two': 0
-    }
-    
-    # Check 4-windows
+    four = 0
+    three_open = 0
+    three_closed = 0
+    two = 0
+
+    # Check 4-windows (direct piece/empty counting)
     for i in range(len(line) - 3):
-        window = tuple(line[i:i+4])
-        
-        if player == PLAYER_AI:
-            if window in PATTERN_LIBRARY['four_ai']:
-                counts['four'] += 1
-            elif window in PATTERN_LIBRARY['three_open_ai']:
-                counts['three_open'] += 1
-            elif window in PATTERN_LIBRARY['two_ai']:
-                counts['two'] += 1
-        else:
-            if window in PATTERN_LIBRARY['four_human']:
-                counts['four'] += 1
-            elif window in PATTERN_LIBRARY['three_open_human']:
-                counts['three_open'] += 1
-            elif window in PATTERN_LIBRARY['two_human']:
-                counts['two'] += 1
-    
+        p_count = 0
+        e_count = 0
+        for value in line[i:i+4]:
+            if value == player:
+                p_count += 1
+            elif value == EMPTY:
+                e_count += 1
+
+        if p_count == 4:
+            four += 1
+        elif p_count == 3 and e_count == 1:
+            three_open += 1
+        elif p_count == 2 and e_count == 2:
+            two += 1
+
     # Check 5-windows for CLOSED three
+    opponent = PLAYER_HUMAN if player == PLAYER_AI else PLAYER_AI
     for i in range(len(line) - 4):
         window = line[i:i+5]
-        opponent = PLAYER_HUMAN if player == PLAYER_AI else PLAYER_AI
-        
+
         # Pattern: [opponent, player, player, player, opponent]
-        if (window[0] == opponent and 
-            window[1] == player and 
-            window[2] == player and 
-            window[3] == player and 
+        if (window[0] == opponent and
+            window[1] == player and
+            window[2] == player and
+            window[3] == player and
             window[4] == opponent):
-            counts['three_closed'] += 1
-    
-    return counts
+            three_closed += 1
 
-def count_consecutive_pieces(bitboard: Bitboard, player: int) -> Dict[str, int]:
+    return four, three_open, three_closed, two
+
+def count_consecutive_pieces(bitboard: Bitboard, player: int,
+                             board_2d: List[List[int]] = None) -> Dict[str, int]:
     """
     Count all patterns for a player across entire board
-    
+
     Uses:
     - Vertical: bitboard column extraction
     - Horizontal: extract_nth_row
     - Diagonal: get_all_diagonals
-    
+
     Args:
         bitboard: Bitboard instance
         player: PLAYER_AI or PLAYER_HUMAN
-    
+        board_2d: Optional pre-built 2D view (shared across both players
+                  in evaluate_bitboard to avoid a duplicate rebuild)
+
     Returns:
         Aggregated pattern counts
     """
-    total_counts = {
-        'four': 0,
-        'three_open': 0,
-        'three_closed': 0,
-        'two': 0
-    }
-    
-    board_2d = bitboard.to_2d_array()
-    
-    # VERTICAL
+    four = 0
+    three_open = 0
+    three_closed = 0
+    two = 0
+
+    if board_2d is None:
+        board_2d = bitboard.as_array()
+
+    # VERTICAL (columns read from the cached fake-zero corrected view)
+    corrected = bitboard.as_corrected_array()
     for col in range(COLS):
-        column = []
-        for row in range(ROWS):
-            column.append(board_2d[row][col])
-        
-        # Apply fake-zero handling
-        column = apply_fake_zero_handling(column, col, bitboard.heights)
-        
-        pattern_counts = count_patterns_in_line(column, player)
-        for key in total_counts:
-            total_counts[key] += pattern_counts[key]
-    
+        column = [corrected[row][col] for row in range(ROWS)]
+
+        f, t3o, t3c, t2 = count_patterns_in_line(column, player)
+        four += f; three_open += t3o; three_closed += t3c; two += t2
+
     # HORIZONTAL
     for row in range(ROWS):
-        row_data = bitboard.extract_nth_row(row)
-        
-        pattern_counts = count_patterns_in_line(row_data, player)
-        for key in total_counts:
-            total_counts[key] += pattern_counts[key]
+        f, t3o, t3c, t2 = count_patterns_in_line(board_2d[row], player)
+        four += f; three_open += t3o; three_closed += t3c; two += t2
     
     # DIAGONAL
     major_diags, minor_diags = get_all_diagonals(board_2d)
     
     for diag in major_diags + minor_diags:
-        pattern_counts = count_patterns_in_line(diag, player)
-        for key in total_counts:
-            total_counts[key] += pattern_counts[key]
-    
-    return total_counts
+        f, t3o, t3c, t2 = count_patterns_in_line(diag, player)
+        four += f; three_open += t3o; three_closed += t3c; two += t2
+
+    # Dict built once at the end — callers keep the named-key interface
+    return {
+        'four': four,
+        'three_open': three_open,
+        'three_closed': three_closed,
+        'two': two
+    }
 
 def calculate_positional_score(bitboard: Bitboard, player: int) -> int:
     """
     Calculate positional score based on POSITION_WEIGHTS matrix
-    
+
+    42 hücrelik döngü yerine ağırlık kovası başına tek popcount:
+    matriste yalnızca 7 benzersiz ağırlık var, yani 7 maske AND'i +
+    bit sayımı işi bitirir.
+
     Args:
         bitboard: Bitboard instance
         player: PLAYER_AI or PLAYER_HUMAN
-    
+
     Returns:
         Total positional score
     """
-    score = 0
-    board_2d = bitboard.to_2d_array()
-    
+    player_bb = bitboard.ai_bb if player == PLAYER_AI else bitboard.human_bb
+    return sum(weight * (player_bb & mask).bit_count()
+               for weight, mask in WEIGHT_BUCKETS)
+
+def _build_weight_masks() -> Tuple[Tuple[int, int], ...]:
+    """POSITION_WEIGHTS'i benzersiz ağırlık başına bir (weight, mask) çiftine
+    indirger; mask'ta bit col*7+row o ağırlıktaki hücreleri işaretler."""
+    buckets: Dict[int, int] = {}
     for row in range(ROWS):
         for col in range(COLS):
-            if board_2d[row][col] == player:
-                score += POSITION_WEIGHTS[row][col]
-    
-    return score
+            weight = POSITION_WEIGHTS[row][col]
+            buckets[weight] = buckets.get(weight, 0) | (1 << (col * 7 + row))
+    return tuple(sorted(buckets.items()))
+
+WEIGHT_BUCKETS = _build_weight_masks()
+
+def _count_patterns_dir(p: int, e: int, o: int, s: int) -> Tuple[int, int, int, int]:
+    """
+    Count 4-windows along one direction with shift-AND popcounts.
+
+    Her kombinasyon (4 taş; 3 taş + 1 boş; 2 taş + 2 boş; kapalı üçlü)
+    ayrı bir maske AND'idir; popcount pencere başlangıçlarını sayar.
+    Tahta dışı hücreler hiçbir maskede yer almadığından geçersiz
+    pencereler kendiliğinden düşer.
+
+    Args:
+        p: Player occupancy mask (7-stride)
+        e: Empty-cell mask
+        o: Opponent occupancy mask
+        s: Direction shift (1=vertical, 7=horizontal, 6/8=diagonals)
+
+    Returns:
+        (four, three_open, three_closed, two)
+    """
+    p1 = p >> s
+    p2 = p >> (2 * s)
+    p3 = p >> (3 * s)
+    e1 = e >> s
+    e2 = e >> (2 * s)
+    e3 = e >> (3 * s)
+
+    four = (p & p1 & p2 & p3).bit_count()
+    three_open = ((e & p1 & p2 & p3).bit_count() +
+                  (p & e1 & p2 & p3).bit_count() +
+                  (p & p1 & e2 & p3).bit_count() +
+                  (p & p1 & p2 & e3).bit_count())
+    two = ((e & e1 & p2 & p3).bit_count() +
+           (e & p1 & e2 & p3).bit_count() +
+           (e & p1 & p2 & e3).bit_count() +
+           (p & e1 & e2 & p3).bit_count() +
+           (p & e1 & p2 & e3).bit_count() +
+           (p & p1 & e2 & e3).bit_count())
+    three_closed = (o & p1 & p2 & p3 & (o >> (4 * s))).bit_count()
+
+    return four, three_open, three_closed, two
+
+def _eval_bb(ai_bb: int, human_bb: int, heights: List[int]) -> int:
+    """
+    Fused evaluation kernel over the per-player occupancy masks.
+
+    count_consecutive_pieces + calculate_positional_score ile aynı skoru
+    üretir ama tek çağrıda: 2D görünüm kurulmaz, satır/köşegen listeleri
+    ayıklanmaz — her yön için birkaç tamsayı maske işlemi ve popcount.
+    Dikey yön, fake-zero düzeltmesini maske olarak uygular (yüzen boş
+    hücreler insan taşı sayılır), diğer yönler ham maskeleri okur.
+    """
+    empty = BB_CELLS & ~(ai_bb | human_bb)
+
+    # Fake-zero mask: empty cells at row >= ROWS - height[col]
+    fake = 0
+    for col in range(COLS):
+        h = heights[col]
+        if h:
+            fake |= (0x3F ^ ((1 << (ROWS - h)) - 1)) << (col * 7)
+    fake &= empty
+
+    human_v = human_bb | fake
+    empty_v = empty ^ fake
+
+    ai_counts = [0, 0, 0, 0]
+    human_counts = [0, 0, 0, 0]
+
+    # Vertical with fake-zero corrected masks
+    for i, n in enumerate(_count_patterns_dir(ai_bb, empty_v, human_v, 1)):
+        ai_counts[i] += n
+    for i, n in enumerate(_count_patterns_dir(human_v, empty_v, ai_bb, 1)):
+        human_counts[i] += n
+
+    # Horizontal and both diagonals on raw masks
+    for s in (7, 6, 8):
+        for i, n in enumerate(_count_patterns_dir(ai_bb, empty, human_bb, s)):
+            ai_counts[i] += n
+        for i, n in enumerate(_count_patterns_dir(human_bb, empty, ai_bb, s)):
+            human_counts[i] += n
+
+    ai_score = (SCORE_4_IN_ROW * ai_counts[0] +
+                SCORE_3_IN_ROW * ai_counts[1] +
+                SCORE_3_IN_ROW_SPECIAL * ai_counts[2] +
+                SCORE_2_IN_ROW * ai_counts[3])
+    human_score = (SCORE_4_IN_ROW * human_counts[0] +
+                   SCORE_3_IN_ROW * human_counts[1] +
+                   SCORE_3_IN_ROW_SPECIAL * human_counts[2] +
+                   SCORE_2_IN_ROW * human_counts[3])
+
+    for weight, mask in WEIGHT_BUCKETS:
+        ai_score += weight * (ai_bb & mask).bit_count()
+        human_score += weight * (human_bb & mask).bit_count()
+
+    return ai_score - human_score
 
 def evaluate_bitboard(bitboard: Bitboard) -> int:
     """
     MAIN HEURISTIC EVALUATION
-    
+
     Calculates: AI_score - Human_score
-    
+
     Components:
     - 4-in-a-row: ±1,000,000
     - 3-in-a-row open: ±200,000
     - 3-in-a-row closed: ±10,000
     - 2-in-a-row: ±6,000
     - Positional weights: POSITION_WEIGHTS matrix
-    
+
     Args:
         bitboard: Current board state
-    
+
     Returns:
         Evaluation score (positive favors AI, negative favors Human)
     """
-    # Count patterns for both players
-    ai_patterns = count_consecutive_pieces(bitboard, PLAYER_AI)
-    human_patterns = count_consecutive_pieces(bitboard, PLAYER_HUMAN)
-    
-    # Calculate AI score
-    ai_score = 0
-    ai_score += SCORE_4_IN_ROW * ai_patterns['four']
-    ai_score += SCORE_3_IN_ROW * ai_patterns['three_open']
-    ai_score += SCORE_3_IN_ROW_SPECIAL * ai_patterns['three_closed']
-    ai_score += SCORE_2_IN_ROW * ai_patterns['two']
-    ai_score += calculate_positional_score(bitboard, PLAYER_AI)
-    
-    # Calculate Human score
-    human_score = 0
-    human_score += SCORE_4_IN_ROW * human_patterns['four']
-    human_score += SCORE_3_IN_ROW * human_patterns['three_open']
-    human_score += SCORE_3_IN_ROW_SPECIAL * human_patterns['three_closed']
-    human_score += SCORE_2_IN_ROW * human_patterns['two']
-    human_score += calculate_positional_score(bitboard, PLAYER_HUMAN)
-    
-    # Final score = AI - Human
-    return ai_score - human_score
+    return _eval_cached(bitboard.ai_bb, bitboard.human_bb)
+
+
+@lru_cache(maxsize=1 << 20)
+def _eval_cached(ai_bb: int, human_bb: int) -> int:
+    """
+    Memoized front-end for _eval_bb keyed on the mask pair.
+
+    Alfa-beta transpozisyonlarla aynı pozisyonu defalarca ziyaret eder;
+    durum zaten iki int olduğundan anahtar bedava. Yükseklikler doluluk
+    maskesinden türetilir (kolonun en üst dolu hücresi + 1 = bit_length),
+    böylece cache anahtarı maskelerden ibaret kalır.
+    """
+    occ = ai_bb | human_bb
+    heights = [((occ >> (col * 7)) & 0x3F).bit_length() for col in range(COLS)]
+    return _eval_bb(ai_bb, human_bb, heights)
 
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
+def _has_four(bb: int) -> bool:
+    """
+    Shift-AND four-in-a-row test on a 7-stride occupancy mask.
+
+    Kaydırmalar: 1 = dikey, 7 = yatay, 6 ve 8 = çaprazlar. Her yön için
+    iki AND yeterli — dört bitlik dizinin varlığı m & (m >> 2s) ile çöker.
+    """
+    for s in (1, 7, 6, 8):
+        m = bb & (bb >> s)
+        if m & (m >> (2 * s)):
+            return True
+    return False
+
 def check_win(bitboard: Bitboard, player: int) -> bool:
     """
     Check if player has won (4-in-a-row exists)
-    
+
+    Constant-time: tests the player's occupancy mask with shift-AND
+    instead of scanning rows/columns/diagonals for patterns.
+
     Args:
         bitboard: Current board state
         player: PLAYER_AI or PLAYER_HUMAN
-    
+
     Returns:
         True if player has won
     """
-    patterns = count_consecutive_pieces(bitboard, player)
-    return patterns['four'] > 0
+    return _has_four(bitboard.ai_bb if player == PLAYER_AI else bitboard.human_bb)
 
 def is_terminal(bitboard: Bitboard) -> bool:
     """
@@ -577,12 +750,11 @@ def is_terminal(bitboard: Bitboard) -> bool:
     Returns:
         True if game is over
     """
-    # Check wins
-    if check_win(bitboard, PLAYER_AI) or check_win(bitboard, PLAYER_HUMAN):
-        return True
-    
-    # Check draw (board full)
-    return len(bitboard.get_valid_columns()) == 0
+    # Shift-AND win tests on both masks, then O(1) draw check — no
+    # board scan and no valid-column list allocation
+    return (_has_four(bitboard.ai_bb) or
+            _has_four(bitboard.human_bb) or
+            bitboard._ply >= ROWS * COLS)
 
 def print_bitboard(bitboard: Bitboard):
     """
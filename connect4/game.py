@@ -1,4 +1,5 @@
 import sys
+from functools import lru_cache
 
 # --- Sabitler ---
 ROWS = 6
@@ -18,6 +19,17 @@ def create_board():
     """
     return [[EMPTY for _ in range(COLS)] for _ in range(ROWS)]
 
+def copy_board_into(src, dst):
+    """
+    src tahtasını dst'nin üzerine yerinde kopyalar (satır slice ataması).
+
+    Rollout başına yeni liste-of-list üretmek yerine tek bir scratch
+    tahta tekrar kullanılabilsin diye: satır nesneleri korunur, sadece
+    içerikleri yazılır — hamle başına 7 liste tahsisi ortadan kalkar.
+    """
+    for r in range(ROWS):
+        dst[r][:] = src[r]
+
 def drop_piece(board, row, col, piece):
     """
     Belirtilen satır ve sütuna bir oyuncunun taşını bırakır.
@@ -40,15 +52,95 @@ def get_next_open_row(board, col):
             return r
     return None # Bu durum normalde is_valid_location ile önlenir.
 
+def compute_heights(board):
+    """
+    Her kolonun mevcut yüksekliğini (ilk boş satırı) tek geçişte çıkarır.
+
+    get_next_open_row her hamlede 6 satırlık tarama yapar; rollout gibi
+    sıcak döngüler bu listeyi bir kez kurup taş düştükçe heights[col]'u
+    kendileri artırarak satır aramayı O(1) liste okumasına indirir.
+    """
+    heights = []
+    for col in range(COLS):
+        h = 0
+        while h < ROWS and board[h][col] != EMPTY:
+            h += 1
+        heights.append(h)
+    return heights
+
 def get_valid_locations(board):
     """
     Hamle yapılabilecek tüm geçerli sütunların bir listesini döndürür.
+
+    Üst satır bir kez yerel değişkene alınır; sütun başına
+    is_valid_location çağrısı (fonksiyon çağrısı + çift indeksleme)
+    yerine tek listede 7 karşılaştırma kalır. MCTS rollout'larının en
+    sıcak fonksiyonu olduğundan bu fark ölçülür.
     """
-    valid_locations = []
-    for col in range(COLS):
-        if is_valid_location(board, col):
-            valid_locations.append(col)
-    return valid_locations
+    top_row = board[ROWS-1]
+    return [col for col in range(COLS) if top_row[col] == EMPTY]
+
+# --- Bitboard Dönüşümleri ---
+# Düzen: kolon başına 7 bit (6 hücre + 1 sentinel bit), bit indeksi = col*7 + row.
+# row 0 alt satırdır. Sentinel bit (row 6) her zaman boş kalır; bu sayede
+# kaydırma tabanlı kontroller kolonlar arasına taşmaz.
+
+COLUMN_STRIDE = 7  # kolon başına bit sayısı (6 hücre + 1 sentinel)
+BOTTOM_BIT = [c * COLUMN_STRIDE for c in range(COLS)]
+TOP_CELL_MASK = [1 << (c * COLUMN_STRIDE + ROWS - 1) for c in range(COLS)]
+BOARD_MASK = 0
+for _c in range(COLS):
+    for _r in range(ROWS):
+        BOARD_MASK |= 1 << (_c * COLUMN_STRIDE + _r)
+del _c, _r
+
+
+@lru_cache(maxsize=1 << 20)
+def get_valid_locations_mask(occ):
+    """
+    Doluluk mask'inden geçerli sütunların tuple'ını döndürür (memoize'lu).
+
+    Geçerli sütun kümesi sadece occ'un fonksiyonudur; arama sırasında
+    birçok farklı yol aynı occ'a ulaştığından hit oranı yüksektir ve
+    7 sütunluk tarama tek bir dict lookup'a iner. (1M girdi ~16 MB.)
+    """
+    return tuple(c for c in range(COLS) if not (occ & TOP_CELL_MASK[c]))
+
+
+def board_to_masks(board):
+    """
+    2D tahtayı iki bitmask'e çevirir: 'p' = PLAYER_AI taşları,
+    'o' = dolu hücreler (occupancy). İnsan taşları o & ~p'dir.
+    """
+    p = 0
+    o = 0
+    for c in range(COLS):
+        base = c * COLUMN_STRIDE
+        for r in range(ROWS):
+            cell = board[r][c]
+            if cell != EMPTY:
+                bit = 1 << (base + r)
+                o |= bit
+                if cell == PLAYER_AI:
+                    p |= bit
+    return {'p': p, 'o': o}
+
+
+def board_from_masks(masks):
+    """
+    board_to_masks'in tersini yapar: mask çiftinden 2D tahta üretir.
+    """
+    p = masks['p']
+    o = masks['o']
+    board = [[EMPTY] * COLS for _ in range(ROWS)]
+    for c in range(COLS):
+        base = c * COLUMN_STRIDE
+        for r in range(ROWS):
+            bit = 1 << (base + r)
+            if o & bit:
+                board[r][c] = PLAYER_AI if p & bit else PLAYER_HUMAN
+    return board
+
 
 def print_board(board):
     """
@@ -72,38 +164,48 @@ def print_board(board):
 
 # --- Oyun Durumu Kontrolü ---
 
+def has_win(mask):
+    """
+    Bir oyuncunun bitmask'inde dört-taş dizisi var mı (SWAR).
+
+    Kaydırma mesafeleri 7-bit kolon düzenine göre: 1 = dikey,
+    7 = yatay, 6 ve 8 = iki çapraz. Sentinel bit sayesinde kolonlar
+    arasına taşma olmaz; 69 olası dörtlünün tamamı 8 bit işlemiyle
+    dallanmasız test edilir.
+    """
+    for s in (1, COLUMN_STRIDE, COLUMN_STRIDE - 1, COLUMN_STRIDE + 1):
+        m = mask & (mask >> s)
+        if m & (m >> (2 * s)):
+            return True
+    return False
+
+
 def winning_move(board, piece):
     """
     Belirtilen oyuncunun son hamlesiyle oyunu kazanıp kazanmadığını kontrol eder.
+
+    69 pencereyi Python döngüleriyle taramak yerine oyuncunun taşları
+    tek geçişte bir bitmask'e toplanır ve has_win ile test edilir.
     """
-    # Yatay kontrol
-    for c in range(COLS - (WINDOW_LENGTH - 1)):
+    mask = 0
+    for c in range(COLS):
+        base = c * COLUMN_STRIDE
         for r in range(ROWS):
-            if all(board[r][c+i] == piece for i in range(WINDOW_LENGTH)):
-                return True
+            if board[r][c] == piece:
+                mask |= 1 << (base + r)
+    return has_win(mask)
 
-    # Dikey kontrol
-    for c in range(COLS):
-        for r in range(ROWS - (WINDOW_LENGTH - 1)):
-            if all(board[r+i][c] == piece for i in range(WINDOW_LENGTH)):
-                return True
-
-    # Pozitif eğimli çapraz kontrol
-    for c in range(COLS - (WINDOW_LENGTH - 1)):
-        for r in range(ROWS - (WINDOW_LENGTH - 1)):
-            if all(board[r+i][c+i] == piece for i in range(WINDOW_LENGTH)):
-                return True
-
-    # Negatif eğimli çapraz kontrol
-    for c in range(COLS - (WINDOW_LENGTH - 1)):
-        for r in range(WINDOW_LENGTH - 1, ROWS):
-            if all(board[r-i][c+i] == piece for i in range(WINDOW_LENGTH)):
-                return True
-    
-    return False
+def is_board_full(board):
+    """
+    Tahtanın dolu olup olmadığını kontrol eder (beraberlik tespiti).
+
+    Üst satırı kısa devreli bir generator ile tarar; geçerli sütun
+    listesini kurup len'ine bakmaktan hem ucuz hem allocation'sız.
+    """
+    return all(board[ROWS-1][c] != EMPTY for c in range(COLS))
 
 def is_terminal_node(board):
     """
     Oyunun bitip bitmediğini kontrol eder (kazanan var veya tahta dolu).
     """
-    return winning_move(board, PLAYER_HUMAN) or winning_move(board, PLAYER_AI) or len(get_valid_locations(board)) == 0
\ No newline at end of file
+    return winning_move(board, PLAYER_HUMAN) or winning_move(board, PLAYER_AI) or is_board_full(board)
\ No newline at end of file
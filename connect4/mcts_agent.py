@@ -10,6 +10,10 @@ Geliştirmeler:
 - Daha doğru ve sade backpropagation
 - UCB1 exploration sabiti parametreleştirildi
 - Zaman limiti + iterasyon limiti birlikte çalışıyor
+- State artık 2D liste değil, iki int'lik bitmask çifti:
+  p = AI taşları, o = dolu hücreler (bkz. game.board_to_masks).
+  Node başına board kopyası ve rollout başına liste tahsisi yok;
+  hamle uygulamak tek OR, geri almak hiç gerekmiyor (int'ler immutable).
 
 UCB1: wins/visits + C * sqrt(ln(parent_visits) / visits)
 """
@@ -19,9 +23,9 @@ import random
 import time
 
 from .game import (
-    ROWS, COLS, EMPTY, PLAYER_AI, PLAYER_HUMAN,
-    create_board, drop_piece, get_next_open_row,
-    is_valid_location, winning_move, get_valid_locations
+    ROWS, COLS, PLAYER_AI, PLAYER_HUMAN,
+    create_board, drop_piece, get_next_open_row, get_valid_locations,
+    COLUMN_STRIDE, board_to_masks, has_win, get_valid_locations_mask
 )
 
 # ============================================================================
@@ -29,15 +33,41 @@ from .game import (
 # ============================================================================
 MCTS_ITERATIONS = 8000  # Default iterations - Test için kolayca değiştirilebilir
 
+_COL_FULL = (1 << ROWS) - 1  # bir kolonun 6 hücre bitini kapsayan mask
+
+# Küçük n'ler için log(n) tablosu: ziyaret sayaçları her backprop'ta
+# libm'e gitmek yerine buradan okur (4096 üstü math.log'a düşer)
+_LOG_TABLE = tuple(math.log(i) if i else 0.0 for i in range(4096))
+_INV_SQRT_TABLE = tuple(1.0 / math.sqrt(i) if i else 0.0 for i in range(4096))
+
+
+def _drop_bit(o, col):
+    """
+    Kolona düşecek taşın bitini occupancy mask'inden O(1) hesaplar.
+
+    Kolonun 6 biti alınıp bit_length ile yüksekliğe çevrilir; taşlar
+    alttan dolduğundan en yüksek set bit + 1 = düşme satırı.
+    """
+    base = col * COLUMN_STRIDE
+    height = ((o >> base) & _COL_FULL).bit_length()
+    return 1 << (base + height)
+
 
 class MCTSNode:
     """
     Node in the Monte Carlo search tree
     """
 
-    def __init__(self, board, parent=None, move=None, player=PLAYER_AI):
-        # Board kopyası (her node için kendi state'i)
-        self.board = [row[:] for row in board]
+    # Sabit attribute düzeni: node başına __dict__ tahsisi kalkar ve
+    # seçim döngüsündeki attribute erişimleri dict lookup'tan ucuzlar
+    __slots__ = ('p', 'o', 'parent', 'move', 'player',
+                 'children', 'wins', 'visits', 'untried_moves',
+                 'log_visits', 'inv_visits', 'inv_sqrt_visits')
+
+    def __init__(self, p, o, parent=None, move=None, player=PLAYER_AI):
+        # State: iki int — kopyalamak atama kadar ucuz
+        self.p = p                # AI taşlarının mask'i
+        self.o = o                # Doluluk (occupancy) mask'i
         self.parent = parent
         self.move = move          # Bu node'a gelinen hamle (kolon)
         self.player = player      # Bu node'da oynamış olan oyuncu (son hamleyi atan)
@@ -45,85 +75,113 @@ class MCTSNode:
         self.children = []
         self.wins = 0.0           # Toplam kazanım (AI açısından)
         self.visits = 0
-        self.untried_moves = get_valid_locations(board)
+        self.untried_moves = list(get_valid_locations_mask(o))
+        self.log_visits = 0.0     # update() içinde tazelenen log(visits)
+        self.inv_visits = 0.0     # 1/visits ve 1/sqrt(visits) cache'i:
+        self.inv_sqrt_visits = 0.0  # UCB1 döngüde salt çarpmaya iner
 
-    def ucb1(self, exploration_constant=0.9):
+    def ucb1(self, exploration_constant=0.9, log_parent=None):
         """
         Upper Confidence Bound 1 (UCB1)
+
+        log_parent: math.log(parent.visits) — seçim döngüsü bunu bir kez
+        hesaplayıp geçer; verilmezse burada hesaplanır.
         """
         if self.visits == 0:
             # Hiç ziyaret edilmemiş node'lar önce denenir
             return float('inf')
 
+        if log_parent is None:
+            log_parent = math.log(self.parent.visits)
         exploitation = self.wins / self.visits
-        exploration = exploration_constant * math.sqrt(
-            math.log(self.parent.visits) / self.visits
-        )
+        exploration = exploration_constant * math.sqrt(log_parent / self.visits)
         return exploitation + exploration
 
     def select_child(self, exploration_constant=0.9):
-        """UCB1'e göre en iyi çocuğu seç"""
-        return max(self.children, key=lambda c: c.ucb1(exploration_constant))
-
-    def add_child(self, move, board, player):
-        """Yeni child node ekle"""
-        child = MCTSNode(board, parent=self, move=move, player=player)
-        if move in self.untried_moves:
-            self.untried_moves.remove(move)
+        """
+        UCB1'e göre en iyi çocuğu seç.
+
+        sqrt(log(parent.visits)) çocuk başına değil bir kez hesaplanır;
+        çocuklarda 1/visits ve 1/sqrt(visits) cache'li olduğundan
+        (sqrt(lp/v) = sqrt(lp)/sqrt(v)) skor iki çarpma + bir toplamadır —
+        döngüde log, sqrt veya bölme yok.
+        """
+        sqrt_lp_c = math.sqrt(self.log_visits) * exploration_constant
+        best_child = None
+        best_score = -1.0
+        for c in self.children:
+            if c.visits == 0:
+                return c
+            score = c.wins * c.inv_visits + sqrt_lp_c * c.inv_sqrt_visits
+            if score > best_score:
+                best_score = score
+                best_child = c
+        return best_child
+
+    def add_child(self, move, p, o, player):
+        """Yeni child node ekle (move untried_moves'tan çıkarılmış olmalı)"""
+        child = MCTSNode(p, o, parent=self, move=move, player=player)
         self.children.append(child)
         return child
 
+    def expand_random(self, next_player):
+        """
+        Rastgele bir denenmemiş hamleyi genişlet, yeni child'ı döndür.
+
+        Hamle index ile pop edilir; eski choice + remove çifti expansion
+        başına iki O(n) liste taraması yapıyordu.
+        """
+        moves = self.untried_moves
+        move = moves.pop(random.randrange(len(moves)))
+        bit = _drop_bit(self.o, move)
+        child_o = self.o | bit
+        child_p = self.p | bit if next_player == PLAYER_AI else self.p
+        return self.add_child(move, child_p, child_o, next_player)
+
     def update(self, result):
         """
         Node istatistiklerini güncelle
 
         result: 1.0 = AI kazandı, 0.0 = AI kaybetti, 0.5 = beraberlik
         """
-        self.visits += 1
+        self.visits = v = self.visits + 1
         self.wins += result
+        if v < 4096:
+            self.log_visits = _LOG_TABLE[v]
+            self.inv_sqrt_visits = _INV_SQRT_TABLE[v]
+        else:
+            self.log_visits = math.log(v)
+            self.inv_sqrt_visits = 1.0 / math.sqrt(v)
+        self.inv_visits = 1.0 / v
 
 
 # ---------------------------------------------------------------------------
 # Yardımcı fonksiyonlar
 # ---------------------------------------------------------------------------
 
-def apply_move(board, col, player):
-    """Board'a hamleyi uygula ve oynanan satırı döndür."""
-    row = get_next_open_row(board, col)
-    drop_piece(board, row, col, player)
-    return row
-
-
-def undo_move(board, row, col):
-    """Son oynanan taşı geri al."""
-    board[row][col] = EMPTY
-
-
-def smart_rollout_move(board, valid_moves, player, opponent):
+def smart_rollout_move(p, o, valid_moves, player):
     """
     Rollout sırasında random yerine daha akıllı seçim yap:
 
     1) Eğer bu turda player hemen kazanabiliyorsa, oyna.
     2) Eğer opponent hemen kazanabiliyorsa, blokla.
     3) Aksi halde merkeze en yakın kolonu seç.
+
+    Deneme hamleleri mask üzerinde OR + has_win'dir: board'a dokunmak,
+    geri almak veya yükseklik güncellemek gerekmez.
     """
+    mine = p if player == PLAYER_AI else o ^ p
+    theirs = o ^ mine
+
     # 1) Kendi kazanma hamleni bul
     for col in valid_moves:
-        row = get_next_open_row(board, col)
-        drop_piece(board, row, col, player)
-        if winning_move(board, player):
-            undo_move(board, row, col)
+        if has_win(mine | _drop_bit(o, col)):
             return col
-        undo_move(board, row, col)
 
     # 2) Rakibin kazanma hamlesini blokla
     for col in valid_moves:
-        row = get_next_open_row(board, col)
-        drop_piece(board, row, col, opponent)
-        if winning_move(board, opponent):
-            undo_move(board, row, col)
+        if has_win(theirs | _drop_bit(o, col)):
             return col
-        undo_move(board, row, col)
 
     # 3) Merkeze en yakın hamleyi seç
     center = COLS // 2
@@ -131,11 +189,11 @@ def smart_rollout_move(board, valid_moves, player, opponent):
     return best_col
 
 
-def simulate_random_game(start_board, start_player, current_player):
+def simulate_random_game(p, o, start_player, current_player):
     """
     Tek bir rollout (oyunu sonuna kadar oyna).
 
-    start_board: Node'un board'u
+    p, o: Node'un mask çifti (AI taşları / doluluk)
     start_player: Node'da oynayan son oyuncu
     current_player: Kökte karar veren oyuncu (AI veya HUMAN)
 
@@ -144,33 +202,35 @@ def simulate_random_game(start_board, start_player, current_player):
                = 0.0 (AI kaybeder)
                = 0.5 (berabere)
     """
-    board = [row[:] for row in start_board]
-
     # Sıradaki oyuncu (node.player son oynayan)
     sim_player = PLAYER_HUMAN if start_player == PLAYER_AI else PLAYER_AI
-    opponent = PLAYER_HUMAN if sim_player == PLAYER_AI else PLAYER_AI
 
     # Önce: Node zaten terminal mi?
-    if winning_move(board, PLAYER_AI):
+    if has_win(p):
         return 1.0 if current_player == PLAYER_AI else 0.0
-    if winning_move(board, PLAYER_HUMAN):
+    if has_win(o ^ p):
         return 0.0 if current_player == PLAYER_AI else 1.0
 
     max_moves = ROWS * COLS  # güvenlik için üst sınır
 
     for _ in range(max_moves):
-        valid_moves = get_valid_locations(board)
+        valid_moves = get_valid_locations_mask(o)
         if not valid_moves:
             # Berabere
             return 0.5
 
         # Akıllı rollout hamlesi
-        move = smart_rollout_move(board, valid_moves, sim_player, opponent)
-        row = get_next_open_row(board, move)
-        drop_piece(board, row, move, sim_player)
+        move = smart_rollout_move(p, o, valid_moves, sim_player)
+        bit = _drop_bit(o, move)
+        o |= bit
+        if sim_player == PLAYER_AI:
+            p |= bit
+            mover_mask = p
+        else:
+            mover_mask = o ^ p
 
         # Kazanan var mı?
-        if winning_move(board, sim_player):
+        if has_win(mover_mask):
             if sim_player == current_player:
                 return 1.0  # AI kazandı
             else:
@@ -178,7 +238,6 @@ def simulate_random_game(start_board, start_player, current_player):
 
         # Oyuncu değiştir
         sim_player = PLAYER_HUMAN if sim_player == PLAYER_AI else PLAYER_AI
-        opponent = PLAYER_HUMAN if sim_player == PLAYER_AI else PLAYER_AI
 
     # Her ihtimale karşı
     return 0.5
@@ -208,8 +267,10 @@ def mcts_search(
     Returns:
         best_column: Seçilen en iyi kolon (int)
     """
+    masks = board_to_masks(board)
+
     # root.player = bir önce oynayan oyuncu
-    root = MCTSNode(board, player=-current_player)
+    root = MCTSNode(masks['p'], masks['o'], player=-current_player)
 
     start_time = time.time()
     iteration_count = 0
@@ -219,26 +280,21 @@ def mcts_search(
             break
 
         # 1. SELECTION
+        # Her node kendi mask çiftini taşıdığından board'u yeniden
+        # oynatmak gerekmez; sadece ağaçta aşağı inilir.
         node = root
-        # temp_board: selection + expansion boyunca board'u ilerletmek için
-        temp_board = [row[:] for row in board]
-
         while node.untried_moves == [] and node.children:
             node = node.select_child(exploration_constant)
-            if node.move is not None:
-                # node.player bu node'da oynamış olan
-                apply_move(temp_board, node.move, node.player)
 
         # 2. EXPANSION
         if node.untried_moves:
-            move = random.choice(node.untried_moves)
             next_player = PLAYER_HUMAN if node.player == PLAYER_AI else PLAYER_AI
-            apply_move(temp_board, move, next_player)
-            node = node.add_child(move, temp_board, next_player)
+            node = node.expand_random(next_player)
 
         # 3. SIMULATION (Rollout)
         result = simulate_random_game(
-            node.board,
+            node.p,
+            node.o,
             node.player,
             current_player
         )
@@ -18,8 +18,11 @@ UCB1: wins/visits + C × sqrt(ln(parent_visits) / visits)
 """
 
 import math
+import multiprocessing
+import os
 import random
 import time
+from collections import Counter, OrderedDict
 from typing import Optional, Tuple, Dict, List
 
 from .bitboard_engine import Bitboard, ROWS, COLS, PLAYER_AI, PLAYER_HUMAN, EMPTY
@@ -31,9 +34,61 @@ MCTS_ITERATIONS = 50000  # V2 is fast enough for 50k iterations in 5s
 UCB_EXPLORATION = 1.41   # UCB1 exploration constant (√2 is theoretically optimal)
 ROLLOUT_RANDOMNESS = 0.1  # 10% random moves in rollout (more deterministic = better)
 
-# Global Transposition Table
-# Key: board hash (int), Value: {'visits': int, 'wins': float, 'best_move': int}
-TRANSPOSITION_TABLE: Dict[int, Dict] = {}
+class _LRUTable(OrderedDict):
+    """
+    Size-capped dict with least-recently-used eviction
+
+    Reads and writes move the key to the back; inserts past the cap drop
+    the front (oldest) entry. Keeps the transposition table bounded no
+    matter how many distinct positions a long session visits.
+    """
+
+    def __init__(self, cap: int):
+        super().__init__()
+        self.cap = cap
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.cap:
+            self.popitem(last=False)
+
+    # dict.get/setdefault bypass the overrides at C level; route them
+    # through __getitem__/__setitem__ so they touch the LRU order too
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+
+# Global Transposition Table (tree reuse between turns)
+# Key: canonical board hash (int), Value: MCTSNodeV2 root from a previous
+# search — its whole subtree (visit counts included) is reused when the
+# same position comes back a move later instead of rebuilding from zero
+_TT_MAX_SIZE = 200_000  # hard cap (~20 MB of node references)
+TRANSPOSITION_TABLE: Dict[int, 'MCTSNodeV2'] = _LRUTable(_TT_MAX_SIZE)
+_TT_KEEP_GENERATIONS = 3  # evict cached roots older than this many searches
+_search_generation = 0
+
+# Shared scratch board for rollouts (reloaded via snapshot/restore each time)
+_SIM_BOARD = Bitboard()
+
+# log(n) for small n: visit counts hit this table instead of libm on
+# every backpropagation (counts above 4096 fall back to math.log)
+_LOG_TABLE = tuple(math.log(i) if i else 0.0 for i in range(4096))
+_INV_SQRT_TABLE = tuple(1.0 / math.sqrt(i) if i else 0.0 for i in range(4096))
 
 
 # ============================================================================
@@ -48,37 +103,26 @@ def hash_bitboard(bitboard: Bitboard) -> int:
     return bitboard.board
 
 
-def mirror_bitboard(bitboard: Bitboard) -> Bitboard:
+# 9-bit stripe masks, one per column (6 cell bits + 3 height bits — the
+# height travels with its column, so whole stripes can be swapped)
+_COL_STRIPE = 0b111111111
+
+
+def mirror_board_int(bb: int) -> int:
     """
-    Mirror a bitboard horizontally (for symmetry detection)
-    Column 0 ↔ 6, 1 ↔ 5, 2 ↔ 4, 3 stays
+    Mirror a raw 9-stride board int horizontally (column 0 ↔ 6, 1 ↔ 5,
+    2 ↔ 4, 3 stays) by swapping the seven 9-bit column stripes.
+
+    Constant-time: ~14 integer ops instead of the old 7×6 per-cell
+    Python loop with get/set pairs.
     """
-    mirrored = Bitboard()
-    mirrored.board = 0
-    mirrored.heights = [0] * COLS
-    
-    for col in range(COLS):
-        mirror_col = COLS - 1 - col
-        col_bits = bitboard.extract_column_bits(col)
-        height = bitboard.heights[col]
-        
-        # Copy bits to mirrored column
-        shift_original = col * 9
-        shift_mirror = mirror_col * 9
-        
-        # Clear mirror column first
-        mirrored.board &= ~(0b111111111 << shift_mirror)
-        
-        # Copy column bits
-        for bit in range(6):
-            if col_bits & (1 << bit):
-                mirrored.board |= (1 << (shift_mirror + bit))
-        
-        # Update height
-        mirrored.heights[mirror_col] = height
-        mirrored.board |= (height << (shift_mirror + 6))
-    
-    return mirrored
+    return (((bb & _COL_STRIPE) << 54)
+            | ((bb & (_COL_STRIPE << 9)) << 36)
+            | ((bb & (_COL_STRIPE << 18)) << 18)
+            | (bb & (_COL_STRIPE << 27))
+            | ((bb & (_COL_STRIPE << 36)) >> 18)
+            | ((bb & (_COL_STRIPE << 45)) >> 36)
+            | ((bb & (_COL_STRIPE << 54)) >> 54))
 
 
 def get_canonical_hash(bitboard: Bitboard) -> int:
@@ -87,11 +131,8 @@ def get_canonical_hash(bitboard: Bitboard) -> int:
     Returns the LOWER of {original_hash, mirrored_hash}
     This ensures symmetric positions have same hash
     """
-    original_hash = hash_bitboard(bitboard)
-    mirrored = mirror_bitboard(bitboard)
-    mirrored_hash = hash_bitboard(mirrored)
-    
-    return min(original_hash, mirrored_hash)
+    bb = bitboard.board
+    return min(bb, mirror_board_int(bb))
 
 
 # ============================================================================
@@ -100,39 +141,26 @@ def get_canonical_hash(bitboard: Bitboard) -> int:
 
 def bitboard_check_win_fast(bitboard: Bitboard, player_bit: int, last_col: int) -> bool:
     """
-    Fast win check - only check around last move
-    Much faster than full board scan
+    Fast win check via the 4-shift AND trick on the per-player mask
+
+    The old version walked up to 3 cells per direction around last_col
+    with Python bounds checks and get_cell calls (~24 interpreter
+    iterations). Testing the whole 7-stride mask instead covers all 69
+    windows branchlessly: per direction, m = bb & (bb >> s) marks pairs
+    and m & (m >> 2s) marks fours. Shifts: 1 = vertical, 7 = horizontal,
+    6 and 8 = the two diagonals; the guard bit per column stops
+    cross-column wrap. last_col is kept for API compatibility only.
     """
-    if bitboard.heights[last_col] == 0:
-        return False
-    
-    last_row = bitboard.heights[last_col] - 1
-    
-    # Directions: horizontal, vertical, diagonal/, diagonal\
-    directions = [
-        [(0, 1), (0, -1)],  # Horizontal
-        [(1, 0), (-1, 0)],  # Vertical
-        [(1, 1), (-1, -1)],  # Diagonal /
-        [(1, -1), (-1, 1)]   # Diagonal \
-    ]
-    
-    for direction_pair in directions:
-        count = 1  # Count the piece we just placed
-        
-        for dr, dc in direction_pair:
-            r, c = last_row + dr, last_col + dc
-            
-            while 0 <= r < ROWS and 0 <= c < COLS:
-                if bitboard.get_cell(r, c) == player_bit:
-                    count += 1
-                    r += dr
-                    c += dc
-                else:
-                    break
-        
-        if count >= 4:
+    bb = bitboard.ai_bb if player_bit == PLAYER_AI else bitboard.human_bb
+    return _mask_has_four(bb)
+
+
+def _mask_has_four(bb: int) -> bool:
+    """Four-in-a-row test on a raw 7-stride mask (shift-AND reduction)"""
+    for s in (1, 7, 6, 8):
+        m = bb & (bb >> s)
+        if m & (m >> (2 * s)):
             return True
-    
     return False
 
 
@@ -166,10 +194,17 @@ def bitboard_is_terminal(bitboard: Bitboard, last_col: Optional[int] = None) ->
 class MCTSNodeV2:
     """
     Optimized MCTS Node - Bitboard stored (lightweight)
-    
+
     Memory per node: ~50 bytes (bitboard is just 2 integers)
     """
-    
+
+    # Fixed attribute layout: no per-instance __dict__ for the ~50k nodes
+    # a search allocates, and slot access is faster than a dict lookup in
+    # the selection loop
+    __slots__ = ('bitboard', 'parent', 'move', 'player', 'children',
+                 'wins', 'visits', 'untried_moves', 'generation',
+                 'log_visits', 'inv_visits', 'inv_sqrt_visits')
+
     def __init__(self, bitboard: Bitboard, parent=None, move: Optional[int] = None, player: int = PLAYER_AI):
         self.bitboard = bitboard  # Store bitboard (lightweight - just int + list)
         self.parent = parent
@@ -180,97 +215,159 @@ class MCTSNodeV2:
         self.wins = 0.0
         self.visits = 0
         self.untried_moves: List[int] = bitboard_get_valid_moves(bitboard)
+        self.generation = 0       # Set when registered in the TT (eviction)
+        self.log_visits = 0.0     # Cached log(visits), refreshed in update()
+        self.inv_visits = 0.0     # Cached 1/visits and 1/sqrt(visits):
+        self.inv_sqrt_visits = 0.0  # turns UCB1 into pure multiplies
     
-    def ucb1(self, exploration_constant: float = UCB_EXPLORATION) -> float:
-        """UCB1 formula"""
+    def ucb1(self, exploration_constant: float = UCB_EXPLORATION, log_parent: Optional[float] = None) -> float:
+        """UCB1 formula (log_parent: precomputed math.log(parent.visits))"""
         if self.visits == 0:
             return float('inf')
-        
+
+        if log_parent is None:
+            log_parent = math.log(self.parent.visits)
         exploitation = self.wins / self.visits
-        exploration = exploration_constant * math.sqrt(
-            math.log(self.parent.visits) / self.visits
-        )
+        exploration = exploration_constant * math.sqrt(log_parent / self.visits)
         return exploitation + exploration
-    
+
     def select_child(self, exploration_constant: float = UCB_EXPLORATION) -> 'MCTSNodeV2':
-        """Select best child using UCB1"""
-        return max(self.children, key=lambda c: c.ucb1(exploration_constant))
+        """
+        Select best child using UCB1
+
+        Computes sqrt(log(parent.visits)) once for all children and runs a
+        plain loop instead of max + lambda. With 1/visits and
+        1/sqrt(visits) cached on the children (sqrt(lp/v) = sqrt(lp)/
+        sqrt(v)), each child's score is two multiplies and an add — no
+        log, sqrt or division in the loop.
+        """
+        sqrt_lp_c = math.sqrt(self.log_visits) * exploration_constant
+        best_child = None
+        best_score = -1.0
+        for c in self.children:
+            if c.visits == 0:
+                return c
+            score = c.wins * c.inv_visits + sqrt_lp_c * c.inv_sqrt_visits
+            if score > best_score:
+                best_score = score
+                best_child = c
+        return best_child
     
     def add_child(self, bitboard: Bitboard, move: int, player: int) -> 'MCTSNodeV2':
-        """Add new child node"""
+        """Add new child node (move must already be off untried_moves)"""
         child = MCTSNodeV2(bitboard, parent=self, move=move, player=player)
-        if move in self.untried_moves:
-            self.untried_moves.remove(move)
         self.children.append(child)
         return child
+
+    def expand_random(self, next_player: int, rng=random) -> 'MCTSNodeV2':
+        """
+        Expand one random untried move and return the new child
+
+        Pops the move by index instead of the old choice + 'if move in
+        untried_moves: remove' pair, which cost two O(n) list scans per
+        expansion.
+        """
+        moves = self.untried_moves
+        move = moves.pop(rng.getrandbits(5) % len(moves))
+
+        # Copy the bitboard and apply the move — a Bitboard is only
+        # allocated here at the tree-node boundary, rollout probes work
+        # on raw masks
+        new_board = self.bitboard.copy()
+        new_board.make_move(move, next_player)
+        return self.add_child(new_board, move, next_player)
     
     def update(self, result: float):
         """
         Backpropagate result
         result: 1.0 = AI win, 0.0 = AI loss, 0.5 = draw
         """
-        self.visits += 1
+        self.visits = v = self.visits + 1
         self.wins += result
+        if v < 4096:
+            self.log_visits = _LOG_TABLE[v]
+            self.inv_sqrt_visits = _INV_SQRT_TABLE[v]
+        else:
+            self.log_visits = math.log(v)
+            self.inv_sqrt_visits = 1.0 / math.sqrt(v)
+        self.inv_visits = 1.0 / v
 
 
 # ============================================================================
 # ROLLOUT POLICY (Stochastic Smart Rollout)
 # ============================================================================
 
-def smart_rollout_move_v2(bitboard: Bitboard, player_bit: int, randomness: float = ROLLOUT_RANDOMNESS) -> int:
+# Most-central free column per 7-bit validity mask: fallback of the
+# rollout policy collapses from a 7×7 membership scan to one table lookup
+_CENTER_ORDER = (3, 2, 4, 1, 5, 0, 6)
+BEST_COL_BY_MASK = tuple(
+    next((c for c in _CENTER_ORDER if mask & (1 << c)), 0)
+    for mask in range(128)
+)
+
+
+def smart_rollout_move_v2(bitboard: Bitboard, player_bit: int, randomness: float = ROLLOUT_RANDOMNESS,
+                          rng=random) -> int:
     """
     Improved rollout policy with stochastic selection
-    
+
     Args:
         bitboard: Current board state
         player_bit: Player to move
         randomness: Probability of random move (0.0-1.0)
-    
+        rng: random.Random instance (defaults to the global module so
+             existing callers keep working; searches pass their own to
+             skip the module-level state lookups)
+
     Returns:
         Column to play
     """
-    valid_moves = bitboard_get_valid_moves(bitboard)
-    
-    if not valid_moves:
+    # Valid columns as a 7-bit mask (bit c set = column c playable)
+    heights = bitboard.heights
+    free_mask = 0
+    for col in range(COLS):
+        if heights[col] < ROWS:
+            free_mask |= 1 << col
+
+    if not free_mask:
         return -1
-    
-    # 30% chance: Random move for exploration
-    if random.random() < randomness:
-        return random.choice(valid_moves)
-    
-    # 70% chance: Smart move
-    opponent = 1 - player_bit
-    
+
+    # Random move for exploration: integer compare on 7 random bits
+    # instead of a float draw (13/128 ≈ 10%)
+    if rng.getrandbits(7) < int(randomness * 128.0):
+        valid_moves = [c for c in range(COLS) if free_mask & (1 << c)]
+        return valid_moves[rng.getrandbits(3) % len(valid_moves)]
+
+    # Smart move: win/block probes work directly on the per-player masks,
+    # iterating set bits of free_mask (lowest-bit extraction) — the trial
+    # move is one OR with the drop bit, no Bitboard copy per column
+    if player_bit == PLAYER_AI:
+        mine, theirs = bitboard.ai_bb, bitboard.human_bb
+    else:
+        mine, theirs = bitboard.human_bb, bitboard.ai_bb
+
     # 1) Can I win immediately?
-    for col in valid_moves:
-        test_board = Bitboard()
-        test_board.board = bitboard.board
-        test_board.heights = bitboard.heights.copy()
-        test_board.make_move(col, player_bit)
-        
-        if bitboard_check_win_fast(test_board, player_bit, col):
+    m = free_mask
+    while m:
+        col = (m & -m).bit_length() - 1
+        if _mask_has_four(mine | (1 << (col * 7 + heights[col]))):
             return col
-    
+        m &= m - 1
+
     # 2) Must block opponent's win?
-    for col in valid_moves:
-        test_board = Bitboard()
-        test_board.board = bitboard.board
-        test_board.heights = bitboard.heights.copy()
-        test_board.make_move(col, opponent)
-        
-        if bitboard_check_win_fast(test_board, opponent, col):
+    m = free_mask
+    while m:
+        col = (m & -m).bit_length() - 1
+        if _mask_has_four(theirs | (1 << (col * 7 + heights[col]))):
             return col
-    
-    # 3) Prefer center columns (3, 2, 4, 1, 5, 0, 6)
-    center_preference = [3, 2, 4, 1, 5, 0, 6]
-    for col in center_preference:
-        if col in valid_moves:
-            return col
-    
-    return random.choice(valid_moves)
+        m &= m - 1
 
+    # 3) Prefer center columns (3, 2, 4, 1, 5, 0, 6) — precomputed lookup
+    return BEST_COL_BY_MASK[free_mask]
 
-def simulate_game_v2(bitboard: Bitboard, current_player: int, ai_perspective: int) -> float:
+
+def simulate_game_v2(bitboard: Bitboard, current_player: int, ai_perspective: int,
+                     rng=random) -> float:
     """
     Simulate random game from current position
     
@@ -282,11 +379,13 @@ def simulate_game_v2(bitboard: Bitboard, current_player: int, ai_perspective: in
     Returns:
         1.0 if ai_perspective wins, 0.0 if loses, 0.5 if draw
     """
-    # Make a copy of bitboard for simulation
-    sim_board = Bitboard()
-    sim_board.board = bitboard.board
-    sim_board.heights = bitboard.heights.copy()
-    
+    # Load the starting position into the shared scratch board — no
+    # Bitboard/heights allocation per rollout (snapshot/restore is a
+    # flat tuple copy and the caller's bitboard is never touched)
+    sim_board = _SIM_BOARD
+    sim_board.restore(bitboard.snapshot())
+
+
     player = current_player
     last_col = None
     
@@ -303,7 +402,7 @@ def simulate_game_v2(bitboard: Bitboard, current_player: int, ai_perspective: in
                 return 0.0  # Loss
         
         # Smart rollout move
-        col = smart_rollout_move_v2(sim_board, player)
+        col = smart_rollout_move_v2(sim_board, player, rng=rng)
         if col == -1:
             return 0.5  # No valid moves (draw)
         
@@ -318,62 +417,44 @@ def simulate_game_v2(bitboard: Bitboard, current_player: int, ai_perspective: in
 # MCTS SEARCH WITH ALL OPTIMIZATIONS
 # ============================================================================
 
-def mcts_search_v2(
-    bitboard: Bitboard,
+def _run_search_loop(
+    root: 'MCTSNodeV2',
     current_player: int,
-    iterations: int = MCTS_ITERATIONS,
-    time_limit: float = 5.0,
-    exploration_constant: float = UCB_EXPLORATION,
-    use_transposition_table: bool = True
-) -> Tuple[int, int]:
+    iterations: int,
+    time_limit: Optional[float],
+    exploration_constant: float,
+    rng=random
+) -> int:
     """
-    MCTS search with all optimizations
-    
-    Returns:
-        (best_column, actual_iterations)
+    Run the selection/expansion/simulation/backpropagation loop on a root
+
+    Shared by mcts_search_v2 and the root-parallel workers (which build
+    their own roots and skip the transposition table).
+    Returns the number of iterations actually performed.
     """
-    # Check TT for cached result
-    if use_transposition_table:
-        canonical_hash = get_canonical_hash(bitboard)
-        if canonical_hash in TRANSPOSITION_TABLE:
-            cached = TRANSPOSITION_TABLE[canonical_hash]
-            if cached['visits'] > 500:  # Trust if reasonably explored
-                return cached['best_move'], cached['visits']
-    
-    # Create root node with bitboard
-    root = MCTSNodeV2(bitboard, player=-current_player)  # Last player (not current)
-    
     start_time = time.time()
     iteration_count = 0
-    
+
     while iteration_count < iterations:
         if time_limit is not None and (time.time() - start_time) >= time_limit:
             break
-        
+
         # 1) SELECTION
         node = root
-        
+
         while node.untried_moves == [] and node.children:
             node = node.select_child(exploration_constant)
-        
+
         # 2) EXPANSION
         if node.untried_moves:
-            move = random.choice(node.untried_moves)
             next_player = 1 - node.player if node.player in [0, 1] else current_player
-            
-            # Make a copy of bitboard and apply move
-            new_board = Bitboard()
-            new_board.board = node.bitboard.board
-            new_board.heights = node.bitboard.heights.copy()
-            new_board.make_move(move, next_player)
-            
-            node = node.add_child(new_board, move, next_player)
-        
+            node = node.expand_random(next_player, rng=rng)
+
         # 3) SIMULATION
         # Simulate from the perspective of the player who just moved (node.player)
         sim_player = 1 - node.player if node.player in [0, 1] else current_player
-        result = simulate_game_v2(node.bitboard, sim_player, node.player)
-        
+        result = simulate_game_v2(node.bitboard, sim_player, node.player, rng=rng)
+
         # 4) BACKPROPAGATION
         # Result is from perspective of node.player
         # Each node needs to flip perspective based on who played
@@ -383,27 +464,97 @@ def mcts_search_v2(
             node.update(result)
             result = 1.0 - result  # Flip for parent node (opponent's perspective)
             node = node.parent
-        
+
         iteration_count += 1
+
+        # 5) EARLY TERMINATION (checked every 1024 iterations)
+        # If the most-visited root child leads the runner-up by more than
+        # the remaining budget, no outcome can change the argmax — stop
+        # and bank the time (big win on forced moves)
+        if not iteration_count & 1023 and len(root.children) > 1:
+            top = second = 0
+            for c in root.children:
+                v = c.visits
+                if v > top:
+                    second = top
+                    top = v
+                elif v > second:
+                    second = v
+            if top - second > iterations - iteration_count:
+                break
+
+    return iteration_count
+
+
+def mcts_search_v2(
+    bitboard: Bitboard,
+    current_player: int,
+    iterations: int = MCTS_ITERATIONS,
+    time_limit: float = 5.0,
+    exploration_constant: float = UCB_EXPLORATION,
+    use_transposition_table: bool = True
+) -> Tuple[int, int]:
+    """
+    MCTS search with all optimizations
     
+    Returns:
+        (best_column, actual_iterations)
+    """
+    # Tree reuse: if this position was (part of) a previous search, pick up
+    # its node and keep searching from the accumulated statistics
+    root = None
+    canonical_hash = None
+    if use_transposition_table:
+        canonical_hash = get_canonical_hash(bitboard)
+        cached = TRANSPOSITION_TABLE.get(canonical_hash)
+        # Only reuse the exact orientation: a mirror-only hit would hand
+        # back child columns from the flipped board
+        if cached is not None and cached.bitboard.board == bitboard.board:
+            root = cached
+            root.parent = None
+
+    if root is None:
+        # Create root node with bitboard
+        root = MCTSNodeV2(bitboard, player=-current_player)  # Last player (not current)
+
+    # Per-search RNG: one seeded instance threaded down through rollouts
+    # instead of thousands of module-level random.* lookups
+    rng = random.Random(time.time_ns() & 0xFFFFFFFF)
+
+    iteration_count = _run_search_loop(
+        root, current_player, iterations, time_limit, exploration_constant, rng=rng
+    )
+
     # No children? Return random
     if not root.children:
         valid_moves = bitboard_get_valid_moves(bitboard)
-        return random.choice(valid_moves) if valid_moves else 3, iteration_count
+        return rng.choice(valid_moves) if valid_moves else 3, iteration_count
     
     # Select most visited child
     best_child = max(root.children, key=lambda c: c.visits)
     best_move = best_child.move
     
-    # Update TT
+    # Update TT: register the searched tree for reuse on a later turn and
+    # evict roots that haven't been touched for a few searches
     if use_transposition_table:
-        canonical_hash = get_canonical_hash(bitboard)
-        TRANSPOSITION_TABLE[canonical_hash] = {
-            'visits': root.visits,
-            'wins': root.wins,
-            'best_move': best_move
-        }
-    
+        global _search_generation
+        _search_generation += 1
+        root.generation = _search_generation
+        TRANSPOSITION_TABLE[canonical_hash] = root
+        # Also register the first two plies below the root: after our move
+        # and the opponent's reply, the next search lands on one of these
+        for child in root.children:
+            child.generation = _search_generation
+            TRANSPOSITION_TABLE.setdefault(get_canonical_hash(child.bitboard), child)
+            for grandchild in child.children:
+                grandchild.generation = _search_generation
+                TRANSPOSITION_TABLE.setdefault(get_canonical_hash(grandchild.bitboard), grandchild)
+        cutoff = _search_generation - _TT_KEEP_GENERATIONS
+        if cutoff > 0:
+            stale = [h for h, n in TRANSPOSITION_TABLE.items() if n.generation <= cutoff]
+            for h in stale:
+                del TRANSPOSITION_TABLE[h]
+
     return best_move, iteration_count
 
 
@@ -411,6 +562,59 @@ def mcts_search_v2(
 # PUBLIC API
 # ============================================================================
 
+def get_best_move_mcts_v2_bb(
+    bitboard: Bitboard,
+    player_bit: int,
+    iterations: int = MCTS_ITERATIONS,
+    time_limit: float = 5.0,
+    developer_mode: bool = False
+) -> Tuple[int, Optional[Dict]]:
+    """
+    MCTS V2 fast path: takes a ready Bitboard, no 2D conversion
+
+    Callers that already maintain a Bitboard (benchmarks, self-play
+    loops) use this directly; get_best_move_mcts_v2 is a thin wrapper
+    around it for the legacy 2D-list interface.
+
+    Args:
+        bitboard: Position to search (not modified)
+        player_bit: Player to move in bitboard format (0=AI, 1=Human)
+        iterations/time_limit/developer_mode: as get_best_move_mcts_v2
+
+    Returns:
+        (column, stats) if developer_mode else (column, None)
+    """
+    start_time = time.time()
+
+    best_col, actual_iterations = mcts_search_v2(
+        bitboard,
+        current_player=player_bit,
+        iterations=iterations,
+        time_limit=time_limit,
+        exploration_constant=UCB_EXPLORATION,
+        use_transposition_table=True
+    )
+
+    thinking_time = time.time() - start_time
+
+    print(
+        f"🚀 MCTS V2: col={best_col}, iterations={actual_iterations}/{iterations}, "
+        f"time={thinking_time:.2f}s, TT_size={len(TRANSPOSITION_TABLE)}"
+    )
+
+    if developer_mode:
+        stats = {
+            "iterations": actual_iterations,
+            "thinking_time": thinking_time,
+            "algorithm": "MCTS_V2_Optimized",
+            "exploration_constant": UCB_EXPLORATION,
+            "transposition_table_size": len(TRANSPOSITION_TABLE)
+        }
+        return best_col, stats
+
+    return best_col, None
+
+
 def get_best_move_mcts_v2(
     board: List[List[int]],
     player: int,
@@ -420,66 +624,121 @@ def get_best_move_mcts_v2(
 ) -> Tuple[int, Optional[Dict]]:
     """
     MCTS V2 - Production optimized
-    
+
     Args:
         board: 2D list (6x7) - legacy format (PLAYER_AI=1, PLAYER_HUMAN=-1, EMPTY=0)
         player: 1=AI, -1=Human (game.py format)
         iterations: Max iterations
         time_limit: Max time in seconds
         developer_mode: Return stats?
-    
+
     Returns:
         (column, stats) if developer_mode else column
     """
-    # Convert game.py format to bitboard format
-    # game.py: PLAYER_AI=1, PLAYER_HUMAN=-1, EMPTY=0, board[row][col]
-    # bitboard: PLAYER_AI=0, PLAYER_HUMAN=1, EMPTY=2
-    # CRITICAL: In game.py, pieces don't "fall" - they're placed at specific positions
-    # We need to reconstruct the bitboard by placing pieces in the order they were played
-    
+    # Convert game.py format to bitboard format in one bulk pass
+    # (from_2d_array packs each column directly; the old path replayed
+    # up to 42 make_move calls)
     bitboard = Bitboard()
-    
-    # For each column, find all pieces from bottom to top and place them
-    for col in range(COLS):
-        for row in range(ROWS):  # Scan from bottom (0) to top (5)
-            cell = board[row][col]
-            if cell == 1:  # AI piece
-                bitboard.make_move(col, 0)  # Place AI piece (bitboard format)
-            elif cell == -1:  # Human piece
-                bitboard.make_move(col, 1)  # Place Human piece (bitboard format)
-            # Empty cells (0) are skipped
-    
+    bitboard.from_2d_array(board)
+
     # Convert player format: 1 → 0 (AI), -1 → 1 (Human)
     player_bit = 0 if player == 1 else 1
-    
-    start_time = time.time()
-    
-    best_col, actual_iterations = mcts_search_v2(
+
+    return get_best_move_mcts_v2_bb(
         bitboard,
-        current_player=player_bit,
+        player_bit,
         iterations=iterations,
         time_limit=time_limit,
-        exploration_constant=UCB_EXPLORATION,
-        use_transposition_table=True
+        developer_mode=developer_mode
     )
-    
+
+
+# ============================================================================
+# ROOT PARALLELIZATION
+# ============================================================================
+
+def _parallel_search_worker(args: Tuple) -> Dict[int, int]:
+    """
+    One root-parallel worker: build an independent tree for the given
+    position with its own RNG seed and return {column: visits} of the
+    root's children. Runs in a separate process, so the transposition
+    table is deliberately not touched.
+    """
+    board, player_bit, iterations, time_limit, seed = args
+    rng = random.Random(seed)
+
+    bitboard = Bitboard()
+    bitboard.from_2d_array(board)
+
+    root = MCTSNodeV2(bitboard, player=-player_bit)
+    _run_search_loop(root, player_bit, iterations, time_limit, UCB_EXPLORATION, rng=rng)
+    return {child.move: child.visits for child in root.children}
+
+
+def get_best_move_mcts_v2_parallel(
+    board: List[List[int]],
+    player: int,
+    iterations: int = MCTS_ITERATIONS,
+    time_limit: float = 5.0,
+    workers: Optional[int] = None,
+    developer_mode: bool = False
+) -> Tuple[int, Optional[Dict]]:
+    """
+    Root-parallel MCTS V2: N independent trees, visit counts summed
+
+    Each worker process searches the same position with a different RNG
+    seed; the final move is the argmax of the summed root-child visit
+    counts. Independent trees need no locking and scale with cores
+    (unlike threads, which the GIL serializes).
+
+    Args/returns match get_best_move_mcts_v2, plus:
+        workers: process count (default os.cpu_count())
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    player_bit = 0 if player == 1 else 1
+
+    start_time = time.time()
+    per_worker = max(1, iterations // workers)
+    tasks = [
+        (board, player_bit, per_worker, time_limit,
+         (time.time_ns() + i) & 0xFFFFFFFF)
+        for i in range(workers)
+    ]
+
+    totals: Counter = Counter()
+    with multiprocessing.Pool(workers) as pool:
+        # imap_unordered: aggregate results as workers finish instead of
+        # waiting on stragglers in submission order
+        for child_visits in pool.imap_unordered(_parallel_search_worker, tasks):
+            totals.update(child_visits)
+
+    if totals:
+        best_col = max(totals, key=totals.get)
+    else:
+        bitboard = Bitboard()
+        bitboard.from_2d_array(board)
+        valid_moves = bitboard_get_valid_moves(bitboard)
+        best_col = random.choice(valid_moves) if valid_moves else 3
+
     thinking_time = time.time() - start_time
-    
+    total_visits = sum(totals.values())
+
     print(
-        f"🚀 MCTS V2: col={best_col}, iterations={actual_iterations}/{iterations}, "
-        f"time={thinking_time:.2f}s, TT_size={len(TRANSPOSITION_TABLE)}"
+        f"🚀 MCTS V2 (parallel): col={best_col}, workers={workers}, "
+        f"visits={total_visits}, time={thinking_time:.2f}s"
     )
-    
+
     if developer_mode:
         stats = {
-            "iterations": actual_iterations,
+            "iterations": total_visits,
             "thinking_time": thinking_time,
-            "algorithm": "MCTS_V2_Optimized",
+            "algorithm": "MCTS_V2_RootParallel",
             "exploration_constant": UCB_EXPLORATION,
-            "transposition_table_size": len(TRANSPOSITION_TABLE)
+            "workers": workers
         }
         return best_col, stats
-    
+
     return best_col, None
 
 
@@ -0,0 +1,131 @@
+"""
+Açılış kitabı (opening book) - ilk ~8 ply için minimax'ı tamamen atlar.
+
+Fikir: erken pozisyon sayısı küçüktür; en iyi hamleleri bir kere offline
+hesaplayıp dosyaya yazarsak, oyun içinde ilk hamleler mikrosaniyeler
+sürer ve zaman bütçesi derin aramalara kalır. Boş tahtada merkez sütun
+oynamak bilinen optimal açılıştır, o yüzden kitapta bile aramadan direkt
+döndürülür.
+
+Kitap, ayna simetrisi katlanarak saklanır: pozisyonun Zobrist hash'i ile
+aynalanmış halinin hash'inden küçük olanı anahtar olur (depolama yarıya
+iner). Lookup iki hash'i de dener; ayna hash'i tutarsa sütun da
+aynalanır (col -> COLS-1-col).
+
+Kitabı üretmek için (offline, bir kere):
+    python -m connect4.opening_book
+"""
+
+import os
+import pickle
+
+from .game import (
+    ROWS, COLS, EMPTY, PLAYER_AI, PLAYER_HUMAN,
+    create_board, drop_piece, get_next_open_row, get_valid_locations,
+    winning_move,
+)
+from .agent import get_best_move, zobrist_hash
+
+BOOK_MAX_PLIES = 8  # kitabın kapsadığı maksimum taş sayısı
+BOOK_BUILD_DEPTH = 10  # offline üretimde kullanılan arama derinliği
+BOOK_FILE = os.path.join(os.path.dirname(__file__), 'opening_book.pkl')
+
+
+def mirror_board(board):
+    """Tahtanın sütun-aynalanmış kopyasını döndürür."""
+    return [row[::-1] for row in board]
+
+
+def _book_put(book, board, col):
+    """Pozisyonu kanonik (küçük) hash'iyle kitaba yaz."""
+    h = zobrist_hash(board)
+    hm = zobrist_hash(mirror_board(board))
+    if hm < h:
+        book[hm] = COLS - 1 - col
+    else:
+        book[h] = col
+
+
+def lookup(book, board):
+    """Kitaptan hamle ara; ayna eşleşmesinde sütunu geri çevirir."""
+    col = book.get(zobrist_hash(board))
+    if col is not None:
+        return col
+    col = book.get(zobrist_hash(mirror_board(board)))
+    if col is not None:
+        return COLS - 1 - col
+    return None
+
+
+def load_opening_book(path=BOOK_FILE):
+    """Kitabı diskten yükler; dosya yoksa boş dict döner."""
+    try:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.PickleError):
+        return {}
+
+
+def opening_move(book, board, move_count):
+    """
+    Oyun içi giriş noktası: kitap kapsamındaysa hamleyi döndürür,
+    değilse None (arama çalışsın).
+    """
+    if move_count > BOOK_MAX_PLIES:
+        return None
+    if move_count == 0:
+        return COLS // 2  # boş tahtada merkez, aramaya gerek yok
+    return lookup(book, board)
+
+
+def build_opening_book(max_plies=BOOK_MAX_PLIES, depth=BOOK_BUILD_DEPTH,
+                       path=BOOK_FILE):
+    """
+    Kitabı offline üretir.
+
+    AI'nin hamle sırası geldiği her pozisyonda tam derinlik arama yapıp
+    sonucu kaydeder; AI düğümlerinde sadece kitap hamlesi genişletilir
+    (AI kitabı takip edecek), rakip düğümlerinde tüm cevaplar denenir.
+    İki başlangıç sırası da (AI ilk / insan ilk) kapsanır.
+    """
+    book = {}
+    visited = set()
+
+    def expand(board, piece_to_move, plies):
+        if plies >= max_plies:
+            return
+        key = min(zobrist_hash(board), zobrist_hash(mirror_board(board)))
+        if (key, piece_to_move) in visited:
+            return
+        visited.add((key, piece_to_move))
+
+        if piece_to_move == PLAYER_AI:
+            col = lookup(book, board)
+            if col is None:
+                col = get_best_move(board, PLAYER_AI, depth)
+                _book_put(book, board, col)
+            row = get_next_open_row(board, col)
+            drop_piece(board, row, col, PLAYER_AI)
+            if not winning_move(board, PLAYER_AI):
+                expand(board, PLAYER_HUMAN, plies + 1)
+            board[row][col] = EMPTY
+        else:
+            for col in get_valid_locations(board):
+                row = get_next_open_row(board, col)
+                drop_piece(board, row, col, PLAYER_HUMAN)
+                if not winning_move(board, PLAYER_HUMAN):
+                    expand(board, PLAYER_AI, plies + 1)
+                board[row][col] = EMPTY
+
+    for first in (PLAYER_AI, PLAYER_HUMAN):
+        expand(create_board(), first, 0)
+
+    with open(path, 'wb') as f:
+        pickle.dump(book, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    print(f"📖 Opening book: {len(book)} positions -> {path}")
+    return book
+
+
+if __name__ == "__main__":
+    build_opening_book()
@@ -8,14 +8,36 @@ import random
 from typing import List, Tuple, Optional, Dict, Any
 from .game import (
     ROWS, COLS, PLAYER_AI, PLAYER_HUMAN,
-    is_terminal_node, winning_move, get_valid_locations,
-    get_next_open_row, drop_piece
+    COLUMN_STRIDE, BOARD_MASK, board_to_masks, has_win
 )
-from .algorithms import score_position
+from .algorithms import score_position_masks
+
+# Transpozisyon tablosu giriş bayrakları: EXACT tam değer, LOWER/UPPER
+# alpha-beta penceresiyle kesilmiş aramadan gelen alt/üst sınır.
+_TT_EXACT = 0
+_TT_LOWER = 1
+_TT_UPPER = 2
+_TT_MAX_ENTRIES = 1 << 21  # ~2M giriş; dolunca temizlenir (bkz. _EVAL_CACHE)
+
+# Modül düzeyinde sonsuz sabitleri: sıcak döngüde math.inf'in
+# LOAD_ATTR'ı yerine tek global okuma.
+_NINF = -math.inf
+_PINF = math.inf
+
+
+def _fmt(x, sym):
+    """None ve sonsuz değerleri verilen sembolle, sayıları iki haneyle yaz."""
+    if x is None or x == _NINF or x == _PINF:
+        return sym
+    return f"{x:.2f}"
 
 
 class TreeNode:
-    """Minimax ağacında bir düğüm"""
+    """Minimax ağacında bir düğüm.
+
+    board_state: (ai_mask, hu_mask) çifti — 2D kopya yerine iki int,
+    düğüm başına 7 liste tahsisi ortadan kalkar.
+    """
     def __init__(self, depth, move, board_state, is_max_node):
         self.depth = depth
         self.move = move  # Bu düğüme ulaşmak için yapılan hamle
@@ -41,16 +63,65 @@ class SearchTreeVisualizer:
         self.root = None
         self.total_nodes = 0
         self.pruned_nodes = 0
+        # Kesmelerde aranmadan atlanan alt ağaçların tahmini toplam
+        # boyutu; pruning'siz koşunun düğüm sayısı ikinci bir geçiş
+        # yapmadan total_nodes + bu sayıdan kestirilir.
+        self.pruned_subtree_nodes = 0
         self.max_branching_factor = 0
-        
+        # Farklı hamle sıralarıyla ulaşılan aynı pozisyonlar için
+        # (ai_bb, hu_bb, sıra) -> (değer, derinlik, bayrak) tablosu.
+        self.transposition_table = {}
+        self.tt_hits = 0
+        # Iterative deepening için: pozisyon -> önceki (daha sığ)
+        # iterasyonda en iyi bulunan sütun. Bir sonraki turda o sütun
+        # ilk genişletilir (bkz. visualize_search_tree).
+        self.best_move_at = {}
+
     def build_minimax_tree(self, board, depth, alpha, beta, maximizing_player, 
                           parent_node=None, move=None, with_pruning=True):
-        """Minimax ağacını oluştur (alpha-beta ile veya olmadan)"""
-        
-        # Düğüm oluştur
-        node = TreeNode(depth, move, board, maximizing_player)
-        node.alpha = alpha
-        node.beta = beta
+        """Minimax ağacını oluştur (alpha-beta ile veya olmadan).
+
+        2D tahta kökte bir kez mask çiftine çevrilir; traversal
+        _build_tree_bb içinde bitboard'lar üzerinde koşar. Hamle tek
+        OR'dur, kazanç kontrolü has_win'in 8 bit işlemidir — düğüm
+        başına tahta kopyası ve 69 pencerelik tarama kalmaz.
+        """
+        masks = board_to_masks(board)
+        ai_bb = masks['p']
+        occ = masks['o']
+        hu_bb = occ ^ ai_bb
+        heights = [((occ >> (c * COLUMN_STRIDE)) & 0x3F).bit_length()
+                   for c in range(COLS)]
+        color = 1 if maximizing_player else -1
+        if color == 1:
+            a, b = alpha, beta
+        else:
+            a, b = -beta, -alpha
+        value = self._negamax_bb(
+            ai_bb, hu_bb, heights, depth, a, b, color,
+            parent_node, move, with_pruning
+        )
+        return color * value
+
+    def _negamax_bb(self, ai_bb, hu_bb, heights, depth, alpha, beta,
+                    color, parent_node=None, move=None, with_pruning=True):
+        """build_minimax_tree'nin negamax gövdesi.
+
+        color=+1 AI (MAX), color=-1 insan (MIN). Değerler her zaman
+        sıradaki oyuncunun bakış açısındandır; çocuk
+        -negamax(-beta, -alpha, -color) ile aranır, böylece MAX/MIN
+        dallarının kopyası tek döngüye iner. Görselleştirme eski
+        görünümünü korur: node.value ile node.alpha/beta AI bakış
+        açısına çevrilerek saklanır.
+        """
+        # Düğüm oluştur — pencere AI bakışına çevrilerek gösterilir
+        node = TreeNode(depth, move, (ai_bb, hu_bb), color == 1)
+        if color == 1:
+            node.alpha = alpha
+            node.beta = beta
+        else:
+            node.alpha = -beta
+            node.beta = -alpha
         
         if parent_node:
             parent_node.children.append(node)
@@ -59,111 +130,177 @@ class SearchTreeVisualizer:
         
         self.total_nodes += 1
         
-        valid_locations = get_valid_locations(board)
-        is_terminal = is_terminal_node(board)
-        
-        # Terminal veya max depth
-        if depth == 0 or is_terminal:
-            if is_terminal:
-                if winning_move(board, PLAYER_AI):
-                    node.value = 10000000
-                elif winning_move(board, PLAYER_HUMAN):
-                    node.value = -10000000
-                else:
-                    node.value = 0
+        # Terminal veya max depth — mask'ler üzerinde tek kontrol
+        if has_win(ai_bb):
+            node.value = 10000000
+            return color * 10000000
+        if has_win(hu_bb):
+            node.value = -10000000
+            return color * -10000000
+        if (ai_bb | hu_bb) == BOARD_MASK:
+            node.value = 0
+            return 0
+        if depth == 0:
+            score = score_position_masks(ai_bb, hu_bb)
+            node.value = score
+            return color * score
+
+        # Transpozisyon tablosu: aynı pozisyon daha önce en az bu
+        # derinlikte aranmışsa alt ağacı yeniden kurmaya gerek yok.
+        # Mask çifti pozisyonun kendisidir — ayrı bir Zobrist anahtarına
+        # gerek kalmadan çakışmasız sözlük anahtarı olarak kullanılır.
+        # Değerler sıradaki oyuncuya göredir, anahtar color içerir.
+        tt = self.transposition_table
+        tt_key = (ai_bb, hu_bb, color)
+        entry = tt.get(tt_key)
+        if entry is not None and entry[1] >= depth:
+            tt_value, _, tt_flag = entry
+            if tt_flag == _TT_EXACT:
+                self.tt_hits += 1
+                node.value = color * tt_value
+                return tt_value
+            if tt_flag == _TT_LOWER:
+                alpha = max(alpha, tt_value)
             else:
-                node.value = score_position(board, PLAYER_AI)
-            return node.value
-        
+                beta = min(beta, tt_value)
+            if with_pruning and alpha >= beta:
+                self.tt_hits += 1
+                node.value = color * tt_value
+                return tt_value
+        alpha_orig = alpha
+        beta_orig = beta
+
+        valid_locations = [c for c in range(COLS) if heights[c] < ROWS]
+
         # Branching factor güncelle
         self.max_branching_factor = max(self.max_branching_factor, len(valid_locations))
         
-        if maximizing_player:
-            value = -math.inf
-            for col in valid_locations:
-                row = get_next_open_row(board, col)
-                temp_board = [row[:] for row in board]
-                drop_piece(temp_board, row, col, PLAYER_AI)
-                
-                child_value = self.build_minimax_tree(
-                    temp_board, depth - 1, alpha, beta, False, node, col, with_pruning
+        if with_pruning:
+            # Hamle sıralama: bir hamlelik sonucun sığ değeri color ile
+            # sıradaki oyuncunun bakışına çevrilir; en umut verici sütun
+            # önce aranır, eşitlikte merkeze yakın olan öne alınır.
+            if color == 1:
+                def one_ply(c):
+                    return score_position_masks(
+                        ai_bb | (1 << (c * COLUMN_STRIDE + heights[c])), hu_bb
+                    )
+            else:
+                def one_ply(c):
+                    return -score_position_masks(
+                        ai_bb, hu_bb | (1 << (c * COLUMN_STRIDE + heights[c]))
+                    )
+            valid_locations.sort(
+                key=lambda c: (one_ply(c), -abs(c - 3)), reverse=True
+            )
+        best_prev = self.best_move_at.get(tt_key)
+        if best_prev is not None and best_prev in valid_locations:
+            valid_locations.remove(best_prev)
+            valid_locations.insert(0, best_prev)
+
+        value = _NINF
+        best_col = None
+        for i, col in enumerate(valid_locations):
+            # Yap/geri-al: heights paylaşılır, kopya yok. Recursion
+            # dönünce tek dekrement eski duruma getirir.
+            bit = 1 << (col * COLUMN_STRIDE + heights[col])
+            heights[col] += 1
+            if color == 1:
+                child_value = -self._negamax_bb(
+                    ai_bb | bit, hu_bb, heights, depth - 1, -beta, -alpha,
+                    -1, node, col, with_pruning
                 )
-                
-                value = max(value, child_value)
-                alpha = max(alpha, value)
-                
-                if with_pruning and alpha >= beta:
-                    # Prune remaining children
-                    for remaining_col in valid_locations[valid_locations.index(col)+1:]:
-                        pruned_node = TreeNode(depth-1, remaining_col, None, False)
-                        pruned_node.is_pruned = True
-                        node.children.append(pruned_node)
-                        self.pruned_nodes += 1
-                    break
-                    
-            node.value = value
-            return value
-        else:
-            value = math.inf
-            for col in valid_locations:
-                row = get_next_open_row(board, col)
-                temp_board = [row[:] for row in board]
-                drop_piece(temp_board, row, col, PLAYER_HUMAN)
-                
-                child_value = self.build_minimax_tree(
-                    temp_board, depth - 1, alpha, beta, True, node, col, with_pruning
+            else:
+                child_value = -self._negamax_bb(
+                    ai_bb, hu_bb | bit, heights, depth - 1, -beta, -alpha,
+                    1, node, col, with_pruning
                 )
-                
-                value = min(value, child_value)
-                beta = min(beta, value)
-                
-                if with_pruning and alpha >= beta:
-                    # Prune remaining children
-                    for remaining_col in valid_locations[valid_locations.index(col)+1:]:
-                        pruned_node = TreeNode(depth-1, remaining_col, None, True)
-                        pruned_node.is_pruned = True
-                        node.children.append(pruned_node)
-                        self.pruned_nodes += 1
-                    break
-                    
-            node.value = value
-            return value
+            heights[col] -= 1
+            
+            if child_value > value:
+                value = child_value
+                best_col = col
+            alpha = max(alpha, value)
+            
+            if with_pruning and alpha >= beta:
+                # Prune remaining children
+                remaining = valid_locations[i+1:]
+                if remaining:
+                    # Budanan her kardeş depth-1 köklü bir alt ağaçtı;
+                    # boyutu dallanma = len(valid_locations) varsayımıyla
+                    # geometrik serinin kapalı formuyla kestirilir.
+                    bfac = len(valid_locations)
+                    subtree = depth if bfac == 1 else (bfac ** depth - 1) // (bfac - 1)
+                    self.pruned_subtree_nodes += subtree * len(remaining)
+                for remaining_col in remaining:
+                    pruned_node = TreeNode(depth-1, remaining_col, None, color == -1)
+                    pruned_node.is_pruned = True
+                    node.children.append(pruned_node)
+                    self.pruned_nodes += 1
+                break
+
+        # Pruning kapalıyken değer her zaman tam negamax değeridir;
+        # pencere daraltılmış aramada ise sınır bayrağı gerekir.
+        if not with_pruning:
+            tt_flag = _TT_EXACT
+        elif value <= alpha_orig:
+            tt_flag = _TT_UPPER
+        elif value >= beta_orig:
+            tt_flag = _TT_LOWER
+        else:
+            tt_flag = _TT_EXACT
+        if len(tt) >= _TT_MAX_ENTRIES:
+            tt.clear()
+        tt[tt_key] = (value, depth, tt_flag)
+        if best_col is not None:
+            self.best_move_at[tt_key] = best_col
+        node.value = color * value
+        return value
     
     def print_tree(self, node=None, prefix="", is_last=True, file=None):
-        """Ağacı ASCII art olarak yazdır"""
+        """Ağacı ASCII art olarak yazdır.
+
+        Özyineleme yerine açık LIFO yığın: düğüm başına bir Python
+        çerçevesi açılmaz, satırlar bir listede toplanır ve tek print
+        çağrısıyla yazılır — derin ağaçlarda hem hızlı hem recursion
+        limitinden bağımsız.
+        """
         if node is None:
             node = self.root
         
         if node is None:
             return
         
-        # Düğüm bilgisi
-        connector = "└── " if is_last else "├── "
-        node_type = "MAX" if node.is_max_node else "MIN"
-        
-        if node.is_pruned:
-            line = f"{prefix}{connector}Move {node.move}: PRUNED ✂️"
-        else:
-            value_str = f"{node.value:.2f}" if node.value is not None else "?"
-            alpha_str = f"{node.alpha:.2f}" if node.alpha is not None and node.alpha != -math.inf else "-∞"
-            beta_str = f"{node.beta:.2f}" if node.beta is not None and node.beta != math.inf else "+∞"
-            line = f"{prefix}{connector}Move {node.move}: {node_type} | v={value_str} | α={alpha_str}, β={beta_str}"
-        
-        print(line, file=file)
-        
-        # Alt düğümler için prefix
-        if not is_last:
-            prefix += "│   "
-        else:
-            prefix += "    "
+        lines = []
+        stack = [(node, prefix, is_last)]
+        while stack:
+            node, prefix, is_last = stack.pop()
+            connector = "└── " if is_last else "├── "
+            
+            if node.is_pruned:
+                # Budanan düğümün değeri hiç atanmaz; biçimlemeye girmeden
+                # sabit kuyruk yeterli.
+                lines.append(f"{prefix}{connector}Move {node.move}: PRUNED ✂️")
+            else:
+                node_type = "MAX" if node.is_max_node else "MIN"
+                lines.append(
+                    f"{prefix}{connector}Move {node.move}: {node_type}"
+                    f" | v={_fmt(node.value, '?')}"
+                    f" | α={_fmt(node.alpha, '-∞')}, β={_fmt(node.beta, '+∞')}"
+                )
+            
+            # Alt düğümler ters sırada itilir ki soldan sağa işlensinler
+            child_prefix = prefix + ("    " if is_last else "│   ")
+            last_i = len(node.children) - 1
+            for i in range(last_i, -1, -1):
+                stack.append((node.children[i], child_prefix, i == last_i))
         
-        # Çocukları yazdır
-        for i, child in enumerate(node.children):
-            is_last_child = (i == len(node.children) - 1)
-            self.print_tree(child, prefix, is_last_child, file)
+        print("\n".join(lines), file=file)
     
     def generate_statistics(self) -> str:
         """Ağaç istatistikleri"""
+        if self.total_nodes == 0:
+            return "\n(no nodes — build the tree first)\n"
+        
         stats = "\n" + "="*80 + "\n"
         stats += "SEARCH TREE STATISTICS\n"
         stats += "="*80 + "\n"
@@ -174,10 +311,15 @@ class SearchTreeVisualizer:
         stats += f"Max branching factor:     {self.max_branching_factor}\n"
         stats += f"Max depth:                {self.max_depth}\n"
         
-        # Theoretical vs actual
-        theoretical_nodes = sum(self.max_branching_factor**d for d in range(self.max_depth + 1))
+        # Theoretical vs actual — geometrik serinin kapalı formu:
+        # sum(b**k, k=0..d) = (b**(d+1) - 1) / (b - 1)
+        b, d = self.max_branching_factor, self.max_depth
+        theoretical_nodes = d + 1 if b == 1 else (b ** (d + 1) - 1) // (b - 1)
         stats += f"\nTheoretical nodes (no pruning): {theoretical_nodes}\n"
         stats += f"Actual nodes (with pruning):    {self.total_nodes}\n"
+        if self.pruned_subtree_nodes:
+            estimated = self.total_nodes + self.pruned_subtree_nodes
+            stats += f"Estimated nodes w/o pruning:    {estimated}\n"
         stats += f"Reduction:                      {((theoretical_nodes-self.total_nodes)/theoretical_nodes*100):.2f}%\n"
         stats += "="*80 + "\n"
         
@@ -205,60 +347,77 @@ class SearchTreeVisualizer:
         print(f"🌳 Search tree saved to: {filename}")
     
     def generate_graphviz_dot(self, filename="search_tree.dot"):
-        """GraphViz DOT formatında ağaç (görsel için)"""
-        def node_id(node):
-            return f"node_{id(node)}"
-        
-        def traverse(node, dot_lines):
-            if node is None:
-                return
-            
-            nid = node_id(node)
-            node_type = "MAX" if node.is_max_node else "MIN"
-            
-            if node.is_pruned:
-                label = f"Move {node.move}\\nPRUNED"
-                color = "red"
-                style = "dashed"
-            else:
-                value_str = f"{node.value:.1f}" if node.value is not None else "?"
-                label = f"Move {node.move}\\n{node_type}\\nv={value_str}"
-                color = "lightblue" if node.is_max_node else "lightgreen"
-                style = "filled"
-            
-            dot_lines.append(f'  {nid} [label="{label}", style="{style}", fillcolor="{color}"];')
-            
-            for child in node.children:
-                child_id = node_id(child)
-                edge_style = "dashed" if child.is_pruned else "solid"
-                dot_lines.append(f'  {nid} -> {child_id} [style="{edge_style}"];')
-                traverse(child, dot_lines)
+        """GraphViz DOT formatında ağaç (görsel için).
+
+        Düğüm kimlikleri ziyaret sırasına göre n0, n1, ... diye
+        numaralanır: id() tabanlı adreslere göre hem kısa hem de
+        çalıştırmalar arası deterministik — çıktı diff'lenebilir.
+        """
+        # Satırlar UTF-8 baytları olarak tek bir bytearray'e eklenir ve
+        # dosyaya tek write ile gider; '\n'.join + metin modlu encode'un
+        # ara str kopyaları oluşmaz.
+        buf = bytearray(b"digraph MinimaxTree {\n  rankdir=TB;\n  node [shape=box];\n")
         
-        dot_lines = [
-            "digraph MinimaxTree {",
-            "  rankdir=TB;",
-            "  node [shape=box];",
-        ]
+        # Özyinelemeli traverse yerine açık yığın; kenar satırı çocuk
+        # işlenirken yazılır, çıktı sırası özyinelemeli haliyle birebir.
+        if self.root is not None:
+            next_id = 0
+            stack = [(self.root, None)]
+            while stack:
+                node, parent_id = stack.pop()
+                nid = f"n{next_id}"
+                next_id += 1
+                
+                if parent_id is not None:
+                    edge_style = "dashed" if node.is_pruned else "solid"
+                    buf.extend(f'  {parent_id} -> {nid} [style="{edge_style}"];\n'.encode())
+                
+                if node.is_pruned:
+                    label = f"Move {node.move}\\nPRUNED"
+                    color = "red"
+                    style = "dashed"
+                else:
+                    node_type = "MAX" if node.is_max_node else "MIN"
+                    value_str = f"{node.value:.1f}" if node.value is not None else "?"
+                    label = f"Move {node.move}\\n{node_type}\\nv={value_str}"
+                    color = "lightblue" if node.is_max_node else "lightgreen"
+                    style = "filled"
+                
+                buf.extend(f'  {nid} [label="{label}", style="{style}", fillcolor="{color}"];\n'.encode())
+                
+                for child in reversed(node.children):
+                    stack.append((child, nid))
         
-        traverse(self.root, dot_lines)
-        dot_lines.append("}")
+        buf.extend(b"}")
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(dot_lines))
+        with open(filename, 'wb') as f:
+            f.write(buf)
         
         print(f"📊 GraphViz DOT file saved to: {filename}")
         print(f"   Use: dot -Tpng {filename} -o search_tree.png")
 
 
 def visualize_search_tree(board, depth=3, with_pruning=True):
-    """Search tree'yi görselleştir"""
+    """Search tree'yi görselleştir.
+
+    Ağaç iterative deepening ile kurulur: 1..depth sığ aramaların her
+    birinde bulunan en iyi sütunlar best_move_at'te tutulur ve bir
+    sonraki turda ilk genişletilir. Ara ağaçlar atılır; görselleştirme
+    son (tam derinlik) iterasyonun ağacıdır, sayaçlar da ona aittir.
+    """
     print("\n🌳 Building search tree...")
     
     visualizer = SearchTreeVisualizer(max_depth=depth)
-    visualizer.build_minimax_tree(
-        board, depth, -math.inf, math.inf, True, 
-        with_pruning=with_pruning
-    )
+    for d in range(1, depth + 1):
+        visualizer.total_nodes = 0
+        visualizer.pruned_nodes = 0
+        visualizer.pruned_subtree_nodes = 0
+        visualizer.tt_hits = 0
+        visualizer.max_branching_factor = 0
+        visualizer.build_minimax_tree(
+            board, d, _NINF, _PINF, True, 
+            with_pruning=with_pruning
+        )
     
     print("\nSearch Tree:")
     print("="*80)
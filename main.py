@@ -1,7 +1,7 @@
 # Kendi modüllerimizden gerekli fonksiyonları ve sabitleri içe aktarıyoruz.
 from connect4.game import (
     create_board, print_board, drop_piece, is_valid_location,
-    get_next_open_row, winning_move, get_valid_locations,
+    get_next_open_row, winning_move, get_valid_locations, is_board_full,
     PLAYER_HUMAN, PLAYER_AI, COLS
 )
 from connect4.agent import get_best_move
@@ -97,7 +97,7 @@ def main():
         print_board(board)
 
         # Beraberlik durumunu kontrol et
-        if not game_over and len(get_valid_locations(board)) == 0:
+        if not game_over and is_board_full(board):
             print("\n*** OYUN BERABERE BİTTİ! ***")
             game_over = True
 
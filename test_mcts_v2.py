@@ -1,18 +1,33 @@
+import argparse
+import os
+
 from connect4.mcts_agent_v2 import get_best_move_mcts_v2
 from connect4.game import create_board, drop_piece
 
+# Board dump ve stats çıktısı sadece CONNECT4_VERBOSE=1 ile basılır;
+# mikrobenchmark olarak kullanıldığında print maliyeti ölçüme karışmaz.
+VERBOSE = os.environ.get("CONNECT4_VERBOSE") == "1"
+
+parser = argparse.ArgumentParser(description="MCTS V2 smoke test / microbenchmark")
+parser.add_argument("--iterations", type=int, default=5000)
+parser.add_argument("--time-limit", type=float, default=2.0)
+args = parser.parse_args()
+
 # Test simple position
 board = create_board()
 drop_piece(board, 0, 3, 1)   # AI at column 3
 drop_piece(board, 0, 2, -1)  # Human at column 2
 drop_piece(board, 1, 3, 1)   # AI at column 3 (row 1)
 
-print('Board (top to bottom):')
-for r in range(5, -1, -1):
-    print(f'Row {r}: {board[r]}')
+if VERBOSE:
+    print('Board (top to bottom):')
+    for r in range(5, -1, -1):
+        print(f'Row {r}: {board[r]}')
 
 print('\nMCTS V2 thinking...')
-col, stats = get_best_move_mcts_v2(board, -1, iterations=5000, time_limit=2.0, developer_mode=True)
+col, stats = get_best_move_mcts_v2(board, -1, iterations=args.iterations,
+                                   time_limit=args.time_limit, developer_mode=True)
 
 print(f'\nMCTS chose column: {col}')
-print(f'Stats: {stats}')
+if VERBOSE:
+    print(f'Stats: {stats}')